@@ -0,0 +1,27 @@
+"""add partial schedule_time index for the per-minute scheduler poll
+
+Revision ID: a4b82f63c9d1
+Revises: e9c64d17a3f2
+Create Date: 2026-08-30 22:25:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4b82f63c9d1'
+down_revision = 'e9c64d17a3f2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_rsc_poll_time', 'report_schedule_configs', ['schedule_time'],
+        postgresql_where=sa.text('enabled = true'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_rsc_poll_time', table_name='report_schedule_configs')
@@ -0,0 +1,53 @@
+"""add composite and tag-search indexes on articles
+
+Revision ID: a91d37c50e64
+Revises: e4f19c6b8ad2
+Create Date: 2026-08-30 19:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a91d37c50e64'
+down_revision = 'e4f19c6b8ad2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLYで作成し、既存テーブルへの書き込みをブロックしない
+    # （CONCURRENTLYはトランザクション外でしか実行できない）
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_articles_source_pubdate',
+            'articles',
+            ['source', 'published_date'],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_articles_createdby_created',
+            'articles',
+            ['created_by', 'created_at'],
+            postgresql_concurrently=True
+        )
+        # tagsはJSON型のため、jsonbへキャストした式に対するGINインデックス。
+        # tags::jsonb @> '["ai"]' のようなタグ検索がインデックススキャンになる
+        op.create_index(
+            'ix_articles_tags_gin',
+            'articles',
+            [sa.text('(tags::jsonb)')],
+            postgresql_using='gin',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_articles_tags_gin', table_name='articles',
+                      postgresql_concurrently=True)
+        op.drop_index('ix_articles_createdby_created', table_name='articles',
+                      postgresql_concurrently=True)
+        op.drop_index('ix_articles_source_pubdate', table_name='articles',
+                      postgresql_concurrently=True)
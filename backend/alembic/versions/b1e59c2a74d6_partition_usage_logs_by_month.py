@@ -0,0 +1,96 @@
+"""partition usage_logs by month on usage_date
+
+Revision ID: b1e59c2a74d6
+Revises: a4b82f63c9d1
+Create Date: 2026-08-30 23:00:00.000000
+
+"""
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b1e59c2a74d6'
+down_revision = 'a4b82f63c9d1'
+branch_labels = None
+depends_on = None
+
+# 事前作成する月次パーティションの範囲。範囲外の行はDEFAULT
+# パーティションが受けるため、運用でのcron追加は必須ではない
+_PARTITION_START = date(2024, 1, 1)
+_PARTITION_MONTHS = 48
+
+
+def _month_bounds():
+    year, month = _PARTITION_START.year, _PARTITION_START.month
+    for _ in range(_PARTITION_MONTHS):
+        next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        yield (year, month, next_year, next_month)
+        year, month = next_year, next_month
+
+
+def upgrade() -> None:
+    # 既存テーブルはパーティション化テーブルへALTERできないため作り直す
+    op.execute(sa.text("ALTER TABLE usage_logs RENAME TO usage_logs_old"))
+    op.execute(sa.text(
+        "ALTER INDEX IF EXISTS ix_usage_logs_user_id_usage_date "
+        "RENAME TO ix_usage_logs_user_id_usage_date_old"
+    ))
+
+    # パーティションキーはPKに含める必要があるためPKは(id, usage_date)
+    op.execute(sa.text("""
+        CREATE TABLE usage_logs (
+            id uuid NOT NULL,
+            user_id uuid NOT NULL REFERENCES users(id),
+            action_type varchar(50) NOT NULL,
+            usage_date date NOT NULL,
+            resource_used varchar(100),
+            additional_data text,
+            created_at timestamptz DEFAULT now(),
+            PRIMARY KEY (id, usage_date)
+        ) PARTITION BY RANGE (usage_date)
+    """))
+
+    for year, month, next_year, next_month in _month_bounds():
+        op.execute(sa.text(
+            f"CREATE TABLE usage_logs_y{year}m{month:02d} "
+            f"PARTITION OF usage_logs "
+            f"FOR VALUES FROM ('{year}-{month:02d}-01') "
+            f"TO ('{next_year}-{next_month:02d}-01')"
+        ))
+    op.execute(sa.text(
+        "CREATE TABLE usage_logs_default PARTITION OF usage_logs DEFAULT"
+    ))
+
+    # 親に張ったインデックスは全パーティションへ伝播する
+    op.create_index(
+        'ix_usage_logs_user_id_usage_date', 'usage_logs',
+        ['user_id', 'usage_date'],
+    )
+
+    op.execute(sa.text("INSERT INTO usage_logs SELECT * FROM usage_logs_old"))
+    op.execute(sa.text("DROP TABLE usage_logs_old"))
+
+
+def downgrade() -> None:
+    op.execute(sa.text("ALTER TABLE usage_logs RENAME TO usage_logs_partitioned"))
+    op.execute(sa.text("""
+        CREATE TABLE usage_logs (
+            id uuid PRIMARY KEY,
+            user_id uuid NOT NULL REFERENCES users(id),
+            action_type varchar(50) NOT NULL,
+            usage_date date NOT NULL,
+            resource_used varchar(100),
+            additional_data text,
+            created_at timestamptz DEFAULT now()
+        )
+    """))
+    op.execute(sa.text("INSERT INTO usage_logs SELECT * FROM usage_logs_partitioned"))
+    # インデックス名の衝突を避けるため、旧テーブルを落としてから張り直す
+    op.execute(sa.text("DROP TABLE usage_logs_partitioned"))
+    op.create_index(
+        'ix_usage_logs_user_id_usage_date', 'usage_logs',
+        ['user_id', 'usage_date'],
+    )
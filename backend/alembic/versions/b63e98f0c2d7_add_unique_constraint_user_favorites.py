@@ -0,0 +1,44 @@
+"""add unique constraint on user_favorites (user_id, article_id)
+
+Revision ID: b63e98f0c2d7
+Revises: f8b52a7d913c
+Create Date: 2026-08-30 20:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b63e98f0c2d7'
+down_revision = 'f8b52a7d913c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 既に重複している行があると制約を張れないため、最新の1行だけ残して
+    # 消す。created_atが同値やNULLでも確実に1行に絞れるよう、idを
+    # タイブレークにしたrow_numberで選ぶ
+    op.execute(sa.text("""
+        DELETE FROM user_favorites
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id,
+                       row_number() OVER (
+                           PARTITION BY user_id, article_id
+                           ORDER BY created_at DESC NULLS LAST, id DESC
+                       ) AS rn
+                FROM user_favorites
+            ) AS sub
+            WHERE sub.rn > 1
+        )
+    """))
+
+    op.create_unique_constraint(
+        'uq_user_favorite', 'user_favorites', ['user_id', 'article_id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_user_favorite', 'user_favorites', type_='unique')
@@ -0,0 +1,32 @@
+"""add partial index for scheduler due-poll on report_schedule_configs
+
+Revision ID: c2a7e4f61b08
+Revises: b63e98f0c2d7
+Create Date: 2026-08-30 21:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c2a7e4f61b08'
+down_revision = 'b63e98f0c2d7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # ポーリングクエリ（enabled AND next_scheduled_at <= now()）を
+    # 有効行だけの部分インデックスで返す
+    op.create_index(
+        'ix_rsc_due', 'report_schedule_configs', ['next_scheduled_at'],
+        postgresql_where=sa.text('enabled = true'),
+    )
+    # enabled単独のインデックスは上記で不要になる
+    op.drop_index('ix_report_schedule_configs_enabled', table_name='report_schedule_configs')
+
+
+def downgrade() -> None:
+    op.create_index('ix_report_schedule_configs_enabled', 'report_schedule_configs', ['enabled'])
+    op.drop_index('ix_rsc_due', table_name='report_schedule_configs')
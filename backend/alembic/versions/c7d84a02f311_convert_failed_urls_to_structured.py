@@ -0,0 +1,91 @@
+"""convert scraping_jobs.failed_urls entries to structured objects
+
+Revision ID: c7d84a02f311
+Revises: 1e211ab68509
+Create Date: 2026-08-30 16:10:00.000000
+
+"""
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7d84a02f311'
+down_revision = '1e211ab68509'
+branch_labels = None
+depends_on = None
+
+
+def _load(value):
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except (ValueError, TypeError):
+            return None
+    return value
+
+
+def upgrade() -> None:
+    # 「url: エラー」連結文字列で保存されていたfailed_urlsを
+    # {"url": ..., "error": ...} のオブジェクト配列に変換する
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.text("SELECT id, failed_urls FROM scraping_jobs WHERE failed_urls IS NOT NULL")
+    ).fetchall()
+
+    for job_id, raw in rows:
+        entries = _load(raw)
+        if not entries:
+            continue
+
+        changed = False
+        converted = []
+        for entry in entries:
+            if isinstance(entry, dict):
+                converted.append(entry)
+            elif isinstance(entry, str) and ": " in entry:
+                # 旧形式は f"{url}: {error}" 連結。URL自体が「https:」等の
+                # コロンを含むため、「": "」区切りで分割する
+                url, error = entry.split(": ", 1)
+                converted.append({"url": url.strip(), "error": error.strip()})
+                changed = True
+            else:
+                # 区切りが見当たらない文字列は全体をURLとして扱う
+                converted.append({"url": str(entry), "error": "Unknown error"})
+                changed = True
+
+        if changed:
+            conn.execute(
+                sa.text("UPDATE scraping_jobs SET failed_urls = :failed WHERE id = :id"),
+                {"failed": json.dumps(converted, ensure_ascii=False), "id": job_id}
+            )
+
+
+def downgrade() -> None:
+    # オブジェクト配列を旧形式の連結文字列に戻す
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.text("SELECT id, failed_urls FROM scraping_jobs WHERE failed_urls IS NOT NULL")
+    ).fetchall()
+
+    for job_id, raw in rows:
+        entries = _load(raw)
+        if not entries:
+            continue
+
+        changed = False
+        converted = []
+        for entry in entries:
+            if isinstance(entry, dict):
+                converted.append(f"{entry.get('url', '')}: {entry.get('error', 'Unknown error')}")
+                changed = True
+            else:
+                converted.append(entry)
+
+        if changed:
+            conn.execute(
+                sa.text("UPDATE scraping_jobs SET failed_urls = :failed WHERE id = :id"),
+                {"failed": json.dumps(converted, ensure_ascii=False), "id": job_id}
+            )
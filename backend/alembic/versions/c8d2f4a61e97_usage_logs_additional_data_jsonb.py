@@ -0,0 +1,35 @@
+"""convert usage_logs.additional_data from text to jsonb
+
+Revision ID: c8d2f4a61e97
+Revises: b1e59c2a74d6
+Create Date: 2026-08-30 23:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8d2f4a61e97'
+down_revision = 'b1e59c2a74d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'usage_logs', 'additional_data',
+        type_=postgresql.JSONB(),
+        existing_type=sa.Text(),
+        postgresql_using='additional_data::jsonb',
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'usage_logs', 'additional_data',
+        type_=sa.Text(),
+        existing_type=postgresql.JSONB(),
+        postgresql_using='additional_data::text',
+    )
@@ -0,0 +1,78 @@
+"""compute report_schedule_configs.next_scheduled_at with a DB trigger
+
+Revision ID: d5a7c93e18f4
+Revises: c8d2f4a61e97
+Create Date: 2026-08-30 23:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5a7c93e18f4'
+down_revision = 'c8d2f4a61e97'
+branch_labels = None
+depends_on = None
+
+# Pythonの_calculate_next_executionと同じ規則（UTC基準）:
+#   daily   -> 実行日の翌日の schedule_time
+#   weekly  -> 実行時刻の7日後の日付の schedule_time
+#   monthly -> 翌月の day_of_month（月末超過は月末に丸め）の schedule_time
+# day_of_monthはtext/smallintどちらの型でも動くようtext経由でパースする
+_FUNCTION = """
+CREATE OR REPLACE FUNCTION rsc_compute_next() RETURNS trigger AS $$
+DECLARE
+    base_date date;
+    dom int;
+    next_month_start date;
+    max_day int;
+BEGIN
+    base_date := (COALESCE(NEW.last_executed_at, now()) AT TIME ZONE 'UTC')::date;
+
+    IF NEW.schedule_type = 'daily' THEN
+        NEW.next_scheduled_at :=
+            ((base_date + 1) + NEW.schedule_time) AT TIME ZONE 'UTC';
+    ELSIF NEW.schedule_type = 'weekly' THEN
+        NEW.next_scheduled_at :=
+            ((base_date + 7) + NEW.schedule_time) AT TIME ZONE 'UTC';
+    ELSIF NEW.schedule_type = 'monthly' THEN
+        dom := COALESCE(NULLIF(btrim(NEW.day_of_month::text), '')::int, 1);
+        next_month_start :=
+            (date_trunc('month', base_date::timestamp) + interval '1 month')::date;
+        max_day := extract(day from
+            (next_month_start + interval '1 month' - interval '1 day'))::int;
+        IF dom > max_day THEN
+            dom := max_day;
+        END IF;
+        NEW.next_scheduled_at :=
+            ((next_month_start + (dom - 1)) + NEW.schedule_time) AT TIME ZONE 'UTC';
+    ELSE
+        NEW.next_scheduled_at := NULL;
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+_TRIGGER = """
+CREATE TRIGGER trg_rsc_compute_next
+BEFORE INSERT OR UPDATE OF
+    last_executed_at, schedule_type, schedule_time, weekday, day_of_month
+ON report_schedule_configs
+FOR EACH ROW
+EXECUTE FUNCTION rsc_compute_next()
+"""
+
+
+def upgrade() -> None:
+    op.execute(sa.text(_FUNCTION))
+    op.execute(sa.text(_TRIGGER))
+
+
+def downgrade() -> None:
+    op.execute(sa.text(
+        "DROP TRIGGER IF EXISTS trg_rsc_compute_next ON report_schedule_configs"
+    ))
+    op.execute(sa.text("DROP FUNCTION IF EXISTS rsc_compute_next()"))
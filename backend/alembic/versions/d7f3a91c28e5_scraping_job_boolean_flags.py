@@ -0,0 +1,42 @@
+"""convert scraping_jobs flag columns from varchar to boolean
+
+Revision ID: d7f3a91c28e5
+Revises: c2a7e4f61b08
+Create Date: 2026-08-30 21:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7f3a91c28e5'
+down_revision = 'c2a7e4f61b08'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # "true"/"false" 文字列をネイティブbooleanへ変換する。
+    # NULLはこれまでの既定値と同じくtrue扱いにする
+    for column in ('auto_generate_tags', 'skip_duplicates'):
+        op.alter_column(
+            'scraping_jobs', column,
+            type_=sa.Boolean(),
+            existing_type=sa.String(5),
+            nullable=False,
+            postgresql_using=f"coalesce({column} = 'true', true)",
+        )
+
+
+def downgrade() -> None:
+    for column in ('auto_generate_tags', 'skip_duplicates'):
+        op.alter_column(
+            'scraping_jobs', column,
+            type_=sa.String(5),
+            existing_type=sa.Boolean(),
+            nullable=True,
+            postgresql_using=(
+                f"case when {column} then 'true' else 'false' end"
+            ),
+        )
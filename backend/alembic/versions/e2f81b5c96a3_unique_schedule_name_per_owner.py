@@ -0,0 +1,44 @@
+"""add unique constraint on report_schedule_configs (created_by, name)
+
+Revision ID: e2f81b5c96a3
+Revises: d5a7c93e18f4
+Create Date: 2026-08-31 00:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2f81b5c96a3'
+down_revision = 'd5a7c93e18f4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 既に重複している名前があると制約を張れないため、新しい方に
+    # 連番サフィックスを付けて退避する（削除はしない）
+    op.execute(sa.text("""
+        UPDATE report_schedule_configs AS a
+        SET name = a.name || ' (' || sub.rn || ')'
+        FROM (
+            SELECT id,
+                   row_number() OVER (
+                       PARTITION BY created_by, name ORDER BY created_at
+                   ) AS rn
+            FROM report_schedule_configs
+        ) AS sub
+        WHERE a.id = sub.id AND sub.rn > 1
+    """))
+
+    op.create_unique_constraint(
+        'uq_rsc_owner_name', 'report_schedule_configs', ['created_by', 'name']
+    )
+    # name単独のインデックスは複合ユニークが兼ねる
+    op.drop_index('ix_report_schedule_configs_name', table_name='report_schedule_configs')
+
+
+def downgrade() -> None:
+    op.create_index('ix_report_schedule_configs_name', 'report_schedule_configs', ['name'])
+    op.drop_constraint('uq_rsc_owner_name', 'report_schedule_configs', type_='unique')
@@ -0,0 +1,29 @@
+"""add composite index on usage_logs (user_id, usage_date)
+
+Revision ID: e4f19c6b8ad2
+Revises: c7d84a02f311
+Create Date: 2026-08-30 18:20:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4f19c6b8ad2'
+down_revision = 'c7d84a02f311'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 使用状況の照会は常に「ユーザー×期間」で絞り込むため、
+    # 複合インデックスでインデックスオンリースキャンを可能にする
+    op.create_index(
+        'ix_usage_logs_user_id_usage_date',
+        'usage_logs',
+        ['user_id', 'usage_date']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_usage_logs_user_id_usage_date', table_name='usage_logs')
@@ -0,0 +1,81 @@
+"""convert remaining varchar(36) id columns to native uuid
+
+Revision ID: e9c64d17a3f2
+Revises: d7f3a91c28e5
+Create Date: 2026-08-30 22:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'e9c64d17a3f2'
+down_revision = 'd7f3a91c28e5'
+branch_labels = None
+depends_on = None
+
+# users.id を参照している外部キー（制約はPostgreSQLの既定命名）
+_USER_FKS = [
+    # (テーブル, カラム, ondelete)
+    ('articles', 'created_by', None),
+    ('user_favorites', 'user_id', 'CASCADE'),
+    ('scraping_jobs', 'user_id', None),
+    ('saved_reports', 'created_by', None),
+    ('report_schedule_configs', 'created_by', None),
+    ('prompt_templates', 'created_by', None),
+    ('usage_logs', 'user_id', None),
+]
+
+# UUIDへ変換する主キー・非FKカラム
+_PLAIN_COLUMNS = [
+    ('users', 'id'),
+    ('scraping_jobs', 'id'),
+    ('saved_reports', 'id'),
+    ('report_schedule_configs', 'id'),
+    ('report_schedule_configs', 'prompt_template_id'),
+    ('prompt_templates', 'id'),
+    ('usage_logs', 'id'),
+]
+
+
+def _alter(table: str, column: str, type_, using: str) -> None:
+    op.alter_column(
+        table, column,
+        type_=type_,
+        postgresql_using=using,
+    )
+
+
+def upgrade() -> None:
+    # 両辺の型が揃うまでFK制約が張り替えられないため、先に全て外す
+    for table, column, _ in _USER_FKS:
+        op.drop_constraint(f'{table}_{column}_fkey', table, type_='foreignkey')
+
+    for table, column in _PLAIN_COLUMNS:
+        _alter(table, column, postgresql.UUID(), f'{column}::uuid')
+    for table, column, _ in _USER_FKS:
+        _alter(table, column, postgresql.UUID(), f'{column}::uuid')
+
+    for table, column, ondelete in _USER_FKS:
+        op.create_foreign_key(
+            f'{table}_{column}_fkey', table, 'users',
+            [column], ['id'], ondelete=ondelete,
+        )
+
+
+def downgrade() -> None:
+    for table, column, _ in _USER_FKS:
+        op.drop_constraint(f'{table}_{column}_fkey', table, type_='foreignkey')
+
+    for table, column in _PLAIN_COLUMNS:
+        _alter(table, column, sa.String(36), f'{column}::text')
+    for table, column, _ in _USER_FKS:
+        _alter(table, column, sa.String(36), f'{column}::text')
+
+    for table, column, ondelete in _USER_FKS:
+        op.create_foreign_key(
+            f'{table}_{column}_fkey', table, 'users',
+            [column], ['id'], ondelete=ondelete,
+        )
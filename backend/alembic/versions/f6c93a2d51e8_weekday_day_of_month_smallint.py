@@ -0,0 +1,43 @@
+"""store weekday and day_of_month as smallint
+
+Revision ID: f6c93a2d51e8
+Revises: e2f81b5c96a3
+Create Date: 2026-08-31 00:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f6c93a2d51e8'
+down_revision = 'e2f81b5c96a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 空文字列が入っている行があってもNULLとして変換できるようにする
+    op.alter_column(
+        'report_schedule_configs', 'weekday',
+        type_=sa.SmallInteger(),
+        postgresql_using="nullif(btrim(weekday), '')::smallint",
+    )
+    op.alter_column(
+        'report_schedule_configs', 'day_of_month',
+        type_=sa.SmallInteger(),
+        postgresql_using="nullif(btrim(day_of_month), '')::smallint",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'report_schedule_configs', 'weekday',
+        type_=sa.String(),
+        postgresql_using='weekday::text',
+    )
+    op.alter_column(
+        'report_schedule_configs', 'day_of_month',
+        type_=sa.String(),
+        postgresql_using='day_of_month::text',
+    )
@@ -0,0 +1,77 @@
+"""convert article and favorite ids to native uuid columns
+
+Revision ID: f8b52a7d913c
+Revises: a91d37c50e64
+Create Date: 2026-08-30 20:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'f8b52a7d913c'
+down_revision = 'a91d37c50e64'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 36バイトの文字列UUIDを16バイトのネイティブuuid型へ変換する。
+    # 型変更の前にarticles.idを参照するFKを一旦外す必要がある
+    op.drop_constraint(
+        'user_favorites_article_id_fkey', 'user_favorites', type_='foreignkey'
+    )
+
+    op.alter_column(
+        'articles', 'id',
+        type_=postgresql.UUID(),
+        postgresql_using='id::uuid'
+    )
+    op.alter_column(
+        'user_favorites', 'id',
+        type_=postgresql.UUID(),
+        postgresql_using='id::uuid'
+    )
+    op.alter_column(
+        'user_favorites', 'article_id',
+        type_=postgresql.UUID(),
+        postgresql_using='article_id::uuid'
+    )
+
+    op.create_foreign_key(
+        'user_favorites_article_id_fkey',
+        'user_favorites', 'articles',
+        ['article_id'], ['id'],
+        ondelete='CASCADE'
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        'user_favorites_article_id_fkey', 'user_favorites', type_='foreignkey'
+    )
+
+    op.alter_column(
+        'user_favorites', 'article_id',
+        type_=sa.String(36),
+        postgresql_using='article_id::text'
+    )
+    op.alter_column(
+        'user_favorites', 'id',
+        type_=sa.String(36),
+        postgresql_using='id::text'
+    )
+    op.alter_column(
+        'articles', 'id',
+        type_=sa.String(36),
+        postgresql_using='id::text'
+    )
+
+    op.create_foreign_key(
+        'user_favorites_article_id_fkey',
+        'user_favorites', 'articles',
+        ['article_id'], ['id'],
+        ondelete='CASCADE'
+    )
@@ -11,10 +11,12 @@ import re
 import urllib.parse
 from datetime import datetime
 from app.db.database import get_db
+from app.utils.time import compact_ts
 from app.core.deps import get_current_user, get_current_admin_user
 from app.models.user import User
 from app.services.article_service import ArticleService
 from app.schemas.article import (
+    ARTICLE_LIST_ADAPTER,
     ArticleCreate, ArticleUpdate, ArticleResponse, ArticleListResponse,
     ArticleSearchRequest, FavoriteToggleRequest, FavoriteResponse
 )
@@ -53,7 +55,7 @@ async def list_articles(
     articles, total = ArticleService.get_articles(db, search_params, current_user)
     
     # お気に入り状態を追加
-    article_responses = []
+    article_dicts = []
     for article in articles:
         is_fav = ArticleService.is_favorite(db, article.id, current_user.id)
         article_dict = {
@@ -71,8 +73,11 @@ async def list_articles(
             "updated_at": article.updated_at,
             "is_favorite": is_fav
         }
-        article_responses.append(ArticleResponse(**article_dict))
-    
+        article_dicts.append(article_dict)
+
+    # ページ全体を1回のバッチ検証に通す（1件ずつの__init__より速い）
+    article_responses = ARTICLE_LIST_ADAPTER.validate_python(article_dicts)
+
     return ArticleListResponse(
         articles=article_responses,
         total=total,
@@ -404,7 +409,7 @@ async def export_multiple_articles_as_markdown(
             content=zip_content,
             media_type="application/zip",
             headers={
-                "Content-Disposition": f"attachment; filename=articles_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+                "Content-Disposition": f"attachment; filename=articles_{compact_ts()}.zip"
             }
         )
         
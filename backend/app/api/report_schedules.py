@@ -2,6 +2,7 @@ from typing import List, Optional
 from datetime import datetime, time
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
 from pydantic import BaseModel, EmailStr, Field
 import logging
 
@@ -21,8 +22,8 @@ class ReportScheduleCreate(BaseModel):
     description: Optional[str] = Field(None, max_length=500, description="説明")
     schedule_type: str = Field(..., description="スケジュールタイプ: daily, weekly, monthly")
     schedule_time: str = Field(..., description="実行時刻 (HH:MM形式)")
-    weekday: Optional[str] = Field(None, description="週次用: 曜日 (0=月曜, 6=日曜)")
-    day_of_month: Optional[str] = Field(None, description="月次用: 日付 (1-31)")
+    weekday: Optional[int] = Field(None, ge=0, le=6, description="週次用: 曜日 (0=月曜, 6=日曜)")
+    day_of_month: Optional[int] = Field(None, ge=1, le=31, description="月次用: 日付 (1-31)")
     
     # レポート設定
     report_type: str = Field(..., description="レポートタイプ: summary, tag_analysis, source_analysis, trend_analysis")
@@ -30,15 +31,15 @@ class ReportScheduleCreate(BaseModel):
     
     # フィルター設定
     date_range_days: Optional[str] = Field(None, description="日付範囲の日数")
-    tags_filter: Optional[List[str]] = Field(default=[], description="タグフィルター")
-    sources_filter: Optional[List[str]] = Field(default=[], description="ソースフィルター")
+    tags_filter: Optional[List[str]] = Field(default_factory=list, description="タグフィルター")
+    sources_filter: Optional[List[str]] = Field(default_factory=list, description="ソースフィルター")
     
     # プロンプトテンプレート
     prompt_template_id: Optional[str] = Field(None, description="カスタムプロンプトテンプレートID")
     
     # メール設定
     email_enabled: bool = Field(default=False, description="メール送信有効/無効")
-    email_recipients: Optional[List[EmailStr]] = Field(default=[], description="送信先メールアドレス")
+    email_recipients: Optional[List[EmailStr]] = Field(default_factory=list, description="送信先メールアドレス")
     email_subject_template: Optional[str] = Field(None, max_length=200, description="メール件名テンプレート")
     
     # 有効/無効
@@ -49,8 +50,8 @@ class ReportScheduleUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     description: Optional[str] = Field(None, max_length=500)
     schedule_time: Optional[str] = Field(None, description="実行時刻 (HH:MM形式)")
-    weekday: Optional[str] = Field(None, description="週次用: 曜日")
-    day_of_month: Optional[str] = Field(None, description="月次用: 日付")
+    weekday: Optional[int] = Field(None, ge=0, le=6, description="週次用: 曜日")
+    day_of_month: Optional[int] = Field(None, ge=1, le=31, description="月次用: 日付")
     
     report_title_template: Optional[str] = Field(None, min_length=1, max_length=200)
     date_range_days: Optional[str] = Field(None)
@@ -75,8 +76,8 @@ class ReportScheduleResponse(BaseModel):
     schedule_type: str
     schedule_time: str  # HH:MM形式
     schedule_display: str  # 表示用
-    weekday: Optional[str]
-    day_of_month: Optional[str]
+    weekday: Optional[int]
+    day_of_month: Optional[int]
     
     report_type: str
     report_title_template: str
@@ -167,9 +168,13 @@ async def create_report_schedule(
         logger.info(f"Created report schedule {schedule.id} for user {current_user.email}")
         
         return _schedule_to_response(schedule)
-        
+
     except HTTPException:
         raise
+    except IntegrityError:
+        # 事前SELECTの代わりにユニーク制約（uq_rsc_owner_name）で重複を検出する
+        db.rollback()
+        raise HTTPException(status_code=400, detail="同じ名前のスケジュールが既に存在します")
     except Exception as e:
         logger.error(f"Error creating report schedule: {e}")
         raise HTTPException(status_code=500, detail=f"スケジュール作成に失敗しました: {str(e)}")
@@ -462,7 +467,7 @@ def _schedule_to_response(schedule: ReportScheduleConfig) -> ReportScheduleRespo
         description=schedule.description,
         enabled=schedule.enabled,
         schedule_type=schedule.schedule_type,
-        schedule_time=schedule.schedule_time.strftime('%H:%M'),
+        schedule_time=f"{schedule.schedule_time.hour:02d}:{schedule.schedule_time.minute:02d}",
         schedule_display=schedule.schedule_display,
         weekday=schedule.weekday,
         day_of_month=schedule.day_of_month,
@@ -1,6 +1,7 @@
 from typing import List, Optional, Dict, Any
+from uuid import UUID
 from datetime import datetime, timedelta, timezone
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, Body, HTTPException
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
 import csv
@@ -8,16 +9,28 @@ import io
 from fastapi.responses import StreamingResponse, Response
 
 from app.db.database import get_db
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user, get_report_service
 from app.models.user import User
 from app.models.saved_report import SavedReport
 from app.models.article import Article
 from app.models.prompt import PromptTemplate
 from app.services.report_service import ReportService
 from app.services.usage_service import UsageService
+from app.utils.time import utc_now, compact_ts
 from sqlalchemy import or_, and_
 import logging
 
+# ZIP圧縮: python-isal があればSIMD最適化されたdeflateを使用し、
+# なければzlibのCPUコストを避けるため無圧縮(STORED)にフォールバックする
+try:
+    from isal import isal_zipfile as _zipfile
+    _ZIP_COMPRESSION = _zipfile.ZIP_DEFLATED
+    _ZIP_COMPRESSLEVEL = 1
+except ImportError:
+    import zipfile as _zipfile
+    _ZIP_COMPRESSION = _zipfile.ZIP_STORED
+    _ZIP_COMPRESSLEVEL = None
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
@@ -50,7 +63,7 @@ class SavedReportCreate(BaseModel):
     content: str = Field(..., min_length=1)
     report_type: str = Field(..., min_length=1, max_length=50)
     summary: Optional[str] = Field(None, max_length=500)
-    tags: Optional[List[str]] = Field(default=[])
+    tags: Optional[List[str]] = Field(default_factory=list)
     save_as_blog: bool = True
 
 class SavedReportUpdate(BaseModel):
@@ -63,11 +76,11 @@ class SavedReportUpdate(BaseModel):
 async def generate_report(
     request: ReportRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    report_service: ReportService = Depends(get_report_service)
 ):
     """レポートを生成"""
     try:
-        report_service = ReportService(db)
         report_data = await report_service.generate_report(
             report_type=request.report_type,
             start_date=request.start_date,
@@ -79,7 +92,7 @@ async def generate_report(
         
         return ReportResponse(
             report_type=request.report_type,
-            generated_at=datetime.utcnow(),
+            generated_at=utc_now(),
             data=report_data["data"],
             summary=report_data["summary"]
         )
@@ -95,11 +108,11 @@ async def export_articles_csv(
     start_date: Optional[str] = Query(None),
     end_date: Optional[str] = Query(None),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    report_service: ReportService = Depends(get_report_service)
 ):
     """記事データをCSVでエクスポート"""
     try:
-        report_service = ReportService(db)
         csv_data = await report_service.export_articles_csv(
             query=query,
             tags=tags,
@@ -117,7 +130,7 @@ async def export_articles_csv(
             io.BytesIO(output.getvalue().encode('utf-8-sig')),  # BOM付きUTF-8
             media_type="text/csv",
             headers={
-                "Content-Disposition": f"attachment; filename=articles_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+                "Content-Disposition": f"attachment; filename=articles_export_{compact_ts()}.csv"
             }
         )
         
@@ -130,11 +143,11 @@ async def export_articles_csv(
 async def get_analytics_overview(
     days: int = Query(30, ge=7, le=365, description="分析期間（日数）"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    report_service: ReportService = Depends(get_report_service)
 ):
     """記事分析の概要を取得"""
     try:
-        report_service = ReportService(db)
         analytics = await report_service.get_analytics_overview(days=days, user=current_user)
         return analytics
         
@@ -146,11 +159,11 @@ async def get_tag_trends(
     days: int = Query(30, ge=7, le=365),
     limit: int = Query(20, ge=5, le=50),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    report_service: ReportService = Depends(get_report_service)
 ):
     """タグのトレンド分析"""
     try:
-        report_service = ReportService(db)
         trends = await report_service.get_tag_trends(days=days, limit=limit, user=current_user)
         return trends
         
@@ -162,11 +175,11 @@ async def get_source_trends(
     days: int = Query(30, ge=7, le=365),
     limit: int = Query(20, ge=5, le=50),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    report_service: ReportService = Depends(get_report_service)
 ):
     """ソースのトレンド分析"""
     try:
-        report_service = ReportService(db)
         trends = await report_service.get_source_trends(days=days, limit=limit, user=current_user)
         return trends
         
@@ -187,12 +200,10 @@ class GenerateAndSaveRequest(BaseModel):
 async def generate_and_save_report(
     request: GenerateAndSaveRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    report_service: ReportService = Depends(get_report_service)
 ):
     """レポートを生成してブログ記事として保存"""
-    import logging
-    logger = logging.getLogger(__name__)
-    
     logger.info(f"Starting generate-and-save for user {current_user.email} (ID: {current_user.id})")
     logger.info(f"Request data: report_type={request.report_type}, title={request.title}, template_id={request.prompt_template_id}")
     logger.info(f"Current user ID type: {type(current_user.id)}")
@@ -206,8 +217,6 @@ async def generate_and_save_report(
         )
     
     try:
-        report_service = ReportService(db)
-        
         # レポート生成
         report_data = await report_service.generate_report(
             report_type=request.report_type,
@@ -282,12 +291,11 @@ async def generate_and_save_report(
 async def save_report(
     request: SavedReportCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    report_service: ReportService = Depends(get_report_service)
 ):
     """レポートを保存"""
     try:
-        report_service = ReportService(db)
-        
         saved_report = await report_service.save_report(
             title=request.title,
             content=request.content,
@@ -317,11 +325,11 @@ async def get_saved_reports(
     limit: Optional[int] = Query(None, ge=1),
     offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    report_service: ReportService = Depends(get_report_service)
 ):
     """保存されたレポート一覧を取得"""
     try:
-        report_service = ReportService(db)
         reports = report_service.get_saved_reports(user=current_user, limit=limit, offset=offset)
         
         return [
@@ -345,11 +353,11 @@ async def get_saved_reports(
 async def get_saved_report(
     report_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    report_service: ReportService = Depends(get_report_service)
 ):
     """特定の保存されたレポートを取得"""
     try:
-        report_service = ReportService(db)
         report = report_service.get_saved_report(report_id, user=current_user)
         
         if not report:
@@ -376,11 +384,11 @@ async def update_saved_report(
     report_id: str,
     update_data: SavedReportUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    report_service: ReportService = Depends(get_report_service)
 ):
     """保存されたレポートを更新"""
     try:
-        report_service = ReportService(db)
         updates = update_data.model_dump(exclude_unset=True)
         
         report = report_service.update_saved_report(report_id, updates, user=current_user)
@@ -408,11 +416,11 @@ async def update_saved_report(
 async def delete_saved_report(
     report_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    report_service: ReportService = Depends(get_report_service)
 ):
     """保存されたレポートを削除"""
     try:
-        report_service = ReportService(db)
         success = report_service.delete_saved_report(report_id, user=current_user)
         
         if not success:
@@ -429,16 +437,13 @@ async def delete_saved_report(
 async def export_report_as_markdown(
     report_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    report_service: ReportService = Depends(get_report_service)
 ):
     """保存されたレポートをMarkdown形式でエクスポート"""
-    import logging
-    logger = logging.getLogger(__name__)
-    
     try:
         logger.info(f"Starting export for report_id: {report_id}, user: {current_user.email}")
         
-        report_service = ReportService(db)
         report = report_service.get_saved_report(report_id, user=current_user)
         
         if not report:
@@ -473,13 +478,23 @@ async def export_report_as_markdown(
 """
         
         logger.info(f"Markdown content length: {len(markdown_content)}")
-        
-        return Response(
-            content=markdown_content.encode('utf-8'),
+
+        # 一度だけUTF-8にエンコードし、64KBチャンクでストリーミング
+        # Content-Lengthを明示することでクライアント側の進捗表示が可能になる
+        markdown_bytes = markdown_content.encode('utf-8')
+
+        async def content_generator():
+            chunk_size = 64 * 1024
+            for i in range(0, len(markdown_bytes), chunk_size):
+                yield markdown_bytes[i:i + chunk_size]
+
+        return StreamingResponse(
+            content_generator(),
             media_type="text/markdown",
             headers={
                 "Content-Disposition": f"attachment; filename*=UTF-8''{encoded_filename}",
-                "Content-Type": "text/markdown; charset=utf-8"
+                "Content-Type": "text/markdown; charset=utf-8",
+                "Content-Length": str(len(markdown_bytes))
             }
         )
         
@@ -491,34 +506,38 @@ async def export_report_as_markdown(
 
 @router.post("/export/markdown/bulk")
 async def export_multiple_reports_as_markdown(
-    report_ids: List[str],
+    report_ids: List[UUID] = Body(..., min_length=1, max_length=200),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    report_service: ReportService = Depends(get_report_service)
 ):
     """複数の保存されたレポートをZIP形式でエクスポート"""
     try:
-        import zipfile
-        import tempfile
-        import os
-        
-        report_service = ReportService(db)
-        
-        # 一時ファイルを作成
-        temp_dir = tempfile.mkdtemp()
-        zip_path = os.path.join(temp_dir, "reports.zip")
-        
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            for report_id in report_ids:
-                report = report_service.get_saved_report(report_id, user=current_user)
-                
-                if report:
-                    # ファイル名を生成
-                    import re
-                    safe_title = re.sub(r'[^\w\-_\.]', '_', report.title or "report")
-                    filename = f"{safe_title}_{report.created_at.strftime('%Y%m%d_%H%M%S')}.md"
-                    
-                    # Markdownコンテンツを準備
-                    markdown_content = f"""# {report.title}
+        import asyncio
+
+        def build_zip() -> bytes:
+            """DBからのレポート取得とZIP圧縮（CPUブロッキング処理）"""
+            import tempfile
+            import os
+            import re
+
+            # 一時ファイルを作成
+            temp_dir = tempfile.mkdtemp()
+            zip_path = os.path.join(temp_dir, "reports.zip")
+
+            try:
+                with _zipfile.ZipFile(zip_path, 'w', _ZIP_COMPRESSION,
+                                      compresslevel=_ZIP_COMPRESSLEVEL) as zip_file:
+                    for report_id in report_ids:
+                        report = report_service.get_saved_report(str(report_id), user=current_user)
+
+                        if report:
+                            # ファイル名を生成
+                            safe_title = re.sub(r'[^\w\-_\.]', '_', report.title or "report")
+                            filename = f"{safe_title}_{report.created_at.strftime('%Y%m%d_%H%M%S')}.md"
+
+                            # Markdownコンテンツを準備
+                            markdown_content = f"""# {report.title}
 
 **生成日時**: {report.created_at.strftime('%Y年%m月%d日 %H:%M:%S')}  
 **レポートタイプ**: {report.report_type}  
@@ -532,23 +551,28 @@ async def export_multiple_reports_as_markdown(
 
 *このレポートはNews Check Appで生成されました*
 """
-                    
-                    # ZIPファイルに追加
-                    zip_file.writestr(filename, markdown_content.encode('utf-8'))
-        
-        # ZIPファイルを読み込み
-        with open(zip_path, 'rb') as zip_file:
-            zip_content = zip_file.read()
-        
-        # 一時ファイルをクリーンアップ
-        os.unlink(zip_path)
-        os.rmdir(temp_dir)
-        
+
+                            # ZIPファイルに追加
+                            zip_file.writestr(filename, markdown_content.encode('utf-8'))
+
+                # ZIPファイルを読み込み
+                with open(zip_path, 'rb') as zip_file:
+                    return zip_file.read()
+            finally:
+                # 一時ファイルをクリーンアップ
+                if os.path.exists(zip_path):
+                    os.unlink(zip_path)
+                os.rmdir(temp_dir)
+
+        # DBフェッチ＋deflate圧縮はイベントループをブロックするため
+        # ワーカースレッドにオフロードする
+        zip_content = await asyncio.to_thread(build_zip)
+
         return Response(
             content=zip_content,
             media_type="application/zip",
             headers={
-                "Content-Disposition": f"attachment; filename=reports_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+                "Content-Disposition": f"attachment; filename=reports_{compact_ts()}.zip"
             }
         )
         
@@ -573,7 +597,8 @@ class TechnicalReportResponse(BaseModel):
 async def generate_technical_summary(
     request: TechnicalReportRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    report_service: ReportService = Depends(get_report_service)
 ):
     """特定のキーワードの技術まとめレポートを生成"""
     # 使用制限をチェック
@@ -585,8 +610,6 @@ async def generate_technical_summary(
         )
     
     try:
-        report_service = ReportService(db)
-        
         # 日付範囲の処理
         date_range = None
         if request.start_date and request.end_date:
@@ -659,7 +682,8 @@ async def generate_technical_summary(
 async def generate_and_save_technical_summary(
     request: TechnicalReportRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    report_service: ReportService = Depends(get_report_service)
 ):
     """技術まとめレポートを生成して保存"""
     # 使用制限をチェック
@@ -671,10 +695,8 @@ async def generate_and_save_technical_summary(
         )
     
     try:
-        report_service = ReportService(db)
-        
         # レポート生成
-        report_response = await generate_technical_summary(request, db, current_user)
+        report_response = await generate_technical_summary(request, db, current_user, report_service)
         
         # レポートを保存
         saved_report = await report_service.save_report(
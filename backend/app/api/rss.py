@@ -1,36 +1,109 @@
-from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, File, UploadFile
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import time, datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 import os
+import json
+import shutil
+import asyncio
+import itertools
 import tempfile
 import logging
+import aiofiles
+from operator import attrgetter
+from pathlib import PurePosixPath
 
 from app.core.deps import get_db, get_current_user
 from app.models.user import User
-from app.services.rss_service import RSSService
+from app.services.rss_service import RSSService, read_rss_feeds_from_file, DEFAULT_RSS_PATH
 from app.services.arxiv_service import ArxivService
-from app.services.scheduler_service import scheduler_service
+from app.services.scheduler_service import scheduler_service, ScheduleConfig
 from app.core.background_tasks import task_manager
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+# 大量のURL・日時を含むレスポンスが多いため、orjsonベースのシリアライズを既定にする
+router = APIRouter(default_response_class=ORJSONResponse)
 
+# 手動RSSスクレイピングの同時実行制御（プロセス全体の上限＋ユーザー単位の直列化）
+_global_scrape_sem = asyncio.Semaphore(int(os.getenv("MAX_CONCURRENT_SCRAPES", "4")))
+_user_scrape_locks: dict = {}
 
-class RSSFeedURL(BaseModel):
+# 手動スクレイピングのタスクID採番用カウンタ
+# エポック秒ベースのIDは同一秒内の連続リクエストで衝突するため、
+# プロセス内で単調増加するカウンタを使う（GILによりnext()はアトミック）
+_task_counter = itertools.count()
+
+# サンプル記事のレスポンス射影
+# 属性アクセスをC実装のattrgetterにまとめ、フィード数×記事数回走る
+# dict構築のバイトコード量を減らす
+_SAMPLE_KEYS = ('title', 'url', 'published_date')
+_sample_proj = attrgetter(*_SAMPLE_KEYS)
+
+
+def _sample_articles(articles, limit: int = 3) -> list:
+    """記事リストの先頭limit件をレスポンス用dictに射影する"""
+    return [dict(zip(_SAMPLE_KEYS, _sample_proj(a))) for a in articles[:limit]]
+
+
+async def _require_rss_file(path: str) -> os.stat_result:
+    """RSSファイルの存在をstat一回で確認し、なければ404を返す
+
+    os.path.exists()はstatの結果を真偽値に落としてしまうため、
+    statをそのまま返してmtime等を後段で再利用できるようにする
+    """
+    try:
+        return await asyncio.to_thread(os.stat, path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"RSS file not found: {path}"
+        )
+
+
+# フィードファイルが存在しない場合に書き出すデフォルト内容
+_DEFAULT_RSS_CONTENT = """# ITニュース RSS フィードリスト
+# このファイルは、定期的にチェックするRSSフィードのURLを記載するサンプルです
+# '#' で始まる行はコメントとして無視されます
+# 空行も無視されます
+
+https://gigazine.net/news/rss_2.0/
+https://www.watch.impress.co.jp/data/rss/1.0/ipw/feed.rdf
+https://rss.itmedia.co.jp/rss/2.0/news_bursts.xml
+https://b.hatena.ne.jp/hotentry/it.rss
+https://news.mit.edu/topic/mitartificial-intelligence2-rss.xml
+https://bair.berkeley.edu/blog/feed.xml
+https://openai.com/blog/rss
+https://blog.tensorflow.org/feeds/posts/default
+https://deepmind.google/blog/rss.xml
+https://huggingface.co/blog/feed.xml
+https://blog.research.google/atom.xml
+https://news.microsoft.com/ja-jp/category/blog/feed
+"""
+
+
+class StrictRequestModel(BaseModel):
+    """リクエストモデル共通設定
+
+    extra='forbid' で未知フィールドを早期拒否し、frozen=True で
+    インスタンスを不変にしてハッシュキャッシュ等の高速パスを有効にする
+    """
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
+
+class RSSFeedURL(StrictRequestModel):
     """RSSフィードURL"""
     url: str = Field(..., description="RSSフィードのURL")
 
 
-class RSSFeedList(BaseModel):
+class RSSFeedList(StrictRequestModel):
     """RSSフィードURLリスト"""
     feeds: List[RSSFeedURL] = Field(..., description="RSSフィードURLのリスト")
 
 
-class ScheduleRequest(BaseModel):
+class ScheduleRequest(StrictRequestModel):
     """スケジュール設定リクエスト"""
     rss_file_path: str = Field(..., description="RSSフィードリストファイルのパス")
     hour: int = Field(..., ge=0, le=23, description="実行時刻（時）")
@@ -42,7 +115,7 @@ class ScheduleRequest(BaseModel):
     arxiv_max_results: int = Field(20, ge=1, le=100, description="arXivから取得する最大論文数")
 
 
-class ScheduleUpdateRequest(BaseModel):
+class ScheduleUpdateRequest(StrictRequestModel):
     """スケジュール更新リクエスト"""
     hour: Optional[int] = Field(None, ge=0, le=23, description="実行時刻（時）")
     minute: Optional[int] = Field(None, ge=0, le=59, description="実行時刻（分）")
@@ -55,7 +128,7 @@ class ScheduleUpdateRequest(BaseModel):
     arxiv_max_results: Optional[int] = Field(None, ge=1, le=100, description="arXivから取得する最大論文数")
 
 
-class ManualRSSScrapingRequest(BaseModel):
+class ManualRSSScrapingRequest(StrictRequestModel):
     """手動RSSスクレイピングリクエスト"""
     rss_file_path: str = Field(..., description="RSSフィードリストファイルのパス")
     auto_generate_tags: bool = Field(True, description="自動タグ生成を有効にするか")
@@ -66,7 +139,7 @@ class ManualRSSScrapingRequest(BaseModel):
     hours_back: int = Field(24, ge=1, le=168, description="遡る時間（時間、最大7日間）")
 
 
-class ArxivSearchRequest(BaseModel):
+class ArxivSearchRequest(StrictRequestModel):
     """arXiv論文検索リクエスト"""
     categories: Optional[List[str]] = Field(None, description="検索カテゴリ（例: ['cs.AI', 'cs.LG']）")
     max_results: int = Field(20, ge=1, le=100, description="最大取得件数")
@@ -85,35 +158,31 @@ async def test_rss_feeds(
         async with RSSService() as rss_service:
             results = await rss_service.fetch_multiple_feeds(feed_urls)
         
-        # 結果をまとめる
+        # 結果をまとめる（成功数も同じループで集計し、二重走査を避ける）
         test_results = []
         total_articles = 0
+        feeds_success = 0
         
         for result in results:
             article_count = len(result.articles)
             total_articles += article_count
+            if not result.error:
+                feeds_success += 1
             
             test_results.append({
                 "feed_url": result.feed_url,
                 "status": "success" if not result.error else "failed",
                 "error": result.error,
                 "articles_count": article_count,
-                "last_updated": result.last_updated.isoformat() if result.last_updated else None,
-                "sample_articles": [
-                    {
-                        "title": article.title,
-                        "url": article.url,
-                        "published_date": article.published_date.isoformat() if article.published_date else None
-                    }
-                    for article in result.articles[:3]  # 最初の3件のみ
-                ]
+                "last_updated": result.last_updated,
+                "sample_articles": _sample_articles(result.articles)
             })
         
         return {
             "message": "RSS feeds tested successfully",
             "feeds_tested": len(feed_urls),
-            "feeds_success": len([r for r in results if not r.error]),
-            "feeds_failed": len([r for r in results if r.error]),
+            "feeds_success": feeds_success,
+            "feeds_failed": len(results) - feeds_success,
             "total_articles_found": total_articles,
             "results": test_results
         }
@@ -126,6 +195,47 @@ async def test_rss_feeds(
         )
 
 
+@router.post("/feeds/test/stream")
+async def test_rss_feeds_stream(
+    rss_feeds: RSSFeedList,
+    current_user: User = Depends(get_current_user)
+):
+    """RSSフィードをテスト取得（NDJSONストリーミング版）
+
+    全フィードの完了を待たず、各フィードの取得が終わり次第
+    1行ずつJSONレコードを送出する。大量フィードのテストでも
+    最初の結果が最速フィードの所要時間で届く
+    """
+    feed_urls = [feed.url for feed in rss_feeds.feeds]
+
+    async def generate():
+        semaphore = asyncio.Semaphore(int(os.getenv("RSS_CONCURRENCY", "16")))
+
+        async with RSSService() as rss_service:
+            async def fetch_one(url: str):
+                async with semaphore:
+                    return await rss_service.fetch_rss_feed(url)
+
+            tasks = [asyncio.create_task(fetch_one(url)) for url in feed_urls]
+            for future in asyncio.as_completed(tasks):
+                result = await future
+                samples = _sample_articles(result.articles)
+                for sample in samples:
+                    if sample["published_date"]:
+                        sample["published_date"] = sample["published_date"].isoformat()
+                record = {
+                    "feed_url": result.feed_url,
+                    "status": "success" if not result.error else "failed",
+                    "error": result.error,
+                    "articles_count": len(result.articles),
+                    "last_updated": result.last_updated.isoformat() if result.last_updated else None,
+                    "sample_articles": samples
+                }
+                yield json.dumps(record, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.post("/arxiv/search")
 async def search_arxiv_papers(
     request: ArxivSearchRequest,
@@ -133,11 +243,13 @@ async def search_arxiv_papers(
 ):
     """arXiv論文を検索"""
     try:
+        # リクエスト内で時刻を一度だけ取得して使い回す
+        now = datetime.now()
         async with ArxivService() as arxiv_service:
             result = await arxiv_service.search_papers(
                 categories=request.categories or ['cs.AI', 'cs.LG', 'cs.CV', 'cs.CL'],
                 max_results=request.max_results,
-                target_date=datetime.now(),
+                target_date=now,
                 days_back=request.days_back
             )
             
@@ -155,7 +267,7 @@ async def search_arxiv_papers(
                 "total_found": result.total_found,
                 "papers_returned": len(result.papers),
                 "search_query": result.search_query,
-                "target_date": result.target_date.isoformat() if result.target_date else None,
+                "target_date": result.target_date,
                 "papers": papers_data
             }
             
@@ -169,7 +281,7 @@ async def search_arxiv_papers(
         )
 
 
-class RSSTestRequest(BaseModel):
+class RSSTestRequest(StrictRequestModel):
     """RSSテストリクエスト"""
     rss_file_path: str = Field(..., description="RSSフィードリストファイルのパス")
     include_arxiv: bool = Field(False, description="arXiv論文を含めるかどうか")
@@ -185,12 +297,10 @@ async def test_rss_feeds_from_file(
 ):
     """ファイルからRSSフィードをテスト取得"""
     try:
-        if not os.path.exists(request.rss_file_path):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"RSS file not found: {request.rss_file_path}"
-            )
-        
+        # リクエスト内で時刻を一度だけ取得して使い回す
+        now = datetime.now()
+        await _require_rss_file(request.rss_file_path)
+
         async with RSSService(hours_back=request.hours_back) as rss_service:
             if request.include_arxiv:
                 article_urls, rss_results, arxiv_papers = await rss_service.get_latest_articles_with_arxiv(
@@ -198,29 +308,32 @@ async def test_rss_feeds_from_file(
                     include_arxiv=True,
                     arxiv_categories=request.arxiv_categories,
                     arxiv_max_results=request.arxiv_max_results,
-                    target_date=datetime.now()
+                    target_date=now
                 )
             else:
                 article_urls, rss_results = await rss_service.get_latest_articles_from_file(request.rss_file_path)
                 arxiv_papers = []
         
-        # RSS結果をまとめる
+        # RSS結果をまとめる（成功数も同じループで集計）
         feed_results = []
+        feeds_success = 0
         for result in rss_results:
+            if not result.error:
+                feeds_success += 1
             feed_results.append({
                 "feed_url": result.feed_url,
                 "status": "success" if not result.error else "failed",
                 "error": result.error,
                 "articles_count": len(result.articles),
-                "last_updated": result.last_updated.isoformat() if result.last_updated else None
+                "last_updated": result.last_updated
             })
         
         response = {
             "message": "RSS feeds from file processed successfully",
             "file_path": request.rss_file_path,
             "feeds_processed": len(rss_results),
-            "feeds_success": len([r for r in rss_results if not r.error]),
-            "feeds_failed": len([r for r in rss_results if r.error]),
+            "feeds_success": feeds_success,
+            "feeds_failed": len(rss_results) - feeds_success,
             "unique_article_urls": len(article_urls),
             "feed_results": feed_results,
             "sample_urls": article_urls  # 全件のURL
@@ -234,7 +347,7 @@ async def test_rss_feeds_from_file(
                 {
                     "title": paper.title,
                     "url": paper.url,
-                    "published_date": paper.published_date.isoformat(),
+                    "published_date": paper.published_date,
                     "categories": paper.categories,
                     "authors": paper.authors[:3]  # 最初の3人の著者のみ
                 }
@@ -255,33 +368,43 @@ async def test_rss_feeds_from_file(
         )
 
 
+def validate_txt_upload(
+    file: UploadFile = File(..., description="RSSフィードURLリストファイル")
+) -> UploadFile:
+    """アップロードファイルの拡張子を本文読み込み前に検証する
+
+    endswith('.txt') では .TXT が弾かれる一方 foo.txt.exe のような
+    多重拡張子を見抜けないため、最終サフィックスを小文字化して比較する。
+    依存として解決されるため、不正な拡張子は本文を読む前に拒否できる
+    """
+    suffix = PurePosixPath(file.filename or '').suffix.lower()
+    if suffix != '.txt':
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only .txt files are supported"
+        )
+    return file
+
+
 @router.post("/upload")
 async def upload_rss_file(
-    file: UploadFile = File(..., description="RSSフィードURLリストファイル"),
+    file: UploadFile = Depends(validate_txt_upload),
     current_user: User = Depends(get_current_user)
 ):
     """RSSフィードリストファイルをアップロード"""
     try:
-        if not file.filename.endswith('.txt'):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Only .txt files are supported"
-            )
-        
         # ユーザー専用ディレクトリを作成
         user_dir = f"/tmp/rss_feeds/{current_user.id}"
-        os.makedirs(user_dir, exist_ok=True)
+        await asyncio.to_thread(os.makedirs, user_dir, exist_ok=True)
         
-        # ファイルを保存
+        # ファイルを保存（全体をメモリに読み込まず64KBずつストリーミング書き込み）
         file_path = os.path.join(user_dir, file.filename)
-        content = await file.read()
-        
-        with open(file_path, 'wb') as f:
-            f.write(content)
+        async with aiofiles.open(file_path, 'wb') as f:
+            while chunk := await file.read(1 << 16):
+                await f.write(chunk)
         
-        # ファイル内容を検証
-        rss_service = RSSService()
-        feed_urls = rss_service.read_rss_feeds_from_file(file_path)
+        # ファイル内容を検証（パースのみなのでサービスの構築は不要）
+        feed_urls = read_rss_feeds_from_file(file_path)
         
         return {
             "message": "RSS file uploaded successfully",
@@ -308,12 +431,8 @@ async def manual_rss_scraping(
 ):
     """手動でRSSスクレイピングを実行"""
     try:
-        if not os.path.exists(request.rss_file_path):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"RSS file not found: {request.rss_file_path}"
-            )
-        
+        await _require_rss_file(request.rss_file_path)
+
         # バックグラウンドタスクとして実行
         task_id = await task_manager.create_task(
             _manual_rss_scraping_task,
@@ -325,7 +444,7 @@ async def manual_rss_scraping(
             request.arxiv_categories,
             request.arxiv_max_results,
             request.hours_back,
-            task_id=f"manual_rss_{current_user.id}_{int(datetime.now().timestamp())}",
+            task_id=f"manual_rss_{current_user.id}_{next(_task_counter):x}",
             total=100,
             message=f"手動RSSスクレイピング開始（{request.hours_back}時間遡り）: {request.rss_file_path}"
         )
@@ -358,9 +477,6 @@ async def _manual_rss_scraping_task(
     progress_callback=None
 ):
     """手動RSSスクレイピングタスク"""
-    from app.services.scheduler_service import ScheduleConfig
-    from datetime import time
-    
     # 一時的なスケジュール設定を作成
     config = ScheduleConfig(
         user_id=user_id,
@@ -374,8 +490,12 @@ async def _manual_rss_scraping_task(
         hours_back=hours_back
     )
     
-    # スケジューラーサービスのタスクを再利用
-    return await scheduler_service._rss_scraping_task(user_id, config, progress_callback)
+    # 同一ユーザーの重複実行を直列化し、全体の同時実行数も制限する
+    user_lock = _user_scrape_locks.setdefault(user_id, asyncio.Lock())
+    async with user_lock:
+        async with _global_scrape_sem:
+            # スケジューラーサービスのタスクを再利用
+            return await scheduler_service._rss_scraping_task(user_id, config, progress_callback)
 
 
 @router.post("/schedule")
@@ -385,12 +505,8 @@ async def create_schedule(
 ):
     """定期実行スケジュールを作成"""
     try:
-        if not os.path.exists(request.rss_file_path):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"RSS file not found: {request.rss_file_path}"
-            )
-        
+        await _require_rss_file(request.rss_file_path)
+
         schedule_time = time(hour=request.hour, minute=request.minute)
         
         success = await scheduler_service.add_schedule(
@@ -589,7 +705,7 @@ async def cancel_running_task(
         )
 
 
-class AutoScheduleRequest(BaseModel):
+class AutoScheduleRequest(StrictRequestModel):
     """自動スケジュール設定リクエスト"""
     hour: int = Field(2, ge=0, le=23, description="実行時刻（時）デフォルト深夜2時")
     minute: int = Field(0, ge=0, le=59, description="実行時刻（分）")
@@ -641,7 +757,7 @@ async def setup_auto_schedule(
         )
 
 
-class RSSFeedFileContent(BaseModel):
+class RSSFeedFileContent(StrictRequestModel):
     """RSSフィードファイルの内容"""
     content: str = Field(..., description="RSSフィードファイルの内容")
     file_path: str = Field(..., description="ファイルパス")
@@ -649,44 +765,43 @@ class RSSFeedFileContent(BaseModel):
 
 @router.get("/feeds/file")
 async def get_rss_feeds_file(
+    request: Request,
     current_user: User = Depends(get_current_user)
 ):
-    """RSSフィードファイルの内容を取得"""
+    """RSSフィードファイルの内容を取得
+
+    mtime/サイズ由来のETagを返し、If-None-Matchが一致する場合は
+    本文の読み込みとシリアライズを省略して304を返す
+    """
     try:
-        file_path = '/Users/tsutsuikana/Desktop/coding_workspace/news_check_app/backend/rss_feeds.txt'
-        
-        if not os.path.exists(file_path):
+        file_path = str(DEFAULT_RSS_PATH)
+
+        try:
+            st = await asyncio.to_thread(os.stat, file_path)
+        except FileNotFoundError:
             # ファイルが存在しない場合はデフォルト内容で作成
-            default_content = """# ITニュース RSS フィードリスト
-# このファイルは、定期的にチェックするRSSフィードのURLを記載するサンプルです
-# '#' で始まる行はコメントとして無視されます
-# 空行も無視されます
+            async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
+                await f.write(_DEFAULT_RSS_CONTENT)
+            st = await asyncio.to_thread(os.stat, file_path)
+
+        etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+        headers = {"ETag": etag, "Cache-Control": "private, must-revalidate"}
+
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-https://gigazine.net/news/rss_2.0/
-https://www.watch.impress.co.jp/data/rss/1.0/ipw/feed.rdf
-https://rss.itmedia.co.jp/rss/2.0/news_bursts.xml
-https://b.hatena.ne.jp/hotentry/it.rss
-https://news.mit.edu/topic/mitartificial-intelligence2-rss.xml
-https://bair.berkeley.edu/blog/feed.xml
-https://openai.com/blog/rss
-https://blog.tensorflow.org/feeds/posts/default
-https://deepmind.google/blog/rss.xml
-https://huggingface.co/blog/feed.xml
-https://blog.research.google/atom.xml
-https://news.microsoft.com/ja-jp/category/blog/feed
-"""
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(default_content)
-        
         # ファイル内容を読み込み
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        return {
-            "content": content,
-            "file_path": file_path,
-            "message": "RSS feeds file loaded successfully"
-        }
+        async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
+            content = await f.read()
+
+        return ORJSONResponse(
+            {
+                "content": content,
+                "file_path": file_path,
+                "message": "RSS feeds file loaded successfully"
+            },
+            headers=headers
+        )
         
     except Exception as e:
         logger.exception(f"Failed to load RSS feeds file for user {current_user.id}")
@@ -714,23 +829,21 @@ async def update_rss_feeds_file(
         
         # バックアップを作成
         backup_path = f"{file_path}.backup"
-        if os.path.exists(file_path):
-            import shutil
-            shutil.copy2(file_path, backup_path)
+        if await asyncio.to_thread(os.path.exists, file_path):
+            await asyncio.to_thread(shutil.copy2, file_path, backup_path)
         
         # ファイル内容を保存
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(request.content)
+        async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
+            await f.write(request.content)
         
         # 内容を検証（有効なURLが含まれているかチェック）
-        rss_service = RSSService()
         try:
-            feed_urls = rss_service.read_rss_feeds_from_file(file_path)
+            feed_urls = read_rss_feeds_from_file(file_path)
             feeds_count = len(feed_urls)
         except Exception as e:
             # 検証に失敗した場合はバックアップから復元
-            if os.path.exists(backup_path):
-                shutil.copy2(backup_path, file_path)
+            if await asyncio.to_thread(os.path.exists, backup_path):
+                await asyncio.to_thread(shutil.copy2, backup_path, file_path)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid RSS feeds file format: {str(e)}"
@@ -1,23 +1,90 @@
-from typing import Set, List
+import asyncio
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.db.database import get_db
 from app.core.deps import get_current_user
 from app.models.user import User
 from app.models.article import Article
-from app.utils.url_parser import URLParser
+from app.utils.url_parser import URLParser, url_key
 from app.utils.web_scraper import WebScraper
-from app.services.scraping_service import ScrapingService
+from app.services.scraping_service import ScrapingService, find_existing_url_keys
 from app.core.background_tasks import task_manager, TaskStatus
 from app.schemas.scraping import (
-    URLParseRequest, URLParseResponse, 
+    URLParseRequest, URLParseResponse,
     ScrapingJobRequest, ScrapingJobResponse,
     URLPreviewRequest, URLPreviewResponse,
+    URLPreviewBatchRequest, URLPreviewBatchResponse,
     ScrapingJobStatus
 )
 
 router = APIRouter()
 
+# /preview用のスクレイプ結果キャッシュ（URL -> (有効期限, ScrapedContent)）
+# ユーザーは同じURLリストを編集しながら何度もプレビューするため、
+# 短いTTLでも再スクレイピングの大半を省ける
+_PREVIEW_CACHE_TTL = 300  # 5分
+_PREVIEW_CACHE_MAX = 1024
+_preview_cache: OrderedDict = OrderedDict()
+
+# URLテキストの解析は純関数なので結果をそのままメモ化できる
+# （DBとの重複チェックはリクエストごとに行うためキャッシュ対象外）
+_parse_urls_cached = lru_cache(maxsize=256)(URLParser.parse_urls_from_text)
+
+
+async def _preview_scrape(url: str):
+    """プレビュー用スクレイプ（TTL付きLRUキャッシュ）
+
+    キャッシュヒット時はネットワークアクセスなしで即返す。
+    エラー結果はキャッシュせず、次回のリトライに任せる
+    """
+    now = time.monotonic()
+    cached = _preview_cache.get(url)
+    if cached is not None and cached[0] > now:
+        _preview_cache.move_to_end(url)
+        return cached[1]
+
+    async with WebScraper(timeout=15) as scraper:  # プレビューは短いタイムアウト
+        content = await scraper.scrape_url(url)
+
+    if not content.error:
+        _preview_cache[url] = (now + _PREVIEW_CACHE_TTL, content)
+        _preview_cache.move_to_end(url)
+        while len(_preview_cache) > _PREVIEW_CACHE_MAX:
+            _preview_cache.popitem(last=False)
+
+    return content
+
+
+def _normalize_failed_urls(entries) -> List[dict]:
+    """failed_urlsのエントリをレスポンス用の{url, error}辞書に揃える
+
+    書き込み時点で辞書として保存されるようになったが、旧形式の
+    「url: エラー」連結文字列が既存行やタスク進捗に残っている間は
+    読み出し側でも変換して後方互換を保つ
+    """
+    normalized = []
+    for entry in entries or []:
+        if isinstance(entry, dict):
+            normalized.append({
+                "url": str(entry.get("url", "")),
+                "error": str(entry.get("error", "Unknown error"))
+            })
+        elif isinstance(entry, str) and ": " in entry:
+            # 旧形式は f"{url}: {error}" 連結。URL自体が「https:」等の
+            # コロンを含むため、「": "」区切りで分割する
+            url, error = entry.split(": ", 1)
+            normalized.append({"url": url.strip(), "error": error.strip()})
+        else:
+            # 区切りが見当たらない文字列は全体をURLとして扱う
+            normalized.append({"url": str(entry), "error": "Unknown error"})
+    return normalized
+
 @router.post("/parse-urls", response_model=URLParseResponse)
 async def parse_urls(
     request: URLParseRequest,
@@ -34,8 +101,8 @@ async def parse_urls(
             detail="URLテキストが空です"
         )
     
-    # URLパース実行
-    parse_result = URLParser.parse_urls_from_text(request.urls_text)
+    # URLパース実行（同一テキストの再解析はキャッシュで省く）
+    parse_result = _parse_urls_cached(request.urls_text)
     
     if not parse_result.valid_urls:
         return URLParseResponse(
@@ -46,13 +113,11 @@ async def parse_urls(
             estimated_time="0秒"
         )
     
-    # 既存記事との重複チェック
-    existing_urls: Set[str] = set(
-        row.url for row in db.query(Article.url).all()
-    )
-    
+    # 既存記事との重複チェック（候補URLだけをINクエリで照合する）
+    existing_keys = find_existing_url_keys(db, parse_result.valid_urls)
+
     new_urls, duplicate_urls = URLParser.check_duplicates_with_existing(
-        parse_result.valid_urls, existing_urls
+        parse_result.valid_urls, existing_keys
     )
     
     # レスポンス作成
@@ -92,31 +157,30 @@ async def preview_url(
     is_duplicate = existing_article is not None
     
     try:
-        # 実際のスクレイピングでプレビュー取得
-        async with WebScraper(timeout=15) as scraper:  # プレビューは短いタイムアウト
-            scraped_content = await scraper.scrape_url(normalized_url)
-            
-            if scraped_content.error:
-                return URLPreviewResponse(
-                    url=normalized_url,
-                    title=None,
-                    description=None,
-                    site_name=None,
-                    is_duplicate=is_duplicate,
-                    estimated_tags=[],
-                    error=scraped_content.error
-                )
-            
+        # 実際のスクレイピングでプレビュー取得（結果は5分間キャッシュ）
+        scraped_content = await _preview_scrape(normalized_url)
+
+        if scraped_content.error:
             return URLPreviewResponse(
                 url=normalized_url,
-                title=scraped_content.title,
-                description=scraped_content.description,
-                site_name=scraped_content.site_name,
+                title=None,
+                description=None,
+                site_name=None,
                 is_duplicate=is_duplicate,
-                estimated_tags=scraped_content.auto_tags,
-                error=None
+                estimated_tags=[],
+                error=scraped_content.error
             )
-            
+
+        return URLPreviewResponse(
+            url=normalized_url,
+            title=scraped_content.title,
+            description=scraped_content.description,
+            site_name=scraped_content.site_name,
+            is_duplicate=is_duplicate,
+            estimated_tags=scraped_content.auto_tags,
+            error=None
+        )
+
     except Exception as e:
         return URLPreviewResponse(
             url=normalized_url,
@@ -128,6 +192,88 @@ async def preview_url(
             error=f"Preview failed: {str(e)}"
         )
 
+@router.post("/preview-batch", response_model=URLPreviewBatchResponse)
+async def preview_urls_batch(
+    request: URLPreviewBatchRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    複数URLのプレビューを並行取得
+    1URLずつ/previewを呼ぶとN往復の直列待ちになるため、
+    単一リクエスト内でgatherにより同時スクレイピングする
+    """
+    # URL正規化（無効なURLは位置を保ったままエラーとして返す）
+    normalized = [URLParser._normalize_url(url) for url in request.urls]
+    valid_urls = [url for url in normalized if url]
+
+    # 重複チェックは1回のINクエリにまとめる
+    existing_keys = find_existing_url_keys(db, valid_urls)
+
+    # 同時スクレイピング数を制限（接続プールの枯渇防止）
+    semaphore = asyncio.Semaphore(10)
+
+    async def scrape_one(scraper: WebScraper, url: str):
+        async with semaphore:
+            return await scraper.scrape_url(url)
+
+    async with WebScraper(timeout=15) as scraper:  # プレビューは短いタイムアウト
+        results = await asyncio.gather(
+            *(scrape_one(scraper, url) for url in valid_urls),
+            return_exceptions=True
+        )
+
+    results_iter = iter(results)
+    previews = []
+    for original, url in zip(request.urls, normalized):
+        if not url:
+            previews.append(URLPreviewResponse(
+                url=original,
+                title=None,
+                description=None,
+                site_name=None,
+                is_duplicate=False,
+                estimated_tags=[],
+                error="Invalid URL format"
+            ))
+            continue
+
+        result = next(results_iter)
+        is_duplicate = url_key(url) in existing_keys
+
+        if isinstance(result, Exception):
+            previews.append(URLPreviewResponse(
+                url=url,
+                title=None,
+                description=None,
+                site_name=None,
+                is_duplicate=is_duplicate,
+                estimated_tags=[],
+                error=f"Preview failed: {str(result)}"
+            ))
+        elif result.error:
+            previews.append(URLPreviewResponse(
+                url=url,
+                title=None,
+                description=None,
+                site_name=None,
+                is_duplicate=is_duplicate,
+                estimated_tags=[],
+                error=result.error
+            ))
+        else:
+            previews.append(URLPreviewResponse(
+                url=url,
+                title=result.title,
+                description=result.description,
+                site_name=result.site_name,
+                is_duplicate=is_duplicate,
+                estimated_tags=result.auto_tags,
+                error=None
+            ))
+
+    return URLPreviewBatchResponse(previews=previews)
+
 @router.post("/start", response_model=ScrapingJobResponse)
 async def start_scraping_job(
     request: ScrapingJobRequest,
@@ -139,24 +285,24 @@ async def start_scraping_job(
     非同期バックグラウンド処理で実行
     """
     try:
+        # URLパースは1回だけ行い、サービスとレスポンスの両方で使い回す
+        # （事前チェックの/parse-urlsと同一テキストならキャッシュヒットする）
+        parse_result = _parse_urls_cached(request.urls_text)
+
         scraping_service = ScrapingService(db)
         job = await scraping_service.create_and_start_scraping_job(
             user=current_user,
             urls_text=request.urls_text,
             auto_generate_tags=request.auto_generate_tags,
-            skip_duplicates=request.skip_duplicates
+            skip_duplicates=request.skip_duplicates,
+            parse_result=parse_result
         )
-        
-        # URLパース結果を取得（レスポンス用）
-        parse_result = URLParser.parse_urls_from_text(request.urls_text)
-        
+
         # 重複チェック
         if request.skip_duplicates:
-            existing_urls: Set[str] = set(
-                row.url for row in db.query(Article.url).all()
-            )
+            existing_keys = find_existing_url_keys(db, parse_result.valid_urls)
             new_urls, duplicate_urls = URLParser.check_duplicates_with_existing(
-                parse_result.valid_urls, existing_urls
+                parse_result.valid_urls, existing_keys
             )
         else:
             new_urls = parse_result.valid_urls
@@ -181,6 +327,28 @@ async def start_scraping_job(
             detail=f"Failed to create scraping job: {str(e)}"
         )
 
+# /jobs/{job_id} より先に登録しないと "stream" がjob_idにマッチしてしまう
+@router.get("/jobs/stream")
+async def stream_user_scraping_jobs(
+    limit: int = 20,
+    offset: int = 0,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    ユーザーのスクレイピングジョブ一覧（NDJSONストリーミング版）
+    全ジョブ分のレスポンスをメモリに組み立ててから返す代わりに、
+    1ジョブずつシリアライズして送出する
+    """
+    scraping_service = ScrapingService(db)
+    jobs = scraping_service.get_user_scraping_jobs(str(current_user.id), limit, offset)
+
+    def generate():
+        for job in jobs:
+            yield orjson.dumps(_job_to_status(job).model_dump()) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
 @router.get("/jobs/{job_id}", response_model=ScrapingJobStatus)
 async def get_scraping_job_status(
     job_id: str,
@@ -191,25 +359,21 @@ async def get_scraping_job_status(
     スクレイピングジョブの状態確認（タスクマネージャー統合）
     """
     # タスクマネージャーから進捗を取得
-    task_progress = await task_manager.get_task_progress(job_id)
-    
+    # （管理外のジョブは同期チェックで弾き、DBフォールバックへ直行する）
+    task_progress = None
+    if task_manager.contains(job_id):
+        task_progress = await task_manager.get_task_progress(job_id)
+
     if task_progress:
         # タスクマネージャーから詳細情報を取得
-        failed_urls = []
+        # 実行中プロセスが書くfailed_urlsは常に{url, error}辞書なので
+        # 旧形式の変換はDBフォールバック側だけで行えばよい
         completed_urls = task_progress.progress_details.get('completed_urls', [])
-        
-        # failed_urls の処理
-        failed_url_strings = task_progress.progress_details.get('failed_urls', [])
-        for failed_url in failed_url_strings:
-            if isinstance(failed_url, str) and ":" in failed_url:
-                url, error = failed_url.split(":", 1)
-                failed_urls.append({"url": url.strip(), "error": error.strip()})
-            else:
-                failed_urls.append({"url": str(failed_url), "error": "Unknown error"})
-        
+        failed_urls = task_progress.progress_details.get('failed_urls', [])
+
         return ScrapingJobStatus(
             id=job_id,
-            status=task_progress.status.value,
+            status=task_progress.status,
             progress=task_progress.current,
             total=task_progress.total,
             completed_urls=completed_urls,
@@ -231,15 +395,8 @@ async def get_scraping_job_status(
                 detail="Scraping job not found"
             )
         
-        # failed_urlsを文字列から辞書形式に変換
-        failed_urls = []
-        for failed_url in (job.failed_urls or []):
-            if ":" in failed_url:
-                url, error = failed_url.split(":", 1)
-                failed_urls.append({"url": url.strip(), "error": error.strip()})
-            else:
-                failed_urls.append({"url": failed_url, "error": "Unknown error"})
-        
+        failed_urls = _normalize_failed_urls(job.failed_urls)
+
         return ScrapingJobStatus(
             id=str(job.id),
             status=job.status,
@@ -254,6 +411,22 @@ async def get_scraping_job_status(
             completed_at=job.completed_at
         )
 
+def _job_to_status(job) -> ScrapingJobStatus:
+    """ScrapingJobレコードをレスポンスモデルに変換"""
+    return ScrapingJobStatus(
+        id=str(job.id),
+        status=job.status,
+        progress=job.progress,
+        total=job.total,
+        completed_urls=job.completed_urls or [],
+        failed_urls=_normalize_failed_urls(job.failed_urls),
+        skipped_urls=job.skipped_urls or [],
+        created_articles=job.created_article_ids or [],
+        created_at=job.created_at,
+        started_at=job.started_at,
+        completed_at=job.completed_at
+    )
+
 @router.get("/jobs", response_model=List[ScrapingJobStatus])
 async def list_user_scraping_jobs(
     limit: int = 20,
@@ -266,33 +439,8 @@ async def list_user_scraping_jobs(
     """
     scraping_service = ScrapingService(db)
     jobs = scraping_service.get_user_scraping_jobs(str(current_user.id), limit, offset)
-    
-    result = []
-    for job in jobs:
-        # failed_urlsを文字列から辞書形式に変換
-        failed_urls = []
-        for failed_url in (job.failed_urls or []):
-            if ":" in failed_url:
-                url, error = failed_url.split(":", 1)
-                failed_urls.append({"url": url.strip(), "error": error.strip()})
-            else:
-                failed_urls.append({"url": failed_url, "error": "Unknown error"})
-        
-        result.append(ScrapingJobStatus(
-            id=str(job.id),
-            status=job.status,
-            progress=job.progress,
-            total=job.total,
-            completed_urls=job.completed_urls or [],
-            failed_urls=failed_urls,
-            skipped_urls=job.skipped_urls or [],
-            created_articles=job.created_article_ids or [],
-            created_at=job.created_at,
-            started_at=job.started_at,
-            completed_at=job.completed_at
-        ))
-    
-    return result
+
+    return [_job_to_status(job) for job in jobs]
 
 @router.delete("/jobs/{job_id}")
 async def delete_scraping_job(
@@ -1,6 +1,9 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import date
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.db.database import get_db
@@ -38,34 +41,65 @@ async def get_action_usage_status(
 @router.get("/history")
 async def get_usage_history(
     days: int = 7,
+    detail: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """使用履歴を取得"""
+    """使用履歴を取得
+
+    既定では日別・アクション別の集計行のみを返す（行数は日数×種別に
+    収まる）。?detail=raw を指定すると従来どおりの生ログを返すが、
+    全行をメモリに載せずNDJSONでストリーミングする
+    """
     try:
         from app.models.usage_log import UsageLog
-        from datetime import datetime, timedelta
-        
+        from datetime import timedelta
+
         start_date = date.today() - timedelta(days=days)
-        
-        logs = db.query(UsageLog).filter(
+
+        base_filter = (
             UsageLog.user_id == str(current_user.id),
             UsageLog.usage_date >= start_date
-        ).order_by(UsageLog.created_at.desc()).all()
-        
+        )
+
+        if detail == "raw":
+            logs = db.query(UsageLog).filter(
+                *base_filter
+            ).order_by(UsageLog.created_at.desc()).yield_per(500)
+
+            def generate():
+                for log in logs:
+                    yield orjson.dumps({
+                        'id': log.id,
+                        'action_type': log.action_type,
+                        'usage_date': log.usage_date.isoformat(),
+                        'resource_used': log.resource_used,
+                        'created_at': log.created_at.isoformat()
+                    }) + b"\n"
+
+            return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+        # 集計はDB側で行う（全ログ行の取り出し・シリアライズを避ける）
+        rows = db.query(
+            UsageLog.usage_date,
+            UsageLog.action_type,
+            func.count()
+        ).filter(*base_filter).group_by(
+            UsageLog.usage_date,
+            UsageLog.action_type
+        ).order_by(UsageLog.usage_date.desc()).all()
+
         return {
             'user_id': str(current_user.id),
             'period_days': days,
-            'total_logs': len(logs),
-            'logs': [
+            'total_logs': sum(count for _, _, count in rows),
+            'daily_summary': [
                 {
-                    'id': log.id,
-                    'action_type': log.action_type,
-                    'usage_date': log.usage_date.isoformat(),
-                    'resource_used': log.resource_used,
-                    'created_at': log.created_at.isoformat()
+                    'usage_date': usage_date.isoformat(),
+                    'action_type': action_type,
+                    'count': count
                 }
-                for log in logs
+                for usage_date, action_type, count in rows
             ]
         }
     except Exception as e:
@@ -1,113 +1,261 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
-from typing import Dict, List
+from typing import Dict, Set
 import json
 import logging
 import asyncio
+import msgpack
+import orjson
 from app.core.background_tasks import task_manager, TaskProgress
-from app.core.deps import get_current_user_from_token
-from app.models.user import User
+from app.core.security import verify_token
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+
+# MessagePack対応クライアントが接続時に指定するサブプロトコル名
+# 指定がない接続には従来どおりJSONテキストで送るため、既存クライアントは
+# そのまま動く
+MSGPACK_SUBPROTOCOL = "msgpack.v1"
+
+
+def _dumps(message: dict) -> str:
+    """配信メッセージをJSON文字列へ変換（orjsonはstdlib jsonより数倍高速）"""
+    return orjson.dumps(message).decode()
+
+
+def _encode_for(connection: WebSocket, message: dict, cache: dict):
+    """接続のネゴシエート済み形式でメッセージをエンコードする
+
+    同報時に同じdictを何度もシリアライズしないよう、形式ごとの
+    結果をcache辞書に載せて使い回す。返り値は(ペイロード, バイナリか)
+    """
+    if getattr(connection.state, "use_msgpack", False):
+        if "msgpack" not in cache:
+            cache["msgpack"] = msgpack.packb(message, use_bin_type=True, default=str)
+        return cache["msgpack"], True
+
+    if "json" not in cache:
+        cache["json"] = _dumps(message)
+    return cache["json"], False
+
+
+async def _send(connection: WebSocket, message: dict, cache: dict):
+    """接続の形式に合わせてフレームを送信する"""
+    payload, is_binary = _encode_for(connection, message, cache)
+    if is_binary:
+        await connection.send_bytes(payload)
+    else:
+        await connection.send_text(payload)
+
 class ConnectionManager:
     """WebSocket接続管理"""
     
     def __init__(self):
         # ユーザーID -> WebSocket接続のマッピング
-        self.active_connections: Dict[str, List[WebSocket]] = {}
+        # （タブ数・購読者数が増えても削除・重複チェックがO(1)で済むようsetを使う）
+        self.active_connections: Dict[str, Set[WebSocket]] = {}
         # タスクID -> 購読ユーザーIDのマッピング
-        self.task_subscriptions: Dict[str, List[str]] = {}
-    
+        self.task_subscriptions: Dict[str, Set[str]] = {}
+        # ユーザーID -> 購読中タスクIDの逆引きインデックス
+        # （切断時に全タスクを走査せず、そのユーザーの購読分だけ外せる）
+        self.user_tasks: Dict[str, Set[str]] = {}
+        # タスクID -> 進捗イベントキュー／配信コルーチン
+        self._task_queues: Dict[str, asyncio.Queue] = {}
+        self._broadcasters: Dict[str, asyncio.Task] = {}
+        # タスクID -> 最後に配信した進捗のフィンガープリント
+        # （観測可能な変化のない再通知をシリアライズ前に弾く）
+        self._last_sent: Dict[str, tuple] = {}
+
     async def connect(self, websocket: WebSocket, user_id: str):
-        """WebSocket接続を受け入れ"""
-        await websocket.accept()
-        
-        if user_id not in self.active_connections:
-            self.active_connections[user_id] = []
-        self.active_connections[user_id].append(websocket)
-        
+        """WebSocket接続を受け入れ（サブプロトコルでMessagePackを交渉）"""
+        requested = websocket.scope.get("subprotocols") or []
+        if MSGPACK_SUBPROTOCOL in requested:
+            await websocket.accept(subprotocol=MSGPACK_SUBPROTOCOL)
+            websocket.state.use_msgpack = True
+        else:
+            await websocket.accept()
+            websocket.state.use_msgpack = False
+
+        self.active_connections.setdefault(user_id, set()).add(websocket)
+
         logger.info(f"WebSocket connected for user {user_id}")
-    
+
     def disconnect(self, websocket: WebSocket, user_id: str):
         """WebSocket接続を切断"""
         if user_id in self.active_connections:
-            if websocket in self.active_connections[user_id]:
-                self.active_connections[user_id].remove(websocket)
-            
+            self.active_connections[user_id].discard(websocket)
+
             # 接続がなくなったらユーザーを削除
             if not self.active_connections[user_id]:
                 del self.active_connections[user_id]
-                
-                # タスク購読も削除
-                tasks_to_remove = []
-                for task_id, subscribers in self.task_subscriptions.items():
-                    if user_id in subscribers:
-                        subscribers.remove(user_id)
-                        if not subscribers:
-                            tasks_to_remove.append(task_id)
-                
-                for task_id in tasks_to_remove:
-                    del self.task_subscriptions[task_id]
-        
+
+                # タスク購読も削除（逆引きインデックスで購読分だけ辿る）
+                for task_id in self.user_tasks.pop(user_id, ()):
+                    subscribers = self.task_subscriptions.get(task_id)
+                    if subscribers is None:
+                        continue
+                    subscribers.discard(user_id)
+                    if not subscribers:
+                        del self.task_subscriptions[task_id]
+                        self._stop_broadcaster(task_id)
+
         logger.info(f"WebSocket disconnected for user {user_id}")
     
     async def send_personal_message(self, message: dict, user_id: str):
-        """特定ユーザーにメッセージを送信"""
+        """特定ユーザーの全接続にメッセージを送信
+
+        シリアライズは形式（JSON/MessagePack）ごとに1回だけ行い、
+        複数タブへは同じペイロードを使い回す
+        """
         if user_id in self.active_connections:
+            cache: dict = {}
             disconnected_connections = []
             for connection in self.active_connections[user_id]:
                 try:
-                    await connection.send_text(json.dumps(message))
+                    await _send(connection, message, cache)
                 except Exception as e:
                     logger.error(f"Failed to send message to user {user_id}: {e}")
                     disconnected_connections.append(connection)
-            
+
             # 切断された接続を削除
             for connection in disconnected_connections:
                 self.disconnect(connection, user_id)
-    
+
     async def broadcast_task_progress(self, task_id: str, progress: TaskProgress):
-        """タスク進捗を購読者に配信"""
-        if task_id in self.task_subscriptions:
-            message = {
-                "type": "task_progress",
-                "task_id": task_id,
-                "progress": progress.to_dict()
-            }
-            
-            for user_id in self.task_subscriptions[task_id]:
-                await self.send_personal_message(message, user_id)
+        """タスク進捗を購読者に配信
+
+        送信は全接続へ並行して行う。直列awaitだと遅いクライアント
+        1つが他の全購読者への配信と次の進捗更新を遅らせてしまう
+        """
+        if task_id not in self.task_subscriptions:
+            return
+
+        # 内容が前回配信と同じなら何もしない（タスクマネージャーが
+        # 変化なしでコールバックを再発火しても無駄打ちにならない）
+        fingerprint = (
+            progress.status,
+            progress.current,
+            progress.total,
+            progress.message,
+            len(progress.progress_details)
+        )
+        if self._last_sent.get(task_id) == fingerprint:
+            return
+        self._last_sent[task_id] = fingerprint
+
+        # シリアライズは通知1回につき1度だけ:
+        #   - to_dict()はTaskProgress側でキャッシュされており、
+        #     同一更新に対する辞書構築は購読キューが何本あっても1回
+        #   - ワイヤ形式へのエンコードはcache経由で形式ごとに1回
+        payload = progress.to_dict()
+        message = {
+            "type": "task_progress",
+            "task_id": task_id,
+            "progress": payload
+        }
+        cache: dict = {}
+
+        # (ユーザーID, 接続) を平坦化して一斉送信する
+        targets = [
+            (user_id, connection)
+            for user_id in self.task_subscriptions[task_id]
+            for connection in self.active_connections.get(user_id, [])
+        ]
+        if not targets:
+            return
+
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(_send(connection, message, cache), timeout=2.0)
+                for _, connection in targets
+            ),
+            return_exceptions=True
+        )
+
+        # 送信に失敗した（またはタイムアウトした）接続は切断扱いにする
+        for (user_id, connection), result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to send message to user {user_id}: {result}")
+                self.disconnect(connection, user_id)
     
     def subscribe_to_task(self, task_id: str, user_id: str):
         """タスクの進捗購読を開始"""
-        if task_id not in self.task_subscriptions:
-            self.task_subscriptions[task_id] = []
-        
-        if user_id not in self.task_subscriptions[task_id]:
-            self.task_subscriptions[task_id].append(user_id)
-            
-            # タスクマネージャーにコールバックを登録
-            task_manager.add_progress_callback(
-                task_id, 
-                lambda progress: asyncio.create_task(
-                    self.broadcast_task_progress(task_id, progress)
+        subscribers = self.task_subscriptions.setdefault(task_id, set())
+
+        if user_id not in subscribers:
+            subscribers.add(user_id)
+            self.user_tasks.setdefault(user_id, set()).add(task_id)
+
+            # タスクごとに1本の配信コルーチンを起動し、
+            # 進捗コールバックはキューへの投入（put_nowait）だけにする。
+            # イベントごとにasyncio.Taskを生成するより大幅に軽い
+            if task_id not in self._task_queues:
+                queue = task_manager.subscribe(task_id)
+                self._task_queues[task_id] = queue
+                self._broadcasters[task_id] = asyncio.create_task(
+                    self._broadcast_loop(task_id, queue)
                 )
-            )
-            
+
             logger.info(f"User {user_id} subscribed to task {task_id}")
-    
+
+    async def _broadcast_loop(self, task_id: str, queue: asyncio.Queue):
+        """タスクの進捗イベントをまとめて配信するループ
+
+        バースト時は100ms待ってキューを読み尽くし、最新の進捗だけを
+        配信する。進捗の更新頻度に関係なく配信は最大10回/秒に収まる
+        """
+        try:
+            while True:
+                progress = await queue.get()
+
+                # バースト吸収: 少し待ってから溜まった更新を最新1件に畳む
+                await asyncio.sleep(0.1)
+                while True:
+                    try:
+                        progress = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+
+                await self.broadcast_task_progress(task_id, progress)
+
+                if progress.is_finished:
+                    break
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._task_queues.pop(task_id, None)
+            self._broadcasters.pop(task_id, None)
+
+    def _stop_broadcaster(self, task_id: str):
+        """配信コルーチンを停止してコールバック登録を解除する"""
+        queue = self._task_queues.pop(task_id, None)
+        if queue is not None:
+            task_manager.unsubscribe(task_id, queue)
+
+        broadcaster = self._broadcasters.pop(task_id, None)
+        if broadcaster is not None:
+            broadcaster.cancel()
+
+        self._last_sent.pop(task_id, None)
+
     def unsubscribe_from_task(self, task_id: str, user_id: str):
         """タスクの進捗購読を停止"""
-        if (task_id in self.task_subscriptions and 
+        if (task_id in self.task_subscriptions and
             user_id in self.task_subscriptions[task_id]):
-            
-            self.task_subscriptions[task_id].remove(user_id)
-            
+
+            self.task_subscriptions[task_id].discard(user_id)
+
+            subscribed = self.user_tasks.get(user_id)
+            if subscribed is not None:
+                subscribed.discard(task_id)
+                if not subscribed:
+                    del self.user_tasks[user_id]
+
             if not self.task_subscriptions[task_id]:
                 del self.task_subscriptions[task_id]
-            
+                self._stop_broadcaster(task_id)
+
             logger.info(f"User {user_id} unsubscribed from task {task_id}")
 
 # グローバル接続マネージャー
@@ -116,23 +264,32 @@ connection_manager = ConnectionManager()
 @router.websocket("/ws/{token}")
 async def websocket_endpoint(websocket: WebSocket, token: str):
     """WebSocketエンドポイント"""
+    user_id = None
     try:
-        # トークンからユーザー情報を取得
-        # 簡易実装（実際の認証実装に合わせて調整）
-        user_id = await get_user_id_from_token(token)
+        # JWTの検証は接続時の1回だけ。以降のメッセージ処理は
+        # websocket.stateにキャッシュしたuser_idを使い、
+        # フレームごとの署名検証コストを払わない
+        user_id = verify_token(token)
         if not user_id:
             await websocket.close(code=4001, reason="Invalid token")
             return
-        
+
+        websocket.state.user_id = user_id
+
+
         # 接続を受け入れ
         await connection_manager.connect(websocket, user_id)
         
         try:
             while True:
-                # クライアントからのメッセージを受信
-                data = await websocket.receive_text()
-                message = json.loads(data)
-                
+                # クライアントからのメッセージを受信（交渉済み形式でデコード）
+                if websocket.state.use_msgpack:
+                    message = msgpack.unpackb(
+                        await websocket.receive_bytes(), raw=False
+                    )
+                else:
+                    message = json.loads(await websocket.receive_text())
+
                 await handle_websocket_message(message, user_id)
                 
         except WebSocketDisconnect:
@@ -142,7 +299,8 @@ async def websocket_endpoint(websocket: WebSocket, token: str):
         logger.error(f"WebSocket error: {e}")
     
     finally:
-        connection_manager.disconnect(websocket, user_id)
+        if user_id:
+            connection_manager.disconnect(websocket, user_id)
 
 async def handle_websocket_message(message: dict, user_id: str):
     """WebSocketメッセージを処理"""
@@ -176,14 +334,6 @@ async def handle_websocket_message(message: dict, user_id: str):
             "timestamp": message.get("timestamp")
         }, user_id)
 
-async def get_user_id_from_token(token: str) -> str:
-    """トークンからユーザーIDを取得（簡易実装）"""
-    # 実際の実装では、JWTデコードや認証処理を行う
-    # 現在は簡易的に固定値を返す
-    if token == "test-token":
-        return "test-user-id"
-    return None
-
 # タスク進捗通知APIエンドポイント
 @router.get("/tasks/{task_id}/progress")
 async def get_task_progress_api(task_id: str):
@@ -229,10 +379,9 @@ async def delete_task_api(task_id: str):
     await task_manager.cancel_task(task_id)
     
     # タスクマネージャーから削除（実装簡略化）
-    if task_id in task_manager._tasks:
-        del task_manager._tasks[task_id]
-        if task_id in task_manager._running_tasks:
-            del task_manager._running_tasks[task_id]
+    progress = task_manager._tasks.pop(task_id, None)
+    if progress is not None:
+        task_manager._by_status[progress.status].pop(task_id, None)
         return {"message": "Task deleted successfully"}
     else:
         return {"error": "Task not found"}
\ No newline at end of file
@@ -1,25 +1,41 @@
 import asyncio
+import itertools
 import logging
+import time
 import uuid
+from collections import OrderedDict
 from typing import Dict, Optional, Callable, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from enum import Enum
+from enum import StrEnum
 import traceback
 
 logger = logging.getLogger(__name__)
 
-class TaskStatus(Enum):
-    """タスクステータス"""
+def _ts_to_iso(ts: float) -> str:
+    """UNIXタイムスタンプをISO 8601文字列（UTC）に変換する"""
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+
+
+class TaskStatus(StrEnum):
+    """タスクステータス
+
+    StrEnumなのでメンバーはそのままstrとして比較・シリアライズでき、
+    JSON/MessagePack化の際に.valueの取り出しが要らない
+    """
     PENDING = "pending"
     RUNNING = "running" 
     COMPLETED = "completed"
     FAILED = "failed"
     CANCELLED = "cancelled"
 
-@dataclass
+@dataclass(slots=True)
 class TaskProgress:
-    """タスク進捗情報"""
+    """タスク進捗情報
+
+    24時間保持される履歴タスクが数千件たまることがあるため、
+    slots=Trueでインスタンスごとの__dict__を持たないようにする
+    """
     task_id: str
     status: TaskStatus
     current: int = 0
@@ -27,16 +43,43 @@ class TaskProgress:
     message: str = ""
     result: Optional[Any] = None
     error: Optional[str] = None
-    created_at: datetime = None
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    # 時刻はUNIXタイムスタンプ（float）で保持する。状態遷移のたびに
+    # タイムゾーン付きdatetimeを構築するのはホットパスには重く、
+    # datetimeが必要になるのはAPI応答へのシリアライズ時だけ
+    created_at_ts: float = 0.0
+    started_at_ts: Optional[float] = None
+    completed_at_ts: Optional[float] = None
     progress_details: Dict[str, Any] = None
-    
+    # to_dict()の結果キャッシュ。購読者ごとの再シリアライズで
+    # isoformatと辞書構築を繰り返さないための器
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # created_atは構築後に変わらないため1回だけ整形して保持する
+    _created_at_iso: str = field(default="", init=False, repr=False, compare=False)
+    # 実行中のasyncio.Task（to_dictには含めない）。別辞書で並行管理すると
+    # 登録・削除の二重操作と不整合の余地が生まれるため、進捗と同居させる
+    asyncio_task: Optional[asyncio.Task] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # ステータス判定用の集合はクラスで1回だけ構築する
+    # （プロパティ呼び出しごとのリスト生成と線形走査を避ける）
+    _ACTIVE_STATUSES = frozenset({TaskStatus.PENDING, TaskStatus.RUNNING})
+    _FINISHED_STATUSES = frozenset({
+        TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED
+    })
+
     def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = datetime.now(timezone.utc)
+        if not self.created_at_ts:
+            self.created_at_ts = time.time()
         if self.progress_details is None:
             self.progress_details = {}
+        self._created_at_iso = _ts_to_iso(self.created_at_ts)
+
+    def invalidate(self):
+        """フィールド更新後にto_dict()キャッシュを破棄する"""
+        self._dict_cache = None
     
     @property
     def progress_percentage(self) -> float:
@@ -48,38 +91,99 @@ class TaskProgress:
     @property
     def is_active(self) -> bool:
         """アクティブなタスクかどうか"""
-        return self.status in [TaskStatus.PENDING, TaskStatus.RUNNING]
+        return self.status in self._ACTIVE_STATUSES
     
     @property
     def is_finished(self) -> bool:
         """完了したタスクかどうか"""
-        return self.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]
-    
+        return self.status in self._FINISHED_STATUSES
+
+    # APIレスポンス（ScrapingJobStatus等）向けのdatetimeアクセサ。
+    # 内部のホットパスは*_tsを直接読む
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromtimestamp(self.created_at_ts, tz=timezone.utc)
+
+    @property
+    def started_at(self) -> Optional[datetime]:
+        if self.started_at_ts is None:
+            return None
+        return datetime.fromtimestamp(self.started_at_ts, tz=timezone.utc)
+
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        if self.completed_at_ts is None:
+            return None
+        return datetime.fromtimestamp(self.completed_at_ts, tz=timezone.utc)
+
+
     def to_dict(self) -> Dict[str, Any]:
-        """辞書形式で返す"""
-        return {
-            "task_id": self.task_id,
-            "status": self.status.value,
-            "current": self.current,
-            "total": self.total,
-            "progress_percentage": self.progress_percentage,
-            "message": self.message,
-            "result": self.result,
-            "error": self.error,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "progress_details": self.progress_details
-        }
+        """辞書形式で返す（invalidate()されるまで同じdictを使い回す）"""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "task_id": self.task_id,
+                "status": self.status,
+                "current": self.current,
+                "total": self.total,
+                "progress_percentage": self.progress_percentage,
+                "message": self.message,
+                "result": self.result,
+                "error": self.error,
+                "created_at": self._created_at_iso,
+                "started_at": _ts_to_iso(self.started_at_ts) if self.started_at_ts else None,
+                "completed_at": _ts_to_iso(self.completed_at_ts) if self.completed_at_ts else None,
+                "progress_details": self.progress_details
+            }
+        return self._dict_cache
 
 class BackgroundTaskManager:
     """バックグラウンドタスクマネージャー"""
-    
+
+    # 進捗通知の最小間隔（秒）。購読者は項目単位の粒度を必要としないため、
+    # この間隔を下回る通知は間引く（終了時と100%到達時は即時配信）
+    MIN_NOTIFY_INTERVAL = 0.1
+
+    # 保持するタスク数の上限。定期クリーンアップが止まっていても
+    # メモリ使用量がこれを超えて育たないようにする
+    MAX_TASKS = 10_000
+
+    # Redisミラーに書いたタスク状態の保持期間（インメモリの24時間保持と同じ）
+    REDIS_TASK_TTL = 24 * 3600
+
+    # シングルトンだが属性は固定なので、slots化でtypoによる
+    # 属性の生やし間違いも防いでおく
+    __slots__ = (
+        '_tasks', '_subscribers', '_by_status',
+        '_notify_pending', '_last_notify_ts', '_flush_scheduled',
+        '_redis', '_redis_enabled', '_remote_relays',
+    )
+
     def __init__(self):
+        # 全操作は単一イベントループ上で行われ、クリティカルセクション内に
+        # awaitが存在しないため、辞書操作はロックなしでアトミックに扱える
+        # （asyncio.Lockの取得は更新1回あたり数µsの純粋なオーバーヘッドだった）
         self._tasks: Dict[str, TaskProgress] = {}
-        self._running_tasks: Dict[str, asyncio.Task] = {}
-        self._progress_callbacks: Dict[str, list] = {}
-        self._lock = asyncio.Lock()
+        # タスクID -> 購読キューの集合。通知はput_nowaitするだけなので
+        # 購読者ごとのawaitやコルーチン判定が通知経路から消える
+        self._subscribers: Dict[str, set] = {}
+        # ステータス別インデックス（挿入順＝遷移順なのでソート不要で
+        # 「最新のN件」をisliceで切り出せる）
+        self._by_status: Dict[TaskStatus, OrderedDict] = {
+            status: OrderedDict() for status in TaskStatus
+        }
+        # 通知タスクが既にスケジュール済みのタスクID
+        # （進捗ティックのバーストを通知1回にまとめる）
+        self._notify_pending: set = set()
+        # タスクID -> 最後に通知したloop.time()と遅延フラッシュ予約
+        self._last_notify_ts: Dict[str, float] = {}
+        self._flush_scheduled: set = set()
+        # タスク状態のRedisミラー（複数ワーカー構成向け・設定で有効化）。
+        # このモジュールは設定やredisなしでもインポートできるよう、
+        # 接続と有効判定はどちらも初回利用時まで遅延させる
+        self._redis = None
+        self._redis_enabled: Optional[bool] = None
+        # 他ワーカー実行中タスクの進捗をPub/Subで中継しているTask
+        self._remote_relays: Dict[str, asyncio.Task] = {}
     
     async def create_task(
         self,
@@ -107,25 +211,27 @@ class BackgroundTaskManager:
         if task_id is None:
             task_id = str(uuid.uuid4())
         
-        async with self._lock:
-            if task_id in self._tasks:
-                raise ValueError(f"Task {task_id} already exists")
-            
-            # タスク進捗を初期化
-            progress = TaskProgress(
-                task_id=task_id,
-                status=TaskStatus.PENDING,
-                total=total,
-                message=message
-            )
-            self._tasks[task_id] = progress
-            self._progress_callbacks[task_id] = []
+        if task_id in self._tasks:
+            raise ValueError(f"Task {task_id} already exists")
+
+        # 上限到達時は最も古い完了済みタスクを1件追い出す
+        if len(self._tasks) >= self.MAX_TASKS:
+            self._evict_oldest_finished()
+
+        # タスク進捗を初期化（存在チェックから登録までawaitを挟まない）
+        progress = TaskProgress(
+            task_id=task_id,
+            status=TaskStatus.PENDING,
+            total=total,
+            message=message
+        )
+        self._tasks[task_id] = progress
+        self._by_status[TaskStatus.PENDING][task_id] = progress
         
         # 非同期タスクを開始
-        async_task = asyncio.create_task(
+        progress.asyncio_task = asyncio.create_task(
             self._execute_task(task_id, task_func, *args, **kwargs)
         )
-        self._running_tasks[task_id] = async_task
         
         logger.info(f"Created background task {task_id}")
         return task_id
@@ -142,9 +248,10 @@ class BackgroundTaskManager:
         
         try:
             # タスク開始
-            progress.status = TaskStatus.RUNNING
-            progress.started_at = datetime.now(timezone.utc)
+            self._set_status(progress, TaskStatus.RUNNING)
+            progress.started_at_ts = time.time()
             progress.message = "Task started"
+            progress.invalidate()
             await self._notify_progress_update(task_id)
             
             # プログレス更新コールバックを作成
@@ -165,48 +272,88 @@ class BackgroundTaskManager:
             result = await task_func(*args, **kwargs)
             
             # タスク完了
-            progress.status = TaskStatus.COMPLETED
-            progress.completed_at = datetime.now(timezone.utc)
+            self._set_status(progress, TaskStatus.COMPLETED)
+            progress.completed_at_ts = time.time()
             progress.result = result
             progress.message = "Task completed successfully"
+            progress.invalidate()
             await self._notify_progress_update(task_id)
             
             logger.info(f"Background task {task_id} completed successfully")
             
         except asyncio.CancelledError:
             # タスクキャンセル
-            progress.status = TaskStatus.CANCELLED
-            progress.completed_at = datetime.now(timezone.utc)
+            self._set_status(progress, TaskStatus.CANCELLED)
+            progress.completed_at_ts = time.time()
             progress.message = "Task was cancelled"
+            progress.invalidate()
             await self._notify_progress_update(task_id)
             
             logger.info(f"Background task {task_id} was cancelled")
             
         except Exception as e:
             # タスク失敗
-            progress.status = TaskStatus.FAILED
-            progress.completed_at = datetime.now(timezone.utc)
+            self._set_status(progress, TaskStatus.FAILED)
+            progress.completed_at_ts = time.time()
             progress.error = str(e)
             progress.message = f"Task failed: {str(e)}"
+            progress.invalidate()
             await self._notify_progress_update(task_id)
             
             logger.error(f"Background task {task_id} failed: {str(e)}")
             logger.error(traceback.format_exc())
             
         finally:
-            # クリーンアップ
-            if task_id in self._running_tasks:
-                del self._running_tasks[task_id]
+            # クリーンアップ（Taskオブジェクトへの参照を解放する）
+            progress.asyncio_task = None
     
+    def _set_status(self, progress: TaskProgress, new_status: TaskStatus):
+        """ステータスを遷移し、ステータス別インデックスを付け替える"""
+        self._by_status[progress.status].pop(progress.task_id, None)
+        progress.status = new_status
+        self._by_status[new_status][progress.task_id] = progress
+
     def _create_progress_callback(self, task_id: str):
-        """プログレス更新コールバックを作成"""
+        """プログレス更新コールバックを作成
+
+        ティックごとにupdate_progressのコルーチンTaskを生成すると、
+        数千URL規模のジョブでTaskアロケーションが支配的になる。
+        フィールドの更新は同期で直接行い、通知のスケジュールだけを
+        タスクIDごとに最大1つへまとめる
+        """
         def progress_callback(current: int = None, total: int = None, message: str = None, **details):
-            """プログレス更新コールバック"""
-            asyncio.create_task(self.update_progress(
-                task_id, current=current, total=total, message=message, **details
-            ))
-        
+            """プログレス更新コールバック（同期・Task生成なし）"""
+            progress = self._tasks.get(task_id)
+            if progress is None:
+                return
+
+            if current is not None:
+                progress.current = current
+            if total is not None:
+                progress.total = total
+            if message is not None:
+                progress.message = message
+            if details:
+                progress.progress_details.update(details)
+
+            progress.invalidate()
+            self._schedule_notify(task_id)
+
         return progress_callback
+
+    def _schedule_notify(self, task_id: str):
+        """進捗通知をスケジュールする（タスクIDごとに未実行なら1つだけ）"""
+        if task_id in self._notify_pending:
+            return
+        self._notify_pending.add(task_id)
+
+        async def _notify():
+            # 実行開始時にフラグを外す：通知中に届いた更新は
+            # 次の通知として改めてスケジュールされる
+            self._notify_pending.discard(task_id)
+            await self._notify_progress_update(task_id)
+
+        asyncio.create_task(_notify())
     
     async def update_progress(
         self,
@@ -217,39 +364,83 @@ class BackgroundTaskManager:
         **details
     ):
         """タスクの進捗を更新"""
-        async with self._lock:
-            if task_id not in self._tasks:
-                return
-            
-            progress = self._tasks[task_id]
-            
-            if current is not None:
-                progress.current = current
-            if total is not None:
-                progress.total = total
-            if message is not None:
-                progress.message = message
-            if details:
-                progress.progress_details.update(details)
-        
+        progress = self._tasks.get(task_id)
+        if progress is None:
+            return
+
+        if current is not None:
+            progress.current = current
+        if total is not None:
+            progress.total = total
+        if message is not None:
+            progress.message = message
+        if details:
+            progress.progress_details.update(details)
+
+        progress.invalidate()
         await self._notify_progress_update(task_id)
     
-    async def _notify_progress_update(self, task_id: str):
-        """進捗更新を通知"""
-        if task_id in self._progress_callbacks:
-            progress = self._tasks[task_id]
-            for callback in self._progress_callbacks[task_id]:
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback(progress)
-                    else:
-                        callback(progress)
-                except Exception as e:
-                    logger.error(f"Progress callback error for task {task_id}: {e}")
+    async def _notify_progress_update(self, task_id: str, force: bool = False):
+        """進捗更新を通知（時間ベースのデバウンス付き）"""
+        progress = self._tasks.get(task_id)
+        if progress is None:
+            return
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+
+        # 終了・100%到達以外は最小間隔を下回る通知を間引く。
+        # 間引いた分が最後の更新にならないよう、遅延フラッシュを1つ予約する
+        immediate = (
+            force or
+            progress.is_finished or
+            (progress.total > 0 and progress.current >= progress.total)
+        )
+        if not immediate:
+            last = self._last_notify_ts.get(task_id, 0.0)
+            if now - last < self.MIN_NOTIFY_INTERVAL:
+                if task_id not in self._flush_scheduled:
+                    self._flush_scheduled.add(task_id)
+                    loop.call_later(
+                        self.MIN_NOTIFY_INTERVAL, self._flush_notify, task_id
+                    )
+                return
+
+        self._last_notify_ts[task_id] = now
+
+        for queue in self._subscribers.get(task_id, ()):
+            queue.put_nowait(progress)
+
+        # デバウンス通過分だけをRedisへ複製する（進捗ティックごとの
+        # ラウンドトリップにならないよう、ローカル配信と同じ頻度に抑える）
+        if self._use_redis():
+            await self._mirror_to_redis(progress)
+
+    def _flush_notify(self, task_id: str):
+        """デバウンスで抑制された最後の進捗を配信する"""
+        self._flush_scheduled.discard(task_id)
+        if task_id in self._tasks:
+            asyncio.create_task(self._notify_progress_update(task_id, force=True))
     
+    def contains(self, task_id: str) -> bool:
+        """タスクが管理下にあるかを判定する
+
+        同期の辞書参照だけで済むため、呼び出し側はミス時に
+        awaitを挟まずDBフォールバックへ直行できる
+        """
+        return task_id in self._tasks
+
     async def get_task_progress(self, task_id: str) -> Optional[TaskProgress]:
-        """タスクの進捗を取得"""
-        return self._tasks.get(task_id)
+        """タスクの進捗を取得
+
+        ローカルに存在しないタスクは、Redisミラーが有効なら他ワーカーが
+        書いた状態から復元する（複数ワーカー構成では、タスクを実行中の
+        ワーカーと状態照会が届くワーカーが一致するとは限らない）
+        """
+        progress = self._tasks.get(task_id)
+        if progress is None and self._use_redis():
+            progress = await self._fetch_from_redis(task_id)
+        return progress
     
     async def list_tasks(
         self, 
@@ -257,53 +448,201 @@ class BackgroundTaskManager:
         limit: int = 100
     ) -> list[TaskProgress]:
         """タスク一覧を取得"""
-        tasks = list(self._tasks.values())
-        
         if status_filter:
-            tasks = [t for t in tasks if t.status == status_filter]
-        
-        # 作成日時の降順でソート
-        tasks.sort(key=lambda t: t.created_at, reverse=True)
-        
+            # ステータス別インデックスは遷移順に並んでいるため、
+            # 逆順スライスだけで「最新のN件」を取り出せる
+            bucket = self._by_status.get(status_filter)
+            if not bucket:
+                return []
+            return list(itertools.islice(reversed(bucket.values()), limit))
+
+        # 全件の場合のみ作成日時の降順でソート
+        tasks = list(self._tasks.values())
+        tasks.sort(key=lambda t: t.created_at_ts, reverse=True)
+
         return tasks[:limit]
     
     async def cancel_task(self, task_id: str) -> bool:
         """タスクをキャンセル"""
-        if task_id in self._running_tasks:
-            task = self._running_tasks[task_id]
-            task.cancel()
+        progress = self._tasks.get(task_id)
+        if (progress is not None and
+                progress.asyncio_task is not None and
+                not progress.asyncio_task.done()):
+            progress.asyncio_task.cancel()
             return True
         return False
     
     async def cleanup_finished_tasks(self, keep_hours: int = 24):
         """完了したタスクをクリーンアップ"""
-        cutoff_time = datetime.now(timezone.utc).timestamp() - (keep_hours * 3600)
-        
-        async with self._lock:
-            tasks_to_remove = []
-            for task_id, progress in self._tasks.items():
-                if (progress.is_finished and 
-                    progress.completed_at and 
-                    progress.completed_at.timestamp() < cutoff_time):
-                    tasks_to_remove.append(task_id)
-            
-            for task_id in tasks_to_remove:
-                del self._tasks[task_id]
-                if task_id in self._progress_callbacks:
-                    del self._progress_callbacks[task_id]
+        cutoff_time = time.time() - (keep_hours * 3600)
+
+        # スナップショットを走査してから削除する（イテレーション中の変更を避ける）
+        tasks_to_remove = [
+            (task_id, progress)
+            for task_id, progress in list(self._tasks.items())
+            if (progress.is_finished and
+                progress.completed_at_ts and
+                progress.completed_at_ts < cutoff_time)
+        ]
+
+        for task_id, progress in tasks_to_remove:
+            self._tasks.pop(task_id, None)
+            self._by_status[progress.status].pop(task_id, None)
+            self._subscribers.pop(task_id, None)
+            self._last_notify_ts.pop(task_id, None)
         
         if tasks_to_remove:
             logger.info(f"Cleaned up {len(tasks_to_remove)} finished tasks")
     
-    def add_progress_callback(self, task_id: str, callback: Callable):
-        """進捗更新コールバックを追加"""
-        if task_id in self._progress_callbacks:
-            self._progress_callbacks[task_id].append(callback)
-    
-    def remove_progress_callback(self, task_id: str, callback: Callable):
-        """進捗更新コールバックを削除"""
-        if task_id in self._progress_callbacks and callback in self._progress_callbacks[task_id]:
-            self._progress_callbacks[task_id].remove(callback)
+    def _evict_oldest_finished(self):
+        """最も古い完了済みタスクを1件削除する（辞書は挿入順＝作成順）"""
+        for task_id, progress in self._tasks.items():
+            if progress.is_finished:
+                self._tasks.pop(task_id, None)
+                self._by_status[progress.status].pop(task_id, None)
+                self._subscribers.pop(task_id, None)
+                self._last_notify_ts.pop(task_id, None)
+                return
+
+    async def run_periodic_cleanup(self, interval_seconds: int = 3600):
+        """保持期限切れタスクの掃除を定期実行する（lifespanから起動）"""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.cleanup_finished_tasks()
+            except Exception as e:
+                logger.error(f"Periodic task cleanup failed: {e}")
+
+    def subscribe(self, task_id: str) -> asyncio.Queue:
+        """タスクの進捗購読キューを払い出す
+
+        通知側は各キューへput_nowaitするだけで、購読者の追加・削除は
+        集合操作のO(1)で済む
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(task_id, set()).add(queue)
+
+        # ローカルで実行していないタスクの購読は、Redisミラーが有効なら
+        # 他ワーカーが発行する進捗をPub/Subからこのプロセスへ中継する
+        if (task_id not in self._tasks and
+                task_id not in self._remote_relays and
+                self._use_redis()):
+            self._remote_relays[task_id] = asyncio.create_task(
+                self._relay_remote_progress(task_id)
+            )
+        return queue
+
+    def unsubscribe(self, task_id: str, queue: asyncio.Queue):
+        """購読キューを登録解除する"""
+        subscribers = self._subscribers.get(task_id)
+        if subscribers is not None:
+            subscribers.discard(queue)
+            if not subscribers:
+                del self._subscribers[task_id]
+                relay = self._remote_relays.pop(task_id, None)
+                if relay is not None:
+                    relay.cancel()
+
+    # --- タスク状態のRedisミラー ---------------------------------------
+    # 複数のuvicornワーカーで動かすと、タスクを開始したワーカーと状態照会
+    # ・WebSocket購読がルーティングされるワーカーが一致しない。実行自体
+    # （コルーチン）はプロセスを跨げないためインプロセスのまま、状態だけを
+    # Redisへ複製し、照会と購読をワーカー横断で成立させる。
+    # TASK_STATE_REDIS_ENABLED=true で有効化（単一ワーカーなら不要）
+
+    def _use_redis(self) -> bool:
+        """Redisミラーが有効かどうか（初回呼び出し時に設定を読む）"""
+        if self._redis_enabled is None:
+            try:
+                from app.core.config import settings
+                self._redis_enabled = bool(settings.TASK_STATE_REDIS_ENABLED)
+            except Exception:
+                self._redis_enabled = False
+        return self._redis_enabled
+
+    def _get_redis(self):
+        if self._redis is None:
+            import redis.asyncio as aioredis
+            from app.core.config import settings
+            self._redis = aioredis.from_url(
+                settings.REDIS_URL, decode_responses=True
+            )
+        return self._redis
+
+    async def _mirror_to_redis(self, progress: TaskProgress):
+        """タスク状態をRedisへ書き、更新をPub/Subで配信する"""
+        import orjson
+        try:
+            payload = orjson.dumps(progress.to_dict(), default=str).decode()
+            key = f"task:{progress.task_id}"
+            r = self._get_redis()
+            async with r.pipeline(transaction=False) as pipe:
+                pipe.set(key, payload, ex=self.REDIS_TASK_TTL)
+                pipe.publish(f"{key}:progress", payload)
+                await pipe.execute()
+        except Exception as e:
+            # ミラーは可観測性のための複製。失敗してもタスク実行は止めない
+            logger.warning(f"Redis task mirror failed for {progress.task_id}: {e}")
+
+    async def _fetch_from_redis(self, task_id: str) -> Optional[TaskProgress]:
+        """他ワーカーが書いたタスク状態を復元する"""
+        import orjson
+        try:
+            raw = await self._get_redis().get(f"task:{task_id}")
+        except Exception as e:
+            logger.warning(f"Redis task fetch failed for {task_id}: {e}")
+            return None
+        if not raw:
+            return None
+        return self._progress_from_dict(orjson.loads(raw))
+
+    async def _relay_remote_progress(self, task_id: str):
+        """他ワーカーの進捗をPub/Subで受け、ローカル購読キューへ流す"""
+        import orjson
+        channel = f"task:{task_id}:progress"
+        try:
+            pubsub = self._get_redis().pubsub()
+            await pubsub.subscribe(channel)
+            try:
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    progress = self._progress_from_dict(
+                        orjson.loads(message["data"])
+                    )
+                    for queue in self._subscribers.get(task_id, ()):
+                        queue.put_nowait(progress)
+                    if progress.is_finished:
+                        break
+            finally:
+                await pubsub.unsubscribe(channel)
+                await pubsub.aclose()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Redis progress relay failed for {task_id}: {e}")
+        finally:
+            self._remote_relays.pop(task_id, None)
+
+    @staticmethod
+    def _progress_from_dict(data: Dict[str, Any]) -> TaskProgress:
+        """to_dict()の出力からTaskProgressを復元する"""
+        def _iso_to_ts(value: Optional[str]) -> Optional[float]:
+            return datetime.fromisoformat(value).timestamp() if value else None
+
+        return TaskProgress(
+            task_id=data["task_id"],
+            status=TaskStatus(data["status"]),
+            current=data.get("current", 0),
+            total=data.get("total", 0),
+            message=data.get("message", ""),
+            result=data.get("result"),
+            error=data.get("error"),
+            created_at_ts=_iso_to_ts(data.get("created_at")) or 0.0,
+            started_at_ts=_iso_to_ts(data.get("started_at")),
+            completed_at_ts=_iso_to_ts(data.get("completed_at")),
+            progress_details=data.get("progress_details") or {},
+        )
 
 # グローバルタスクマネージャーインスタンス
 task_manager = BackgroundTaskManager()
\ No newline at end of file
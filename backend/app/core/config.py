@@ -1,4 +1,6 @@
-from typing import List, Optional
+from functools import cached_property
+from typing import List, Optional, Tuple
+from urllib.parse import urlparse
 from pydantic_settings import BaseSettings
 from pydantic import AnyHttpUrl, field_validator
 import secrets
@@ -22,6 +24,14 @@ class Settings(BaseSettings):
     
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
+
+    # スクレイピング実行を外部arqワーカーへ委譲するか（要Redis + arqワーカー起動）
+    SCRAPING_TASK_QUEUE_ENABLED: bool = False
+
+    # バックグラウンドタスクの状態をRedisへ複製するか。
+    # uvicornを複数ワーカーで動かす場合に有効化すると、タスクを実行して
+    # いないワーカーでも状態照会・進捗購読に応答できる（単一ワーカーなら不要）
+    TASK_STATE_REDIS_ENABLED: bool = False
     
     # CORS
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = []
@@ -45,18 +55,17 @@ class Settings(BaseSettings):
             return v
         return []
     
-    @property
-    def ALLOWED_HOSTS(self) -> List[str]:
+    @cached_property
+    def ALLOWED_HOSTS(self) -> Tuple[str, ...]:
+        # TrustedHostMiddleware経由でリクエストごとに参照されるため、
+        # オリジンのurlparseは初回アクセスの1回だけにする
         hosts = ["localhost", "127.0.0.1"]
         if self.BACKEND_CORS_ORIGINS:
             for origin in self.BACKEND_CORS_ORIGINS:
-                if isinstance(origin, str):
-                    # Extract hostname from URL
-                    from urllib.parse import urlparse
-                    parsed = urlparse(origin)
-                    if parsed.hostname:
-                        hosts.append(parsed.hostname)
-        return hosts
+                parsed = urlparse(str(origin))
+                if parsed.hostname:
+                    hosts.append(parsed.hostname)
+        return tuple(hosts)
     
     # Anthropic API
     ANTHROPIC_API_KEY: Optional[str] = None
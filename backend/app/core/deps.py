@@ -1,24 +1,66 @@
+import hashlib
+import logging
+import time
+from collections import OrderedDict
 from typing import Generator, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from app.db.database import get_db
 from app.services.auth_service import AuthService
+from app.services.report_service import ReportService
 from app.models.user import User
 
+logger = logging.getLogger(__name__)
+
 security = HTTPBearer()
 
+# トークン -> 認証済みユーザーの短期キャッシュ
+# トークンは24時間有効なので、60秒のTTLでもアクティブなセッションの
+# 認証DBクエリをほぼ消せる。権限・有効状態の変更反映は最大60秒遅れる
+_AUTH_CACHE_TTL = 60
+_AUTH_CACHE_MAX = 10_000
+_auth_cache: OrderedDict = OrderedDict()
+
+
+def _token_key(token: str) -> bytes:
+    """トークンのキャッシュキー（生トークンをメモリに残さない）"""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
 def get_current_user(
     db: Session = Depends(get_db),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> User:
-    print(f"🔐 get_current_user called with token: {credentials.credentials[:50]}...")
+    # 意図的に同期defのまま。FastAPIはdefの依存関係をスレッドプールで
+    # 実行するため、JWTデコードと同期DBクエリがイベントループを塞がない。
+    # async defに変えるとDBラウンドトリップ中ループ全体が止まる
+    # 認証は全リクエストが通る経路。printはstdoutロックとflushで
+    # 並行ハンドラを直列化するため、デバッグレベルのロガーに限定する
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"get_current_user called with token: {credentials.credentials[:50]}...")
+
+    key = _token_key(credentials.credentials)
+    now = time.monotonic()
+    cached = _auth_cache.get(key)
+    if cached is not None and cached[0] > now:
+        _auth_cache.move_to_end(key)
+        # SELECTを発行せずにリクエストのセッションへ取り込む
+        return db.merge(cached[1], load=False)
+
     try:
         user = AuthService.get_current_user(db, credentials.credentials)
-        print(f"✅ Authentication successful for user: {user.email}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Authentication successful for user: {user.email}")
+
+        _auth_cache[key] = (now + _AUTH_CACHE_TTL, user)
+        _auth_cache.move_to_end(key)
+        while len(_auth_cache) > _AUTH_CACHE_MAX:
+            _auth_cache.popitem(last=False)
+
         return user
     except Exception as e:
-        print(f"❌ Authentication failed: {e}")
+        logger.debug(f"Authentication failed: {e}")
         raise
 
 def get_current_admin_user(
@@ -40,4 +82,7 @@ def get_optional_current_user(
     try:
         return AuthService.get_current_user(db, credentials.credentials)
     except HTTPException:
-        return None
\ No newline at end of file
+        return None
+def get_report_service(db: Session = Depends(get_db)) -> ReportService:
+    """リクエストスコープのReportServiceを提供する"""
+    return ReportService(db)
@@ -0,0 +1,64 @@
+import logging
+import threading
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.utils.bloom import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+# フィルタの想定容量。記事数がこれを超えても偽陽性率が上がるだけで、
+# 偽陰性（登録済みURLの見逃し）は発生しない
+_EXPECTED_URLS = 200_000
+
+
+class URLBloom:
+    """既知記事URLのプロセス内Bloomフィルタ
+
+    重複チェックでDBに問い合わせる前段として使う。
+    「含まれない」判定は確定なのでその候補はDBを完全にスキップでき、
+    「含まれるかもしれない」候補だけをINクエリで確認すればよい。
+    ロード完了前はすべて「含まれるかもしれない」を返して安全側に倒す
+    """
+
+    def __init__(self):
+        self._filter: Optional[BloomFilter] = None
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._filter is not None
+
+    def load_from_db(self, db: Session) -> int:
+        """既存記事のURLをストリーミングで読み込んでフィルタを構築する"""
+        from app.models.article import Article
+
+        bloom = BloomFilter(expected_items=_EXPECTED_URLS)
+        count = 0
+        for (url,) in db.query(Article.url).yield_per(10000):
+            if url:
+                bloom.add(url)
+                count += 1
+
+        with self._lock:
+            self._filter = bloom
+        logger.info(f"URL bloom filter loaded with {count} known URLs")
+        return count
+
+    def add(self, url: str) -> None:
+        """記事の新規登録時に呼び、フィルタを最新の状態に保つ"""
+        if url and self._filter is not None:
+            with self._lock:
+                self._filter.add(url)
+
+    def maybe_contains(self, url: str) -> bool:
+        """urlが登録済みの可能性があればTrue（Falseなら確実に未登録）"""
+        bloom = self._filter
+        if bloom is None:
+            return True
+        return url in bloom
+
+
+# プロセス全体で共有するシングルトン
+url_bloom = URLBloom()
@@ -3,7 +3,8 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI)
+# query_cache_size を増やして、コンパイル済みSQLのキャッシュヒット率を上げる
+engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, future=True, query_cache_size=1200)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
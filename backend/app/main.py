@@ -1,63 +1,125 @@
+import asyncio
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from contextlib import asynccontextmanager
 from app.core.config import settings
-from app.api import auth, articles, scraping, llm, export, reports, prompt_templates, admin, rss, email, report_schedules, usage
+
+
+def _mount_routers(app: FastAPI) -> None:
+    """APIルーターを登録する
+
+    ルーターのインポートはSQLAlchemyモデル・Anthropicクライアント・
+    スクレイパーなどを連鎖的に読み込むため、モジュールロード時ではなく
+    起動処理の中で行い、コールドスタート時の/health応答を早める
+    """
+    from app.api import auth, articles, scraping, llm, export, reports, prompt_templates, admin, rss, email, report_schedules, usage
+
+    app.include_router(auth.router, prefix="/api/auth", tags=["authentication"])
+    app.include_router(articles.router, prefix="/api/articles", tags=["articles"])
+    app.include_router(scraping.router, prefix="/api/scrape", tags=["scraping"])
+    app.include_router(llm.router, prefix="/api/llm", tags=["llm"])
+    app.include_router(export.router, prefix="/api/export", tags=["export"])
+    app.include_router(reports.router, prefix="/api/reports", tags=["reports"])
+    app.include_router(prompt_templates.router, prefix="/api/prompt-templates", tags=["prompt_templates"])
+    app.include_router(admin.router, prefix="/api/admin", tags=["admin"])
+    app.include_router(rss.router, prefix="/api/rss", tags=["rss"])
+    app.include_router(email.router, prefix="/api/email", tags=["email"])
+    app.include_router(report_schedules.router, prefix="/api/report-schedules", tags=["report_schedules"])
+    app.include_router(usage.router, prefix="/api/usage", tags=["usage"])
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """アプリケーションのライフサイクル管理"""
     # 起動時の処理
-    print("=== APPLICATION STARTUP ===")
-    
+    import logging
+
+    logger = logging.getLogger(__name__)
+    logger.info("=== APPLICATION STARTUP ===")
+
+    # API routes（ここで初めて重いモジュール群をインポートする）
+    _mount_routers(app)
+
     from app.services.scheduler_service import scheduler_service
     from app.services.report_scheduler_service import report_scheduler_service
     from app.services.llm_service import llm_service
-    import logging
-    
-    logger = logging.getLogger(__name__)
-    
-    print(f"=== LLM service initialized: {llm_service.is_available()} ===")
+
     logger.info(f"LLM service initialized: {llm_service.is_available()}")
-    
-    # RSSスケジューラーを開始
-    try:
-        print("=== Starting RSS scheduler ===")
-        await scheduler_service.start_scheduler()
-        print(f"=== RSS scheduler started: {scheduler_service.is_running} ===")
-        print(f"=== Loaded schedules: {len(scheduler_service.schedules)} ===")
-        logger.info("RSS scheduler started successfully")
-    except Exception as e:
-        print(f"=== Failed to start RSS scheduler: {e} ===")
-        logger.error(f"Failed to start RSS scheduler: {e}")
-    
-    # レポートスケジューラーを開始
+
+    # 両スケジューラーは独立したI/O処理なので並行に起動する
+    rss_result, report_result = await asyncio.gather(
+        scheduler_service.start_scheduler(),
+        report_scheduler_service.start_scheduler(),
+        return_exceptions=True
+    )
+
+    if isinstance(rss_result, Exception):
+        logger.error(f"Failed to start RSS scheduler: {rss_result}")
+    else:
+        logger.info(
+            f"RSS scheduler started: {scheduler_service.is_running} "
+            f"(schedules: {len(scheduler_service.schedules)})"
+        )
+
+    if isinstance(report_result, Exception):
+        logger.error(f"Failed to start report scheduler: {report_result}")
+    else:
+        logger.info(f"Report scheduler started: {report_scheduler_service.is_running}")
+
+    # 既知記事URLのBloomフィルタを構築（重複チェックのDB前段キャッシュ）
     try:
-        print("=== Starting Report scheduler ===")
-        await report_scheduler_service.start_scheduler()
-        print(f"=== Report scheduler started: {report_scheduler_service.is_running} ===")
-        logger.info("Report scheduler started successfully")
+        from app.core.url_bloom import url_bloom
+        from app.db.database import SessionLocal
+
+        def _load_url_bloom():
+            db = SessionLocal()
+            try:
+                return url_bloom.load_from_db(db)
+            finally:
+                db.close()
+
+        loaded = await asyncio.to_thread(_load_url_bloom)
+        logger.info(f"URL bloom filter loaded: {loaded} URLs")
     except Exception as e:
-        print(f"=== Failed to start Report scheduler: {e} ===")
-        logger.error(f"Failed to start report scheduler: {e}")
-    
-    print("=== APPLICATION STARTUP COMPLETE ===")
-    
+        logger.error(f"Failed to load URL bloom filter: {e}")
+
+    # 完了済みバックグラウンドタスクの定期クリーンアップ（1時間ごと）
+    from app.core.background_tasks import task_manager
+    cleanup_task = asyncio.create_task(task_manager.run_periodic_cleanup())
+
+    logger.info("=== APPLICATION STARTUP COMPLETE ===")
+
     yield  # アプリケーション実行
-    
+
     # 終了時の処理
-    print("=== APPLICATION SHUTDOWN ===")
+    logger.info("=== APPLICATION SHUTDOWN ===")
+    cleanup_task.cancel()
+    stop_results = await asyncio.gather(
+        scheduler_service.stop_scheduler(),
+        report_scheduler_service.stop_scheduler(),
+        return_exceptions=True
+    )
+    for result in stop_results:
+        if isinstance(result, Exception):
+            logger.error(f"Failed to stop scheduler: {result}")
+    logger.info("Schedulers stopped")
+
+    # スクレイパーの共有HTTPセッションを閉じる
     try:
-        await scheduler_service.stop_scheduler()
-        await report_scheduler_service.stop_scheduler()
-        logger.info("Schedulers stopped successfully")
+        from app.utils.web_scraper import close_shared_session
+        await close_shared_session()
     except Exception as e:
-        logger.error(f"Failed to stop schedulers: {e}")
-    print("=== APPLICATION SHUTDOWN COMPLETE ===")
+        logger.error(f"Failed to close shared HTTP session: {e}")
+    logger.info("=== APPLICATION SHUTDOWN COMPLETE ===")
 
 app = FastAPI(
     lifespan=lifespan,
+    # orjsonでのレスポンスシリアライズ（stdlib jsonの数倍速く、
+    # datetime/UUIDをネイティブに扱える）
+    default_response_class=ORJSONResponse,
     title="ITニュース管理システム",
     description="ITニュースの効率的な収集・管理・活用システム",
     version="1.0.0",
@@ -88,21 +150,6 @@ app.add_middleware(
 #     allowed_hosts=settings.ALLOWED_HOSTS
 # )
 
-# API routes
-app.include_router(auth.router, prefix="/api/auth", tags=["authentication"])
-app.include_router(articles.router, prefix="/api/articles", tags=["articles"])
-app.include_router(scraping.router, prefix="/api/scrape", tags=["scraping"])
-app.include_router(llm.router, prefix="/api/llm", tags=["llm"])
-app.include_router(export.router, prefix="/api/export", tags=["export"])
-app.include_router(reports.router, prefix="/api/reports", tags=["reports"])
-app.include_router(prompt_templates.router, prefix="/api/prompt-templates", tags=["prompt_templates"])
-app.include_router(admin.router, prefix="/api/admin", tags=["admin"])
-app.include_router(rss.router, prefix="/api/rss", tags=["rss"])
-app.include_router(email.router, prefix="/api/email", tags=["email"])
-app.include_router(report_schedules.router, prefix="/api/report-schedules", tags=["report_schedules"])
-app.include_router(usage.router, prefix="/api/usage", tags=["usage"])
-
-
 # API エンドポイント
 @app.get("/")
 async def root():
@@ -1,13 +1,23 @@
 import uuid
-from sqlalchemy import Column, String, Text, DateTime, Boolean, ForeignKey, JSON
+from sqlalchemy import Column, String, Text, DateTime, Boolean, ForeignKey, Index, JSON, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 
 class Article(Base):
     __tablename__ = "articles"
+    # 一覧・検索の定番パターン（ソース別の新着、ユーザー別の作成順）を
+    # 複合インデックスで支える。tagsのGINインデックス（jsonbキャスト式）
+    # はモデルでは表現できないためマイグレーション側で作成している
+    __table_args__ = (
+        Index('ix_articles_source_pubdate', 'source', 'published_date'),
+        Index('ix_articles_createdby_created', 'created_by', 'created_at'),
+    )
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    # ネイティブUUID型で16バイト格納（36バイト文字列比でインデックスが半減）。
+    # as_uuid=FalseなのでPython側は従来どおり文字列のまま扱える
+    id = Column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4()))
     title = Column(String(500), nullable=False)
     content = Column(Text)
     url = Column(String(1000), unique=True, nullable=False, index=True)
@@ -16,7 +26,7 @@ class Article(Base):
     scraped_date = Column(DateTime(timezone=True), server_default=func.now())
     tags = Column(JSON)
     summary = Column(Text)
-    created_by = Column(String(36), ForeignKey("users.id"))
+    created_by = Column(UUID(as_uuid=False), ForeignKey("users.id"))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
@@ -27,16 +37,17 @@ class Article(Base):
 class UserFavorite(Base):
     __tablename__ = "user_favorites"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    article_id = Column(String(36), ForeignKey("articles.id", ondelete="CASCADE"), nullable=False)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(UUID(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    article_id = Column(UUID(as_uuid=False), ForeignKey("articles.id", ondelete="CASCADE"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
     user = relationship("User", back_populates="favorites")
     article = relationship("Article", back_populates="favorites")
     
-    # Unique constraint
+    # 同一記事の重複お気に入りをDBレベルで防ぎ、
+    # 「お気に入り済みか」の判定をユニークインデックスの直接参照にする
     __table_args__ = (
-        {"schema": None},  # Add unique constraint in migration
+        UniqueConstraint('user_id', 'article_id', name='uq_user_favorite'),
     )
\ No newline at end of file
@@ -1,6 +1,7 @@
 import uuid
 from datetime import datetime
 from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Integer, Float
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.database import Base
@@ -8,7 +9,7 @@ from app.db.database import Base
 class PromptTemplate(Base):
     __tablename__ = "prompt_templates"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4()))
     name = Column(String(100), nullable=False)
     description = Column(Text)
     
@@ -27,7 +28,7 @@ class PromptTemplate(Base):
     type = Column(String(50), nullable=True)  # template_typeのエイリアス
     
     is_active = Column(Boolean, default=True)
-    created_by = Column(String(36), ForeignKey("users.id"))
+    created_by = Column(UUID(as_uuid=False), ForeignKey("users.id"))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
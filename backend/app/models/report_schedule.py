@@ -1,28 +1,59 @@
+import re
 import uuid
+from functools import cached_property
 from datetime import datetime, time, timedelta
-from sqlalchemy import Column, String, DateTime, Boolean, JSON, ForeignKey, Time, func
+from sqlalchemy import Column, String, SmallInteger, DateTime, Boolean, JSON, ForeignKey, Index, Time, UniqueConstraint, func, text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 
+# テンプレート変数（{date} など）のパターン。キーごとにstr.replaceで
+# 全文を走査し直すのではなく、1パスの正規表現置換でまとめて埋める
+_TEMPLATE_VAR_RE = re.compile(r'\{[a-z_]+\}')
+
+
+def _render_template(template: str, replacements: dict) -> str:
+    """テンプレート変数を1パスで置換する（未知の変数はそのまま残す）"""
+    return _TEMPLATE_VAR_RE.sub(
+        lambda m: str(replacements.get(m.group(0), m.group(0))), template
+    )
+
 
 class ReportScheduleConfig(Base):
     """レポート自動生成スケジュール設定モデル"""
     __tablename__ = "report_schedule_configs"
+    # スケジューラーのポーリング（enabled AND next_scheduled_at <= now()）を
+    # 有効行だけの部分インデックスのレンジスキャンで返す
+    __table_args__ = (
+        Index(
+            'ix_rsc_due', 'next_scheduled_at',
+            postgresql_where=text('enabled = true'),
+        ),
+        # 毎分のポーリング（enabled AND schedule_time = 現在分）用
+        Index(
+            'ix_rsc_poll_time', 'schedule_time',
+            postgresql_where=text('enabled = true'),
+        ),
+        # 同一ユーザー内でスケジュール名を一意にし、
+        # (所有者, 名前) での照会を単一行プローブにする
+        UniqueConstraint('created_by', 'name', name='uq_rsc_owner_name'),
+    )
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), index=True)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4()), index=True)
     
     # 基本設定
-    name = Column(String, nullable=False, index=True)  # スケジュール名
+    name = Column(String, nullable=False)  # スケジュール名（単独インデックスはuq_rsc_owner_nameが兼ねる）
     description = Column(String, nullable=True)  # 説明
-    enabled = Column(Boolean, default=True, nullable=False, index=True)  # 有効/無効
+    enabled = Column(Boolean, default=True, nullable=False)  # 有効/無効（単独インデックスはix_rsc_dueに置き換え）
     
     # スケジュール設定
     schedule_type = Column(String, nullable=False, index=True)  # "daily", "weekly", "monthly"
     schedule_time = Column(Time, nullable=False)  # 実行時刻
-    # weekly用: 曜日 (0=月曜, 6=日曜)
-    weekday = Column(String, nullable=True)  # "0" for Monday (週次レポート用)
-    # monthly用: 日付 (1-31)  
-    day_of_month = Column(String, nullable=True)  # "1" for 1st day (月次レポート用)
+    # weekly用: 曜日 (0=月曜, 6=日曜)。文字列だと読むたびint()変換と
+    # 例外処理が必要になるのでsmallintで持つ
+    weekday = Column(SmallInteger, nullable=True)  # 0 for Monday (週次レポート用)
+    # monthly用: 日付 (1-31)
+    day_of_month = Column(SmallInteger, nullable=True)  # 1 for 1st day (月次レポート用)
     
     # レポート設定
     report_type = Column(String, nullable=False)  # "summary", "tag_analysis", "source_analysis", "trend_analysis"
@@ -34,7 +65,7 @@ class ReportScheduleConfig(Base):
     sources_filter = Column(JSON, nullable=True)  # ソースフィルター
     
     # プロンプトテンプレート設定
-    prompt_template_id = Column(String(36), nullable=True)  # カスタムプロンプトテンプレートID
+    prompt_template_id = Column(UUID(as_uuid=False), nullable=True)  # カスタムプロンプトテンプレートID
     
     # メール送信設定
     email_enabled = Column(Boolean, default=False, nullable=False)  # メール送信有効/無効
@@ -48,35 +79,44 @@ class ReportScheduleConfig(Base):
     next_scheduled_at = Column(DateTime(timezone=True), nullable=True, index=True)  # 次回実行予定日時
     
     # 作成・更新情報
-    created_by = Column(String(36), ForeignKey("users.id"), nullable=False)
+    created_by = Column(UUID(as_uuid=False), ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # リレーション
-    creator = relationship("User", back_populates="report_schedules")
+    # 一覧表示で行ごとのユーザーSELECT（N+1）にならないようJOINで同時取得
+    # created_byはNOT NULLなのでINNER JOINにできる（プランナーに有利）
+    creator = relationship("User", back_populates="report_schedules", lazy="joined", innerjoin=True)
     
     def __repr__(self):
         return f"<ReportScheduleConfig(id={self.id}, name='{self.name}', type='{self.schedule_type}', enabled={self.enabled})>"
     
-    @property 
+    # ロード済み行の不変カラムだけから決まる値なので、同一インスタンス内の
+    # 再計算（シリアライズ時の複数回アクセス）をcached_propertyで省く
+    @cached_property
     def schedule_display(self) -> str:
         """スケジュール表示用文字列"""
-        time_str = self.schedule_time.strftime('%H:%M')
+        # f-stringのゼロ埋めはstrftimeの書式パース・ロケール参照なしで済む
+        time_str = f"{self.schedule_time.hour:02d}:{self.schedule_time.minute:02d}"
         
         if self.schedule_type == "daily":
             return f"毎日 {time_str}"
         elif self.schedule_type == "weekly":
             weekdays = ["月", "火", "水", "木", "金", "土", "日"]
-            weekday_name = weekdays[int(self.weekday)] if self.weekday else "月"
+            weekday_name = weekdays[self.weekday] if self.weekday is not None else "月"
             return f"毎週{weekday_name}曜日 {time_str}"
         elif self.schedule_type == "monthly":
-            day = self.day_of_month or "1"
+            day = self.day_of_month if self.day_of_month is not None else 1
             return f"毎月{day}日 {time_str}"
         else:
             return f"{self.schedule_type} {time_str}"
     
     def get_date_range_days(self) -> int:
         """日付範囲の日数を取得"""
+        return self._date_range_days_value
+
+    @cached_property
+    def _date_range_days_value(self) -> int:
         if self.date_range_days:
             try:
                 return int(self.date_range_days)
@@ -154,12 +194,8 @@ class ReportScheduleConfig(Base):
                 '{prev_month_name}': f"{prev_month_year}年{prev_month}月"
             })
         
-        # 文字列置換
-        result = template
-        for key, value in replacements.items():
-            result = result.replace(key, str(value))
-        
-        return result
+        # 文字列置換（1パス）
+        return _render_template(template, replacements)
     
     def generate_email_subject(self, generated_at: datetime) -> str:
         """メール件名を生成"""
@@ -175,10 +211,7 @@ class ReportScheduleConfig(Base):
                 '{name}': self.name
             }
             
-            result = template
-            for key, value in replacements.items():
-                result = result.replace(key, str(value))
-            return result
+            return _render_template(template, replacements)
         else:
             # デフォルトの件名
             report_title = self.generate_report_title(generated_at)
@@ -1,6 +1,7 @@
 import uuid
 from datetime import datetime
 from sqlalchemy import Column, String, DateTime, Text, JSON, ForeignKey, func
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 
@@ -8,7 +9,7 @@ class SavedReport(Base):
     """保存されたレポートモデル"""
     __tablename__ = "saved_reports"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), index=True)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4()), index=True)
     
     # レポート基本情報
     title = Column(String, nullable=False, index=True)
@@ -24,12 +25,14 @@ class SavedReport(Base):
     tags = Column(JSON, nullable=True)  # レポートのタグ
     
     # 作成者・日時
-    created_by = Column(String(36), ForeignKey("users.id"), nullable=False)
+    created_by = Column(UUID(as_uuid=False), ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # リレーション
-    creator = relationship("User", back_populates="saved_reports")
+    # 一覧表示で行ごとのユーザーSELECT（N+1）にならないようJOINで同時取得
+    # created_byはNOT NULLなのでINNER JOINにできる（プランナーに有利）
+    creator = relationship("User", back_populates="saved_reports", lazy="joined", innerjoin=True)
     
     def __repr__(self):
         return f"<SavedReport(id={self.id}, title='{self.title}', type='{self.report_type}')>"
\ No newline at end of file
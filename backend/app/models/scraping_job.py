@@ -1,4 +1,5 @@
-from sqlalchemy import Column, String, Integer, DateTime, Text, JSON, ForeignKey, func
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, JSON, ForeignKey, func
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 from datetime import datetime
@@ -9,13 +10,13 @@ class ScrapingJob(Base):
     __tablename__ = "scraping_jobs"
     __table_args__ = {'extend_existing': True}
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(UUID(as_uuid=False), ForeignKey("users.id"), nullable=False)
     
     # ジョブ設定
     urls = Column(JSON, nullable=False)  # スクレイピング対象URL一覧（JSON array）
-    auto_generate_tags = Column(String(5), default="true")  # 自動タグ生成フラグ（文字列で保存）
-    skip_duplicates = Column(String(5), default="true")  # 重複スキップフラグ（文字列で保存）
+    auto_generate_tags = Column(Boolean, default=True, nullable=False)  # 自動タグ生成フラグ
+    skip_duplicates = Column(Boolean, default=True, nullable=False)  # 重複スキップフラグ
     
     # ジョブ状態
     status = Column(String(20), default="pending")  # pending, running, completed, failed
@@ -35,44 +36,30 @@ class ScrapingJob(Base):
     completed_at = Column(DateTime(timezone=True))
     
     # リレーション
-    user = relationship("User", back_populates="scraping_jobs")
-    
-    @property
-    def auto_generate_tags_bool(self) -> bool:
-        """自動タグ生成フラグをbooleanで取得"""
-        return self.auto_generate_tags == "true"
-    
-    @auto_generate_tags_bool.setter
-    def auto_generate_tags_bool(self, value: bool):
-        """自動タグ生成フラグをbooleanで設定"""
-        self.auto_generate_tags = "true" if value else "false"
-    
-    @property
-    def skip_duplicates_bool(self) -> bool:
-        """重複スキップフラグをbooleanで取得"""
-        return self.skip_duplicates == "true"
-    
-    @skip_duplicates_bool.setter
-    def skip_duplicates_bool(self, value: bool):
-        """重複スキップフラグをbooleanで設定"""
-        self.skip_duplicates = "true" if value else "false"
+    # ジョブ一覧から所有者を辿るときのN+1を避けるためJOINで同時取得
+    user = relationship("User", back_populates="scraping_jobs", lazy="joined")
     
     def to_dict(self):
-        """辞書形式での出力"""
+        """辞書形式での出力
+
+        id/user_idは元からstr、JSONカラムはdefault=listで埋まるため
+        変換や`or []`の防御は不要。datetimeはorjsonレスポンスが
+        ネイティブにISO 8601へシリアライズする
+        """
         return {
-            "id": str(self.id),
-            "user_id": str(self.user_id),
-            "urls": self.urls or [],
-            "auto_generate_tags": self.auto_generate_tags_bool,
-            "skip_duplicates": self.skip_duplicates_bool,
+            "id": self.id,
+            "user_id": self.user_id,
+            "urls": self.urls,
+            "auto_generate_tags": self.auto_generate_tags,
+            "skip_duplicates": self.skip_duplicates,
             "status": self.status,
             "progress": self.progress,
             "total": self.total,
-            "completed_urls": self.completed_urls or [],
-            "failed_urls": self.failed_urls or [],
+            "completed_urls": self.completed_urls,
+            "failed_urls": self.failed_urls,
             "error_message": self.error_message,
-            "created_article_ids": self.created_article_ids or [],
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None
+            "created_article_ids": self.created_article_ids,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "completed_at": self.completed_at
         }
\ No newline at end of file
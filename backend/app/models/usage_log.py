@@ -1,19 +1,30 @@
 import uuid
 from datetime import datetime, date
-from sqlalchemy import Column, String, DateTime, Date, ForeignKey, Text
+from sqlalchemy import Column, String, DateTime, Date, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 
 class UsageLog(Base):
     __tablename__ = "usage_logs"
+    # 使用状況の照会は常に「ユーザー×期間」で絞るため複合インデックスを張る。
+    # テーブルは単調増加するため月単位のレンジパーティションで分割し、
+    # クォータ照会のスキャンを直近パーティションに限定する
+    # （パーティションキーはPKに含める必要があるためusage_dateもPKの一部）
+    __table_args__ = (
+        Index('ix_usage_logs_user_id_usage_date', 'user_id', 'usage_date'),
+        {'postgresql_partition_by': 'RANGE (usage_date)'},
+    )
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(UUID(as_uuid=False), ForeignKey("users.id"), nullable=False)
     action_type = Column(String(50), nullable=False)  # 'report_generation', 'llm_query', etc.
-    usage_date = Column(Date, nullable=False, default=date.today)
+    usage_date = Column(Date, primary_key=True, nullable=False, default=date.today)
     resource_used = Column(String(100))  # 使用したリソース (template_id, model_name など)
-    additional_data = Column(Text)  # 追加情報をJSON文字列として保存
+    # 追加情報。JSONBなのでPython側のdumps/loadsが不要で、
+    # 必要になればキーへの式インデックスも張れる
+    additional_data = Column(JSONB, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
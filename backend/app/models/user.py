@@ -1,5 +1,6 @@
 import uuid
 from sqlalchemy import Column, String, Boolean, DateTime, Text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.database import Base
@@ -7,7 +8,9 @@ from app.db.database import Base
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    # ネイティブUUID型で16バイト格納。as_uuid=FalseなのでPython側は
+    # 従来どおり文字列のまま（JWTのsubやキャッシュキーと互換）
+    id = Column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4()))
     email = Column(String(255), unique=True, index=True, nullable=False)
     hashed_password = Column(String(255), nullable=False)
     is_admin = Column(Boolean, default=False)
@@ -17,8 +20,19 @@ class User(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships (using string references to avoid circular imports)
+    # どのコレクションも読み出し側では使っていない（一覧は各APIが自前の
+    # クエリで取得する）。Userは認証のたびにロードされるので、eagerロードは
+    # 付けない。
+    # favoritesはFKにON DELETE CASCADEがあるため、write_only +
+    # passive_deletesでユーザー削除時もコレクションをロードしない。
+    # 残りはFKにDB側の削除ルールがなく、session.delete(user)のflushが
+    # コレクションを走査してFKを処理する必要があるためdynamicのまま
+    # （write_onlyは走査を禁止するので削除が失敗する）
     articles = relationship("Article", back_populates="creator", lazy="dynamic")
-    favorites = relationship("UserFavorite", back_populates="user", cascade="all, delete-orphan", lazy="dynamic")
+    favorites = relationship(
+        "UserFavorite", back_populates="user",
+        cascade="all, delete-orphan", passive_deletes=True, lazy="write_only"
+    )
     scraping_jobs = relationship("ScrapingJob", back_populates="user", lazy="dynamic")
     prompt_templates = relationship("PromptTemplate", back_populates="creator", lazy="dynamic")
     saved_reports = relationship("SavedReport", back_populates="creator", lazy="dynamic")
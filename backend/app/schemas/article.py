@@ -1,6 +1,6 @@
 from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel, HttpUrl, Field
+from pydantic import BaseModel, ConfigDict, HttpUrl, Field, TypeAdapter
 
 class ArticleBase(BaseModel):
     title: str = Field(..., max_length=500, description="記事タイトル")
@@ -8,7 +8,7 @@ class ArticleBase(BaseModel):
     content: Optional[str] = Field(None, description="記事本文")
     source: Optional[str] = Field(None, max_length=200, description="記事ソース（サイト名）")
     published_date: Optional[datetime] = Field(None, description="記事公開日時")
-    tags: Optional[List[str]] = Field(default=[], description="タグリスト")
+    tags: Optional[List[str]] = Field(default_factory=list, description="タグリスト")
     summary: Optional[str] = Field(None, description="記事要約")
 
 class ArticleCreate(ArticleBase):
@@ -27,15 +27,25 @@ class ArticleUpdate(BaseModel):
 
 class ArticleResponse(ArticleBase):
     """記事レスポンス用スキーマ"""
+    # 読み取り側はDB保存済みの値をそのまま返すだけなので、
+    # 1行ごとのURLパース（HttpUrl検証）を省く。検証は書き込み時
+    # （ArticleCreate/ArticleUpdate）に済んでいる
+    url: str
     id: str
     scraped_date: datetime
     created_by: Optional[str]
     created_at: datetime
     updated_at: datetime
     is_favorite: bool = Field(default=False, description="現在のユーザーのお気に入り状態")
-    
-    class Config:
-        from_attributes = True
+
+    # レスポンスは構築後に書き換えないのでfrozenで固定する
+    # （誤った後付け代入を防ぎ、ハッシュ可能にもなる）
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# 一覧エンドポイント用のバッチバリデータ。1件ずつモデルを組み立てる
+# 代わりにRustコアへリストごと渡す（インポート時に1度だけ構築）
+ARTICLE_LIST_ADAPTER = TypeAdapter(List[ArticleResponse])
 
 class ArticleListResponse(BaseModel):
     """記事一覧レスポンス用スキーマ"""
@@ -46,11 +56,13 @@ class ArticleListResponse(BaseModel):
     has_next: bool
     has_prev: bool
 
+    model_config = ConfigDict(frozen=True)
+
 class ArticleSearchRequest(BaseModel):
     """記事検索リクエスト用スキーマ"""
     query: Optional[str] = Field(None, description="検索クエリ")
     search_mode: str = Field(default="and", description="検索モード: 'and' または 'or'")
-    tags: Optional[List[str]] = Field(default=[], description="タグフィルター")
+    tags: Optional[List[str]] = Field(default_factory=list, description="タグフィルター")
     source: Optional[str] = Field(None, description="ソースフィルター")
     start_date: Optional[datetime] = Field(None, description="開始日時")
     end_date: Optional[datetime] = Field(None, description="終了日時")
@@ -66,4 +78,6 @@ class FavoriteResponse(BaseModel):
     """お気に入りレスポンス用スキーマ"""
     article_id: str
     is_favorite: bool
-    message: str
\ No newline at end of file
+    message: str
+
+    model_config = ConfigDict(frozen=True)
\ No newline at end of file
@@ -34,10 +34,10 @@ class ScrapingJobStatus(BaseModel):
     status: str = Field(..., description="ステータス（pending/running/completed/failed）")
     progress: int = Field(..., description="進捗（処理済み数）")
     total: int = Field(..., description="総URL数")
-    completed_urls: List[str] = Field(default=[], description="処理完了URL一覧")
-    failed_urls: List[Dict[str, str]] = Field(default=[], description="失敗URL一覧（理由付き）")
-    skipped_urls: List[str] = Field(default=[], description="重複でスキップされたURL一覧")
-    created_articles: List[str] = Field(default=[], description="作成された記事ID一覧")
+    completed_urls: List[str] = Field(default_factory=list, description="処理完了URL一覧")
+    failed_urls: List[Dict[str, str]] = Field(default_factory=list, description="失敗URL一覧（理由付き）")
+    skipped_urls: List[str] = Field(default_factory=list, description="重複でスキップされたURL一覧")
+    created_articles: List[str] = Field(default_factory=list, description="作成された記事ID一覧")
     created_at: Optional[datetime] = Field(None, description="作成日時")
     started_at: Optional[datetime] = Field(None, description="開始日時")
     completed_at: Optional[datetime] = Field(None, description="完了日時")
@@ -61,5 +61,13 @@ class URLPreviewResponse(BaseModel):
     description: Optional[str] = Field(None, description="記事説明")
     site_name: Optional[str] = Field(None, description="サイト名")
     is_duplicate: bool = Field(..., description="既存記事との重複フラグ")
-    estimated_tags: List[str] = Field(default=[], description="推定されるタグ")
-    error: Optional[str] = Field(None, description="エラーメッセージ")
\ No newline at end of file
+    estimated_tags: List[str] = Field(default_factory=list, description="推定されるタグ")
+    error: Optional[str] = Field(None, description="エラーメッセージ")
+
+class URLPreviewBatchRequest(BaseModel):
+    """URLプレビュー一括リクエスト"""
+    urls: List[str] = Field(..., min_length=1, max_length=20, description="プレビュー対象URL一覧")
+
+class URLPreviewBatchResponse(BaseModel):
+    """URLプレビュー一括レスポンス"""
+    previews: List[URLPreviewResponse] = Field(..., description="各URLのプレビュー結果（リクエスト順）")
\ No newline at end of file
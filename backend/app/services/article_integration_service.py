@@ -1,9 +1,12 @@
+import asyncio
 import logging
 from typing import List, Dict, Optional, Set
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from datetime import datetime
 import uuid
 
+from app.core.url_bloom import url_bloom
 from app.models.article import Article
 from app.models.scraping_job import ScrapingJob
 from app.models.user import User
@@ -13,6 +16,12 @@ from app.services.llm_service import llm_service
 
 logger = logging.getLogger(__name__)
 
+# バッチ処理でのLLM同時呼び出し数の上限。記事ごとに直列でawaitすると
+# バッチ全体がLLMレイテンシ×件数になるため並行化するが、無制限だと
+# APIのレート制限に当たるのでセマフォで絞る
+_LLM_CONCURRENCY = asyncio.Semaphore(5)
+
+
 class ArticleIntegrationService:
     """記事統合・保存サービス"""
     
@@ -42,14 +51,28 @@ class ArticleIntegrationService:
             "updated_articles": []
         }
         
+        # 既存記事をURLのIN句1回でまとめて引く（1件ずつのSELECTのN+1回避。
+        # 更新経路で属性を書き換えるためORMインスタンスごと取得する）
+        batch_urls = [result.url for result in scraping_results if not result.error]
+        if batch_urls:
+            existing_by_url = {
+                article.url: article
+                for article in self.db.query(Article).filter(Article.url.in_(batch_urls))
+            }
+        else:
+            existing_by_url = {}
+
         for scraped_content in scraping_results:
             try:
                 if scraped_content.error:
                     results["failed_urls"].append(scraped_content.url)
                     continue
-                
+
                 # 記事処理
-                result = await self._process_single_article(scraping_job, scraped_content)
+                result = await self._process_single_article(
+                    scraping_job, scraped_content,
+                    existing_by_url.get(scraped_content.url)
+                )
                 
                 if result["action"] == "created":
                     results["created_articles"].append(result["article_id"])
@@ -64,23 +87,33 @@ class ArticleIntegrationService:
                 logger.exception(f"Failed to process article {scraped_content.url}")
                 results["failed_urls"].append(scraped_content.url)
         
-        # 統計情報を更新
+        # 統計情報を更新し、バッチ全体を1トランザクションでコミットする
+        # （記事ごとのcommit/refreshはWALフラッシュとSELECTを件数分払う）
         await self._update_job_statistics(scraping_job, results)
-        
+
+        try:
+            self.db.commit()
+        except Exception as e:
+            logger.error(f"Error committing scraping results: {e}")
+            self.db.rollback()
+            # コミットに失敗した場合、作成・更新済み扱いのIDはすべて無効
+            for article_id in results["created_articles"]:
+                results["failed_urls"].append(f"rollback_{article_id}")
+            results["created_articles"] = []
+            results["updated_articles"] = []
+
         return results
     
     async def _process_single_article(
         self,
         scraping_job: ScrapingJob,
-        scraped_content: ScrapedContent
+        scraped_content: ScrapedContent,
+        existing_article: Optional[Article]
     ) -> Dict[str, any]:
-        """単一記事の処理"""
-        
-        # 既存記事チェック
-        existing_article = await self._find_existing_article(scraped_content.url)
-        
+        """単一記事の処理（既存記事は呼び出し元がバッチで引いたものを受け取る）"""
+
         if existing_article:
-            if scraping_job.skip_duplicates_bool:
+            if scraping_job.skip_duplicates:
                 return {
                     "action": "duplicate",
                     "article_id": str(existing_article.id),
@@ -105,10 +138,6 @@ class ArticleIntegrationService:
                 "message": "New article created"
             }
     
-    async def _find_existing_article(self, url: str) -> Optional[Article]:
-        """既存記事を検索"""
-        return self.db.query(Article).filter(Article.url == url).first()
-    
     async def _create_new_article(
         self,
         scraped_content: ScrapedContent,
@@ -171,12 +200,13 @@ class ArticleIntegrationService:
             "created_by": scraping_job.user_id
         }
         
-        # 記事作成
+        # 記事作成。commitは呼び出し元がバッチの最後にまとめて行う
+        # （flushでINSERTが飛びPythonデフォルトのidも確定する）
         article = Article(**article_data)
         self.db.add(article)
-        self.db.commit()
-        self.db.refresh(article)
-        
+        self.db.flush()
+        url_bloom.add(article.url)
+
         logger.info(f"Created new article {article.id} from {scraped_content.url}")
         logger.info(f"  - Title: {article.title[:50]}...")
         logger.info(f"  - Tags: {len(article.tags)} items")
@@ -226,8 +256,8 @@ class ArticleIntegrationService:
                 setattr(existing_article, key, value)
             
             existing_article.updated_at = datetime.utcnow()
-            self.db.commit()
-            
+            self.db.flush()
+
             logger.info(f"Updated article {existing_article.id} with {len(updates)} fields")
         
         return existing_article
@@ -245,7 +275,7 @@ class ArticleIntegrationService:
             tags.update(scraped_content.keywords)
         
         # 自動生成タグ
-        if scraping_job.auto_generate_tags_bool and scraped_content.auto_tags:
+        if scraping_job.auto_generate_tags and scraped_content.auto_tags:
             tags.update(scraped_content.auto_tags)
         
         # タグの清浄化
@@ -306,11 +336,9 @@ class ArticleIntegrationService:
             if url not in results["failed_urls"]
         ]
         scraping_job.failed_urls = [
-            f"{url}: Processing failed" for url in results["failed_urls"]
+            {"url": url, "error": "Processing failed"} for url in results["failed_urls"]
         ]
-        
-        self.db.commit()
-        
+
         logger.info(
             f"Job {scraping_job.id} statistics: "
             f"created={len(results['created_articles'])}, "
@@ -477,33 +505,59 @@ class ArticleIntegrationService:
         else:
             existing_url_map = {}
         
+        # エラー・重複を除いた作成対象を先に確定する
+        to_create: List[ScrapedContent] = []
         for scraped_content in scraping_results:
+            if scraped_content.error:
+                results["failed_urls"].append(scraped_content.url)
+            elif scraped_content.url in existing_url_map:
+                results["duplicate_urls"].append(existing_url_map[scraped_content.url])
+                logger.debug(f"Duplicate URL found in batch: {scraped_content.url}")
+            else:
+                to_create.append(scraped_content)
+
+        # LLM要約をセマフォ制限付きで並行生成（1件の失敗でバッチ全体を
+        # 落とさないようreturn_exceptionsで回収し、フォールバックに切替）
+        summaries = await asyncio.gather(
+            *(self._summarize_for_batch(sc) for sc in to_create),
+            return_exceptions=True
+        )
+
+        # 記事の組み立てはCPUだけなので同期でまとめて行う。ORMインスタンス
+        # を経由せず辞書の行を積み、1回のbulk_insert_mappingsでINSERTする
+        # （単位作業・イベントフック・属性管理のオーバーヘッドを省く）
+        rows: List[Dict] = []
+        for scraped_content, summary in zip(to_create, summaries):
             try:
-                if scraped_content.error:
-                    results["failed_urls"].append(scraped_content.url)
-                    continue
-                
-                # バッチ処理用の軽量な重複チェック
-                if scraped_content.url in existing_url_map:
-                    results["duplicate_urls"].append(existing_url_map[scraped_content.url])
-                    logger.debug(f"Duplicate URL found in batch: {scraped_content.url}")
-                    continue
-                
-                # 記事作成処理（LLM要約生成付き）
-                article = await self._create_article_from_scraped_content_batch(
-                    scraped_content, scraping_job
-                )
-                
-                if article:
-                    self.db.add(article)
-                    results["created_articles"].append(str(article.id))
-                    logger.debug(f"Created article in batch: {article.title[:50]}...")
+                if isinstance(summary, BaseException):
+                    logger.error(f"LLM summary generation failed in batch: {summary}")
+                    summary = self._generate_simple_summary(
+                        scraped_content.title, scraped_content.content
+                    )
+
+                row = self._build_article_row(scraped_content, scraping_job, summary)
+
+                if row:
+                    rows.append(row)
+                    url_bloom.add(row["url"])
+                    results["created_articles"].append(row["id"])
+                    logger.debug(f"Created article in batch: {row['title'][:50]}...")
                 else:
                     results["failed_urls"].append(scraped_content.url)
-                
+
             except Exception as e:
                 logger.error(f"Error processing scraped content in batch: {scraped_content.url}: {e}")
                 results["failed_urls"].append(scraped_content.url)
+
+        if rows:
+            # urlのユニークインデックスに乗せたupsert。IN句の事前チェックと
+            # INSERTの間に他のワーカーが同じURLを入れてもIntegrityErrorで
+            # バッチ全体が巻き戻らず、衝突行だけが黙ってスキップされる
+            self.db.execute(
+                pg_insert(Article)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=['url'])
+            )
         
         # バッチ処理の最後にコミット
         try:
@@ -561,46 +615,48 @@ class ArticleIntegrationService:
         else:
             return self._generate_summary(content, max_length)
     
-    async def _create_article_from_scraped_content_batch(
+    async def _summarize_for_batch(self, scraped_content: ScrapedContent) -> str:
+        """バッチ処理用のLLM要約生成（セマフォで同時実行数を制限）"""
+        if not llm_service.is_available():
+            return self._generate_simple_summary(scraped_content.title, scraped_content.content)
+
+        async with _LLM_CONCURRENCY:
+            summary = await llm_service.generate_news_summary(
+                title=scraped_content.title or "",
+                content=scraped_content.content or ""
+            )
+        logger.info(f"Generated LLM summary for batch article: {scraped_content.url}")
+        return summary
+
+    def _build_article_row(
         self,
         scraped_content: ScrapedContent,
-        scraping_job: ScrapingJob
-    ) -> Optional[Article]:
-        """バッチ処理用の記事作成（LLM要約生成付き）"""
+        scraping_job: ScrapingJob,
+        summary: str
+    ) -> Optional[Dict]:
+        """バッチINSERT用の行データを組み立てる（要約は生成済みのものを受け取る）
+
+        bulk_insert_mappingsはPython側のカラムデフォルトを実行しないため、
+        idはここで生成する（created_at等はサーバーデフォルトが埋める）。
+        """
         try:
-            # LLM要約生成
-            summary = ""
-            if llm_service.is_available():
-                try:
-                    summary = await llm_service.generate_news_summary(
-                        title=scraped_content.title or "",
-                        content=scraped_content.content or ""
-                    )
-                    logger.info(f"Generated LLM summary for batch article: {scraped_content.url}")
-                except Exception as e:
-                    logger.error(f"LLM summary generation failed in batch: {e}")
-                    summary = self._generate_simple_summary(scraped_content.title, scraped_content.content)
-            else:
-                summary = self._generate_simple_summary(scraped_content.title, scraped_content.content)
-            
             # タグ処理
             tags = self._process_tags(scraped_content, scraping_job)
-            
+
             # 記事データの準備
-            article = Article(
-                title=scraped_content.title or "無題",
-                content=scraped_content.content or "",
-                url=scraped_content.url,
-                source=scraped_content.site_name or self._extract_domain(scraped_content.url),
-                summary=summary,
-                tags=tags,
-                published_date=scraped_content.published_date,
-                scraped_date=datetime.utcnow(),
-                created_by=scraping_job.user_id
-            )
-            
-            return article
-            
+            return {
+                "id": str(uuid.uuid4()),
+                "title": scraped_content.title or "無題",
+                "content": scraped_content.content or "",
+                "url": scraped_content.url,
+                "source": scraped_content.site_name or self._extract_domain(scraped_content.url),
+                "summary": summary,
+                "tags": tags,
+                "published_date": scraped_content.published_date,
+                "scraped_date": datetime.utcnow(),
+                "created_by": scraping_job.user_id
+            }
+
         except Exception as e:
             logger.error(f"Error creating article from scraped content in batch: {e}")
             return None
\ No newline at end of file
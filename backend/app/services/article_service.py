@@ -7,6 +7,7 @@ from fastapi import HTTPException, status
 import pytz
 from app.models.user import User
 from app.core.config import settings
+from app.core.url_bloom import url_bloom
 from app.models.article import Article, UserFavorite
 from app.schemas.article import ArticleCreate, ArticleUpdate, ArticleSearchRequest
 
@@ -39,7 +40,8 @@ class ArticleService:
         db.add(db_article)
         db.commit()
         db.refresh(db_article)
-        
+        url_bloom.add(db_article.url)
+
         return db_article
 
     @staticmethod
@@ -106,10 +106,23 @@ class ReportSchedulerService:
         current_time_minute = current_time.replace(second=0, microsecond=0)
         current_hour_minute = current_time_minute.time()
         
+        # 時刻の一致判定までSQLに押し込む。毎分のポーリングで全有効行を
+        # ロードする代わりに、現在の分に一致する候補行（通常0件）だけを
+        # 部分インデックス（ix_rsc_poll_time）経由で取得する。
+        # 秒の端数を持つschedule_timeを落とさないよう分単位の範囲で絞る
+        if current_hour_minute.hour == 23 and current_hour_minute.minute == 59:
+            minute_end = time.max
+        else:
+            minute_end = (
+                datetime.combine(current_time.date(), current_hour_minute)
+                + timedelta(minutes=1)
+            ).time()
         schedules = db.query(ReportScheduleConfig).filter(
-            ReportScheduleConfig.enabled == True
+            ReportScheduleConfig.enabled == True,
+            ReportScheduleConfig.schedule_time >= current_hour_minute,
+            ReportScheduleConfig.schedule_time < minute_end
         ).all()
-        
+
         schedules_to_run = []
         
         for schedule in schedules:
@@ -128,7 +141,7 @@ class ReportSchedulerService:
                 
                 # 週次スケジュール
                 elif schedule.schedule_type == "weekly":
-                    weekday = int(schedule.weekday) if schedule.weekday else 0  # デフォルト月曜日
+                    weekday = schedule.weekday if schedule.weekday is not None else 0  # デフォルト月曜日
                     if current_time.weekday() == weekday:
                         # 今週まだ実行されていないかチェック
                         week_start = current_time - timedelta(days=current_time.weekday())
@@ -137,7 +150,7 @@ class ReportSchedulerService:
                 
                 # 月次スケジュール  
                 elif schedule.schedule_type == "monthly":
-                    day_of_month = int(schedule.day_of_month) if schedule.day_of_month else 1
+                    day_of_month = schedule.day_of_month if schedule.day_of_month is not None else 1
                     if current_time.day == day_of_month:
                         # 今月まだ実行されていないかチェック
                         month_start = current_time.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
@@ -325,10 +338,11 @@ class ReportSchedulerService:
             schedule.last_execution_message = success_message
             
             # 次回実行予定時刻を計算・設定
-            next_scheduled = self._calculate_next_execution(schedule, execution_time)
-            schedule.next_scheduled_at = next_scheduled
-            
+            # next_scheduled_atはDBトリガー（rsc_compute_next）が
+            # last_executed_atの更新と同じ行書き込みの中で再計算する
             db.commit()
+            db.refresh(schedule)
+            next_scheduled = schedule.next_scheduled_at
             
             if progress_callback:
                 progress_callback(100, 100, f"完了: {success_message}")
@@ -420,70 +434,6 @@ class ReportSchedulerService:
         
         return start_date, end_date
     
-    def _calculate_next_execution(
-        self, 
-        schedule: ReportScheduleConfig, 
-        current_execution: datetime
-    ) -> Optional[datetime]:
-        """次回実行予定時刻を計算"""
-        
-        try:
-            if schedule.schedule_type == "daily":
-                # 次の日の同じ時刻
-                next_date = current_execution.date() + timedelta(days=1)
-                next_execution = datetime.combine(
-                    next_date, 
-                    schedule.schedule_time
-                ).replace(tzinfo=timezone.utc)
-                
-            elif schedule.schedule_type == "weekly":
-                # 来週の同じ曜日・時刻
-                next_execution = current_execution + timedelta(days=7)
-                next_execution = next_execution.replace(
-                    hour=schedule.schedule_time.hour,
-                    minute=schedule.schedule_time.minute,
-                    second=0,
-                    microsecond=0
-                )
-                
-            elif schedule.schedule_type == "monthly":
-                # 来月の同じ日・時刻
-                current_month = current_execution.month
-                current_year = current_execution.year
-                
-                if current_month == 12:
-                    next_month = 1
-                    next_year = current_year + 1
-                else:
-                    next_month = current_month + 1
-                    next_year = current_year
-                
-                day_of_month = int(schedule.day_of_month) if schedule.day_of_month else 1
-                
-                # 月末日チェック
-                import calendar
-                max_day = calendar.monthrange(next_year, next_month)[1]
-                if day_of_month > max_day:
-                    day_of_month = max_day
-                
-                next_execution = datetime(
-                    year=next_year,
-                    month=next_month,
-                    day=day_of_month,
-                    hour=schedule.schedule_time.hour,
-                    minute=schedule.schedule_time.minute,
-                    tzinfo=timezone.utc
-                )
-            else:
-                # その他の場合は計算しない
-                return None
-            
-            return next_execution
-            
-        except Exception as e:
-            logger.warning(f"Failed to calculate next execution for schedule {schedule.id}: {e}")
-            return None
-    
     async def get_running_tasks(self) -> Dict[str, str]:
         """実行中タスク一覧を取得"""
         return self.running_tasks.copy()
@@ -2,7 +2,7 @@ import logging
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta, timezone
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, and_, or_
+from sqlalchemy import func, desc, and_, or_, select, lambda_stmt
 import csv
 import io
 import uuid
@@ -1362,27 +1362,34 @@ Markdown形式で出力してください。
         limit: Optional[int] = None,
         offset: int = 0
     ) -> List[SavedReport]:
-        """保存されたレポート一覧を取得"""
-        query = self.db.query(SavedReport)
-        
+        """保存されたレポート一覧を取得
+
+        lambda_stmt でステートメント構築をキャッシュし、
+        リクエスト毎のSQLコンパイルコストを削減する
+        """
+        stmt = lambda_stmt(lambda: select(SavedReport))
+
         if user:
-            query = query.filter(SavedReport.created_by == user.id)
-        
-        query = query.order_by(SavedReport.created_at.desc()).offset(offset)
-        
+            user_id = str(user.id)
+            stmt += lambda s: s.where(SavedReport.created_by == user_id)
+
+        stmt += lambda s: s.order_by(SavedReport.created_at.desc()).offset(offset)
+
         if limit is not None:
-            query = query.limit(limit)
-            
-        return query.all()
-    
+            stmt += lambda s: s.limit(limit)
+
+        return self.db.execute(stmt).scalars().all()
+
     def get_saved_report(self, report_id: str, user: Optional[User] = None) -> Optional[SavedReport]:
         """特定の保存されたレポートを取得"""
-        query = self.db.query(SavedReport).filter(SavedReport.id == report_id)
-        
+        stmt = lambda_stmt(lambda: select(SavedReport))
+        stmt += lambda s: s.where(SavedReport.id == report_id)
+
         if user:
-            query = query.filter(SavedReport.created_by == user.id)
-        
-        return query.first()
+            user_id = str(user.id)
+            stmt += lambda s: s.where(SavedReport.created_by == user_id)
+
+        return self.db.execute(stmt).scalars().first()
     
     def update_saved_report(
         self,
@@ -1,7 +1,10 @@
 import asyncio
 import aiohttp
 import feedparser
+import functools
+import itertools
 import logging
+import re
 from typing import List, Dict, Optional, Set, Union
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass
@@ -9,9 +12,67 @@ import os
 from pathlib import Path
 
 from app.services.arxiv_service import ArxivService, ArxivPaper
+from app.utils.bloom import BloomFilter
 
 logger = logging.getLogger(__name__)
 
+# RSSフィードリストファイルの既定パス
+# 開発機固有の絶対パスに依存しないよう、環境変数RSS_FEEDS_FILEで上書きできる
+# （既定はbackendディレクトリ直下のrss_feeds.txt）
+DEFAULT_RSS_PATH = Path(
+    os.getenv("RSS_FEEDS_FILE", str(Path(__file__).resolve().parents[2] / "rss_feeds.txt"))
+)
+
+# フィードURLの検証用正規表現（モジュールロード時に一度だけコンパイル）
+# スキーム直後の空白・区切り文字を弾きつつ、マッチ自体はC実装で行う
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$')
+
+
+@functools.lru_cache(maxsize=64)
+def _read_feeds_cached(file_path: str, mtime_ns: int, size: int) -> tuple:
+    """フィードリストファイルをパースしてURLタプルを返す
+
+    mtime/サイズがキーに含まれるため、ファイルが書き換わると
+    自動的にキャッシュミスとなり再パースされる
+    """
+    feeds = []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line_num, line in enumerate(f, 1):
+            line = line.strip()
+            # 空行やコメント行をスキップ
+            if not line or line.startswith('#'):
+                continue
+
+            # URLの基本的な検証
+            if _URL_RE.match(line):
+                feeds.append(line)
+            else:
+                logger.warning(f"Invalid RSS URL in {file_path} line {line_num}: {line}")
+
+    logger.info(f"Loaded {len(feeds)} RSS feed URLs from {file_path}")
+    return tuple(feeds)
+
+
+def read_rss_feeds_from_file(file_path: str) -> List[str]:
+    """テキストファイルからRSSフィードURLリストを読み込み
+
+    純粋なパース処理なのでRSSService（HTTPセッション保持）を
+    構築せずに呼び出せる。結果は (パス, mtime, サイズ) キーで
+    キャッシュされる
+    """
+    try:
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            logger.error(f"RSS feeds file not found: {file_path}")
+            return []
+
+        return list(_read_feeds_cached(file_path, st.st_mtime_ns, st.st_size))
+
+    except Exception as e:
+        logger.exception(f"Failed to read RSS feeds from file {file_path}")
+        return []
+
 
 @dataclass
 class RSSArticle:
@@ -207,77 +268,68 @@ class RSSService:
             return None
     
     async def fetch_multiple_feeds(
-        self, 
+        self,
         feed_urls: List[str],
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        concurrency: Optional[int] = None
     ) -> List[RSSFeedResult]:
-        """複数のRSSフィードを並列取得"""
-        results = []
-        
-        for i, feed_url in enumerate(feed_urls):
-            try:
-                if progress_callback:
-                    progress_callback(i, len(feed_urls), f"取得中: {feed_url}")
-                
-                result = await self.fetch_rss_feed(feed_url)
-                results.append(result)
-                
-                # レート制限（短い間隔）
-                await asyncio.sleep(1.0)
-                
-            except Exception as e:
-                logger.exception(f"Failed to fetch RSS feed {feed_url}")
-                results.append(RSSFeedResult(
-                    feed_url=feed_url,
-                    articles=[],
-                    error=str(e)
-                ))
-        
-        return results
+        """複数のRSSフィードを並列取得
+
+        セマフォで同時取得数を制限し、DNS/TCP接続の殺到や
+        イベントループの飽和を防ぐ（既定値はRSS_CONCURRENCY、デフォルト16）
+        """
+        if concurrency is None:
+            concurrency = int(os.getenv("RSS_CONCURRENCY", "16"))
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        completed = 0
+
+        async def fetch_one(feed_url: str) -> RSSFeedResult:
+            nonlocal completed
+            async with semaphore:
+                try:
+                    result = await self.fetch_rss_feed(feed_url)
+                except Exception as e:
+                    logger.exception(f"Failed to fetch RSS feed {feed_url}")
+                    result = RSSFeedResult(
+                        feed_url=feed_url,
+                        articles=[],
+                        error=str(e)
+                    )
+
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, len(feed_urls), f"取得中: {feed_url}")
+            return result
+
+        return list(await asyncio.gather(*(fetch_one(url) for url in feed_urls)))
     
     def read_rss_feeds_from_file(self, file_path: str) -> List[str]:
-        """テキストファイルからRSSフィードURLリストを読み込み"""
-        try:
-            path = Path(file_path)
-            if not path.exists():
-                logger.error(f"RSS feeds file not found: {file_path}")
-                return []
-            
-            feeds = []
-            with open(path, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    # 空行やコメント行をスキップ
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    # URLの基本的な検証
-                    if line.startswith(('http://', 'https://')):
-                        feeds.append(line)
-                    else:
-                        logger.warning(f"Invalid RSS URL in {file_path} line {line_num}: {line}")
-            
-            logger.info(f"Loaded {len(feeds)} RSS feed URLs from {file_path}")
-            return feeds
-            
-        except Exception as e:
-            logger.exception(f"Failed to read RSS feeds from file {file_path}")
-            return []
+        """テキストファイルからRSSフィードURLリストを読み込み
+
+        実体はモジュールレベルの read_rss_feeds_from_file に委譲
+        """
+        return read_rss_feeds_from_file(file_path)
     
     def extract_article_urls(self, results: List[RSSFeedResult]) -> List[str]:
-        """RSSフィード結果から記事URLリストを抽出"""
+        """RSSフィード結果から記事URLリストを抽出
+
+        重複除去にはBloomフィルタを使用し、URL文字列をすべてsetに
+        保持する場合に比べてメモリ使用量を大幅に抑える
+        """
         urls = []
-        url_set: Set[str] = set()  # 重複除去用
-        
+        expected = sum(len(result.articles) for result in results)
+        seen = BloomFilter(expected_items=max(expected, 1024))  # 重複除去用
+
         for result in results:
             if result.error:
                 logger.warning(f"Skipping failed RSS feed {result.feed_url}: {result.error}")
                 continue
-            
+
             for article in result.articles:
-                if article.url and article.url not in url_set:
+                if article.url and article.url not in seen:
                     urls.append(article.url)
-                    url_set.add(article.url)
+                    seen.add(article.url)
         
         logger.info(f"Extracted {len(urls)} unique article URLs from RSS feeds")
         return urls
@@ -357,23 +409,17 @@ class RSSService:
             # RSS フィード取得
             if progress_callback:
                 progress_callback(0, total_steps, "RSSフィードから記事を取得中...")
-            
+
             def rss_progress(current, total, message):
                 if progress_callback:
                     progress = int((current / max(total, 1)) * rss_progress_weight)
                     progress_callback(progress, total_steps, f"RSS: {message}")
-            
-            article_urls, rss_results = await self.get_latest_articles_from_file(
-                file_path, rss_progress
-            )
-            
-            arxiv_papers = []
-            
-            # arXiv論文取得
-            if include_arxiv:
+
+            async def fetch_arxiv() -> tuple[List[ArxivPaper], List[str]]:
+                """arXiv論文を取得（RSS取得と並行実行される）"""
                 if progress_callback:
-                    progress_callback(rss_progress_weight, total_steps, "arXiv論文を検索中...")
-                
+                    progress_callback(0, total_steps, "arXiv論文を検索中...")
+
                 try:
                     async with ArxivService() as arxiv_service:
                         def arxiv_progress(current, total, message):
@@ -381,7 +427,7 @@ class RSSService:
                                 base_progress = rss_progress_weight
                                 arxiv_progress = int((current / max(total, 1)) * arxiv_progress_weight)
                                 progress_callback(base_progress + arxiv_progress, total_steps, f"arXiv: {message}")
-                        
+
                         arxiv_result = await arxiv_service.search_papers(
                             categories=arxiv_categories or ['cs.AI', 'cs.LG', 'cs.CV', 'cs.CL'],
                             max_results=arxiv_max_results,
@@ -389,20 +435,39 @@ class RSSService:
                             days_back=3,  # 3日前の論文を対象
                             progress_callback=arxiv_progress
                         )
-                        
+
                         if not arxiv_result.error:
-                            arxiv_papers = arxiv_result.papers
-                            arxiv_urls = arxiv_service.papers_to_urls(arxiv_papers)
-                            article_urls.extend(arxiv_urls)
-                            
-                            logger.info(f"arXiv論文 {len(arxiv_papers)} 件を追加（対象日: {arxiv_result.target_date.date() if arxiv_result.target_date else 'N/A'}）")
+                            papers = arxiv_result.papers
+                            urls = arxiv_service.papers_to_urls(papers)
+
+                            logger.info(f"arXiv論文 {len(papers)} 件を追加（対象日: {arxiv_result.target_date.date() if arxiv_result.target_date else 'N/A'}）")
+                            return papers, urls
                         else:
                             logger.warning(f"arXiv取得エラー: {arxiv_result.error}")
-                
+
                 except Exception as e:
                     logger.exception("arXiv論文取得でエラーが発生")
                     if progress_callback:
                         progress_callback(rss_progress_weight + arxiv_progress_weight, total_steps, f"arXivエラー: {str(e)}")
+
+                return [], []
+
+            arxiv_papers = []
+
+            if include_arxiv:
+                # RSSとarXivは別ホストへのI/Oなので並行取得し、
+                # 所要時間を t_rss + t_arxiv から max(t_rss, t_arxiv) に短縮する
+                (article_urls, rss_results), (arxiv_papers, arxiv_urls) = await asyncio.gather(
+                    self.get_latest_articles_from_file(file_path, rss_progress),
+                    fetch_arxiv()
+                )
+                # RSSとarXivのURLを挿入順を保ったまま単一パスで結合・重複除去
+                # （dict.fromkeysはset→list変換と違い順序が安定する）
+                article_urls = list(dict.fromkeys(itertools.chain(article_urls, arxiv_urls)))
+            else:
+                article_urls, rss_results = await self.get_latest_articles_from_file(
+                    file_path, rss_progress
+                )
             
             if progress_callback:
                 total_items = len(article_urls)
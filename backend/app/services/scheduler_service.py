@@ -10,7 +10,7 @@ import pytz
 
 from app.core.background_tasks import task_manager
 from app.core.config import settings
-from app.services.rss_service import RSSService
+from app.services.rss_service import RSSService, DEFAULT_RSS_PATH
 from app.services.scraping_service import ScrapingService
 from app.models.user import User
 from app.models.rss_schedule import RSSSchedule
@@ -429,7 +429,7 @@ class SchedulerService:
         try:
             # デフォルトのRSSファイルパス
             if not rss_file_path:
-                rss_file_path = '/Users/tsutsuikana/Desktop/coding_workspace/news_check_app/backend/rss_feeds.txt'
+                rss_file_path = str(DEFAULT_RSS_PATH)
             
             # デフォルトのarXivカテゴリ
             if not arxiv_categories:
@@ -455,110 +455,125 @@ class SchedulerService:
             logger.exception(f"Failed to create auto schedule for user {user_id}")
             return False
 
+    # self.schedulesがRSSSchedule行のライトスルーキャッシュとして機能する:
+    # 起動時に一括ロードし、以降の読み出し（毎分のtick・GET /schedule）は
+    # メモリ参照のみ。DBを触るのは書き込み経路だけで、そのDB I/Oは同期
+    # SQLAlchemyなのでto_threadでイベントループから逃がす
+
+    def _load_schedules_sync(self) -> Dict[str, ScheduleConfig]:
+        """データベースから有効なスケジュールを読み込む（ワーカースレッドで実行）"""
+        db_gen = get_db()
+        db: Session = next(db_gen)
+        try:
+            schedules = db.query(RSSSchedule).filter(RSSSchedule.enabled == True).all()
+
+            loaded: Dict[str, ScheduleConfig] = {}
+            for db_schedule in schedules:
+                # JSONからarxiv_categoriesを復元
+                arxiv_categories = None
+                if db_schedule.arxiv_categories:
+                    try:
+                        arxiv_categories = json.loads(db_schedule.arxiv_categories)
+                    except json.JSONDecodeError:
+                        arxiv_categories = ['cs.AI', 'cs.LG', 'cs.CV']  # デフォルト
+
+                loaded[db_schedule.user_id] = ScheduleConfig(
+                    user_id=db_schedule.user_id,
+                    rss_file_path=db_schedule.rss_file_path,
+                    schedule_time=db_schedule.schedule_time,
+                    enabled=db_schedule.enabled,
+                    auto_generate_tags=db_schedule.auto_generate_tags,
+                    skip_duplicates=db_schedule.skip_duplicates,
+                    include_arxiv=db_schedule.include_arxiv,
+                    arxiv_categories=arxiv_categories,
+                    arxiv_max_results=db_schedule.arxiv_max_results
+                )
+            return loaded
+        finally:
+            db.close()
+
     async def _load_schedules_from_db(self):
         """データベースからスケジュールを読み込み"""
         try:
+            loaded = await asyncio.to_thread(self._load_schedules_sync)
+
             async with self._lock:
-                db_gen = get_db()
-                db: Session = next(db_gen)
-                try:
-                    schedules = db.query(RSSSchedule).filter(RSSSchedule.enabled == True).all()
-                    
-                    for db_schedule in schedules:
-                        # JSONからarxiv_categoriesを復元
-                        arxiv_categories = None
-                        if db_schedule.arxiv_categories:
-                            try:
-                                arxiv_categories = json.loads(db_schedule.arxiv_categories)
-                            except json.JSONDecodeError:
-                                arxiv_categories = ['cs.AI', 'cs.LG', 'cs.CV']  # デフォルト
-                        
-                        config = ScheduleConfig(
-                            user_id=db_schedule.user_id,
-                            rss_file_path=db_schedule.rss_file_path,
-                            schedule_time=db_schedule.schedule_time,
-                            enabled=db_schedule.enabled,
-                            auto_generate_tags=db_schedule.auto_generate_tags,
-                            skip_duplicates=db_schedule.skip_duplicates,
-                            include_arxiv=db_schedule.include_arxiv,
-                            arxiv_categories=arxiv_categories,
-                            arxiv_max_results=db_schedule.arxiv_max_results
-                        )
-                        
-                        self.schedules[db_schedule.user_id] = config
-                    
-                    logger.info(f"Loaded {len(schedules)} RSS schedules from database")
-                    
-                finally:
-                    db.close()
-                    
+                self.schedules.update(loaded)
+
+            logger.info(f"Loaded {len(loaded)} RSS schedules from database")
+
         except Exception as e:
             logger.exception("Failed to load schedules from database")
     
+    def _save_schedule_sync(self, config: ScheduleConfig):
+        """スケジュールをデータベースに保存/更新する（ワーカースレッドで実行）"""
+        db_gen = get_db()
+        db: Session = next(db_gen)
+        try:
+            # 既存のスケジュールを確認
+            existing = db.query(RSSSchedule).filter(RSSSchedule.user_id == config.user_id).first()
+
+            # arxiv_categoriesをJSON文字列に変換
+            arxiv_categories_json = None
+            if config.arxiv_categories:
+                arxiv_categories_json = json.dumps(config.arxiv_categories)
+
+            if existing:
+                # 更新
+                existing.rss_file_path = config.rss_file_path
+                existing.schedule_time = config.schedule_time
+                existing.enabled = config.enabled
+                existing.auto_generate_tags = config.auto_generate_tags
+                existing.skip_duplicates = config.skip_duplicates
+                existing.include_arxiv = config.include_arxiv
+                existing.arxiv_categories = arxiv_categories_json
+                existing.arxiv_max_results = config.arxiv_max_results
+            else:
+                # 新規作成
+                new_schedule = RSSSchedule(
+                    user_id=config.user_id,
+                    rss_file_path=config.rss_file_path,
+                    schedule_time=config.schedule_time,
+                    enabled=config.enabled,
+                    auto_generate_tags=config.auto_generate_tags,
+                    skip_duplicates=config.skip_duplicates,
+                    include_arxiv=config.include_arxiv,
+                    arxiv_categories=arxiv_categories_json,
+                    arxiv_max_results=config.arxiv_max_results
+                )
+                db.add(new_schedule)
+
+            db.commit()
+            logger.info(f"Saved RSS schedule for user {config.user_id} to database")
+
+        finally:
+            db.close()
+
     async def _save_schedule_to_db(self, config: ScheduleConfig):
         """スケジュールをデータベースに保存/更新"""
         try:
-            db_gen = get_db()
-            db: Session = next(db_gen)
-            try:
-                # 既存のスケジュールを確認
-                existing = db.query(RSSSchedule).filter(RSSSchedule.user_id == config.user_id).first()
-                
-                # arxiv_categoriesをJSON文字列に変換
-                arxiv_categories_json = None
-                if config.arxiv_categories:
-                    arxiv_categories_json = json.dumps(config.arxiv_categories)
-                
-                if existing:
-                    # 更新
-                    existing.rss_file_path = config.rss_file_path
-                    existing.schedule_time = config.schedule_time
-                    existing.enabled = config.enabled
-                    existing.auto_generate_tags = config.auto_generate_tags
-                    existing.skip_duplicates = config.skip_duplicates
-                    existing.include_arxiv = config.include_arxiv
-                    existing.arxiv_categories = arxiv_categories_json
-                    existing.arxiv_max_results = config.arxiv_max_results
-                else:
-                    # 新規作成
-                    new_schedule = RSSSchedule(
-                        user_id=config.user_id,
-                        rss_file_path=config.rss_file_path,
-                        schedule_time=config.schedule_time,
-                        enabled=config.enabled,
-                        auto_generate_tags=config.auto_generate_tags,
-                        skip_duplicates=config.skip_duplicates,
-                        include_arxiv=config.include_arxiv,
-                        arxiv_categories=arxiv_categories_json,
-                        arxiv_max_results=config.arxiv_max_results
-                    )
-                    db.add(new_schedule)
-                
-                db.commit()
-                logger.info(f"Saved RSS schedule for user {config.user_id} to database")
-                
-            finally:
-                db.close()
-                
+            await asyncio.to_thread(self._save_schedule_sync, config)
         except Exception as e:
             logger.exception(f"Failed to save schedule for user {config.user_id} to database")
             raise
-    
+
+    def _delete_schedule_sync(self, user_id: str):
+        """スケジュールをデータベースから削除する（ワーカースレッドで実行）"""
+        db_gen = get_db()
+        db: Session = next(db_gen)
+        try:
+            existing = db.query(RSSSchedule).filter(RSSSchedule.user_id == user_id).first()
+            if existing:
+                db.delete(existing)
+                db.commit()
+                logger.info(f"Deleted RSS schedule for user {user_id} from database")
+        finally:
+            db.close()
+
     async def _delete_schedule_from_db(self, user_id: str):
         """データベースからスケジュールを削除"""
         try:
-            db_gen = get_db()
-            db: Session = next(db_gen)
-            try:
-                existing = db.query(RSSSchedule).filter(RSSSchedule.user_id == user_id).first()
-                if existing:
-                    db.delete(existing)
-                    db.commit()
-                    logger.info(f"Deleted RSS schedule for user {user_id} from database")
-                    
-            finally:
-                db.close()
-                
+            await asyncio.to_thread(self._delete_schedule_sync, user_id)
         except Exception as e:
             logger.exception(f"Failed to delete schedule for user {user_id} from database")
             raise
@@ -8,12 +8,36 @@ from app.models.scraping_job import ScrapingJob
 from app.models.article import Article
 from app.models.user import User
 from app.utils.web_scraper import WebScraper, ScrapedContent
-from app.utils.url_parser import URLParser
+from app.utils.url_parser import URLParser, URLParseResult, url_key
 from app.core.background_tasks import task_manager, TaskStatus
+from app.core.config import settings
+from app.core.url_bloom import url_bloom
 from app.services.article_integration_service import ArticleIntegrationService
 
 logger = logging.getLogger(__name__)
 
+
+def find_existing_url_keys(db: Session, urls: List[str], batch_size: int = 500) -> Set[int]:
+    """候補URLのうちDBに登録済みのもののurl_keyを返す
+
+    全記事URLをメモリに展開する代わりに、候補URLだけをINクエリで
+    照合する。記事数に依存せず、転送量も候補数に比例するだけで済む。
+    候補が多い場合はバインドパラメータ数の上限を超えないよう分割する
+    """
+    # Bloomフィルタで「確実に未登録」の候補を先に除外し、DB照合を
+    # 「登録済みかもしれない」候補だけに絞る（大半の新規URLはここで確定する）
+    candidates = [u for u in urls if url_bloom.maybe_contains(u)]
+
+    keys: Set[int] = set()
+    for i in range(0, len(candidates), batch_size):
+        batch = candidates[i:i + batch_size]
+        keys.update(
+            url_key(row.url)
+            for row in db.query(Article.url).filter(Article.url.in_(batch)).all()
+        )
+    return keys
+
+
 class ScrapingService:
     """スクレイピングサービス"""
     
@@ -25,12 +49,18 @@ class ScrapingService:
         user: User,
         urls_text: str,
         auto_generate_tags: bool = True,
-        skip_duplicates: bool = True
+        skip_duplicates: bool = True,
+        parse_result: Optional[URLParseResult] = None
     ) -> ScrapingJob:
-        """スクレイピングジョブを作成・開始"""
-        
+        """スクレイピングジョブを作成・開始
+
+        parse_resultを渡すと解析をスキップする（呼び出し元がレスポンス用に
+        解析済みの場合、大きなURLリストの正規表現処理を二重に行わずに済む）
+        """
+
         # URL解析
-        parse_result = URLParser.parse_urls_from_text(urls_text)
+        if parse_result is None:
+            parse_result = URLParser.parse_urls_from_text(urls_text)
         
         if not parse_result.valid_urls:
             raise ValueError("有効なURLが見つかりません")
@@ -40,11 +70,9 @@ class ScrapingService:
         # 重複チェック
         duplicate_urls = []
         if skip_duplicates:
-            existing_urls: Set[str] = set(
-                row.url for row in self.db.query(Article.url).all()
-            )
+            existing_keys = find_existing_url_keys(self.db, parse_result.valid_urls)
             target_urls, duplicate_urls = URLParser.check_duplicates_with_existing(
-                parse_result.valid_urls, existing_urls
+                parse_result.valid_urls, existing_keys
             )
             
             if not target_urls:
@@ -54,8 +82,8 @@ class ScrapingService:
         job = ScrapingJob(
             user_id=user.id,
             urls=target_urls,
-            auto_generate_tags_bool=auto_generate_tags,
-            skip_duplicates_bool=skip_duplicates,
+            auto_generate_tags=auto_generate_tags,
+            skip_duplicates=skip_duplicates,
             total=len(target_urls),
             status="pending",
             skipped_urls=duplicate_urls  # スキップされたURLを保存
@@ -66,15 +94,21 @@ class ScrapingService:
         self.db.refresh(job)
         
         # バックグラウンドタスクとして実行
-        task_id = await task_manager.create_task(
-            self._execute_scraping_job_task,
-            str(job.id),
-            task_id=str(job.id),
-            total=len(target_urls),
-            message=f"スクレイピング開始: {len(target_urls)}件のURL"
-        )
-        
-        logger.info(f"Created scraping job {job.id} as background task {task_id}")
+        if settings.SCRAPING_TASK_QUEUE_ENABLED:
+            # 外部ワーカーへ委譲（APIプロセスのイベントループを塞がない）
+            from app.workers.scraping import enqueue_scraping_job
+            await enqueue_scraping_job(str(job.id))
+            logger.info(f"Created scraping job {job.id} and enqueued to worker queue")
+        else:
+            task_id = await task_manager.create_task(
+                self._execute_scraping_job_task,
+                str(job.id),
+                task_id=str(job.id),
+                total=len(target_urls),
+                message=f"スクレイピング開始: {len(target_urls)}件のURL"
+            )
+            logger.info(f"Created scraping job {job.id} as background task {task_id}")
+
         return job
     
     async def _execute_scraping_job_task(self, job_id: str, progress_callback=None):
@@ -283,7 +317,7 @@ class ScrapingService:
             
             # タグの準備
             tags = []
-            if job.auto_generate_tags_bool and content.auto_tags:
+            if job.auto_generate_tags and content.auto_tags:
                 tags.extend(content.auto_tags)
             if content.keywords:
                 tags.extend(content.keywords)
@@ -307,6 +341,7 @@ class ScrapingService:
             db.add(article)
             db.commit()
             db.refresh(article)
+            url_bloom.add(article.url)
             
             logger.info(f"Created article {article.id} from {content.url}")
             return article.id
@@ -335,7 +370,7 @@ class ScrapingService:
                     """プログレス更新コールバック"""
                     job.progress = current
                     if result.error:
-                        job.failed_urls.append(f"{url}: {result.error}")
+                        job.failed_urls.append({"url": url, "error": result.error})
                     else:
                         job.completed_urls.append(url)
                     self.db.commit()
@@ -356,7 +391,7 @@ class ScrapingService:
                             created_article_ids.append(str(article_id))
                     except Exception as e:
                         logger.exception(f"Failed to save article for {result.url}")
-                        job.failed_urls.append(f"{result.url}: Failed to save - {str(e)}")
+                        job.failed_urls.append({"url": result.url, "error": f"Failed to save - {str(e)}"})
             
             # ジョブ完了
             job.status = "completed"
@@ -386,7 +421,7 @@ class ScrapingService:
             
             # タグの準備
             tags = []
-            if job.auto_generate_tags_bool and content.auto_tags:
+            if job.auto_generate_tags and content.auto_tags:
                 tags.extend(content.auto_tags)
             if content.keywords:
                 tags.extend(content.keywords)
@@ -410,6 +445,7 @@ class ScrapingService:
             self.db.add(article)
             self.db.commit()
             self.db.refresh(article)
+            url_bloom.add(article.url)
             
             logger.info(f"Created article {article.id} from {content.url}")
             return article.id
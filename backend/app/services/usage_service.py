@@ -4,7 +4,6 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func
 from app.models.usage_log import UsageLog
 from app.models.user import User
-import json
 
 class UsageService:
     """使用状況管理サービス"""
@@ -29,7 +28,7 @@ class UsageService:
             action_type=action_type,
             usage_date=date.today(),
             resource_used=resource_used,
-            additional_data=json.dumps(additional_data) if additional_data else None,
+            additional_data=additional_data or None,
             created_at=datetime.utcnow()
         )
         
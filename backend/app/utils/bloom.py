@@ -0,0 +1,39 @@
+import math
+import hashlib
+
+
+class BloomFilter:
+    """省メモリな確率的集合（Bloomフィルタ）
+
+    大量のURL重複チェックをPythonのset[str]（1件あたり約150バイト）の
+    代わりに、1件あたり数十ビットのビット配列で行う。
+    偽陽性（未登録のものを「登録済み」と誤判定）は指定した確率で起こり得るが、
+    偽陰性は起こらない。
+    """
+
+    def __init__(self, expected_items: int, false_positive_rate: float = 1e-4):
+        n = max(1, expected_items)
+        # 最適ビット数: m = -n * ln(p) / (ln2)^2
+        m = int(-n * math.log(false_positive_rate) / (math.log(2) ** 2))
+        self.size = max(64, m)
+        # 最適ハッシュ回数: k = (m / n) * ln2
+        self.num_hashes = max(1, round((self.size / n) * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        """ダブルハッシング法でk個のビット位置を生成"""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7))
+            for pos in self._positions(item)
+        )
@@ -0,0 +1,20 @@
+import time
+from datetime import datetime, timezone
+
+
+def utc_now() -> datetime:
+    """タイムゾーン付きの現在UTC時刻を返す
+
+    datetime.utcnow() はPython 3.12で非推奨のため、こちらを使用する
+    """
+    return datetime.now(timezone.utc)
+
+
+def compact_ts() -> str:
+    """ファイル名用のコンパクトなタイムスタンプ（YYYYMMDD_HHMMSS形式）を返す
+
+    datetime.now().strftime() よりも軽量で、エクスポートファイル名の
+    生成などのホットパスで使用する
+    """
+    t = time.localtime()
+    return f"{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}_{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}"
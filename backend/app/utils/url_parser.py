@@ -1,4 +1,5 @@
 import re
+import hashlib
 import urllib.parse
 from typing import List, Set, Tuple, Dict
 from dataclasses import dataclass
@@ -7,6 +8,22 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Markdown箇条書きの接頭辞除去用（呼び出しごとの再コンパイルを避けるため
+# モジュールロード時に一度だけコンパイルする）
+_BULLET_PREFIX_RE = re.compile(r'^[-*+]\s*')
+
+
+def url_key(url: str) -> int:
+    """URLの16バイトダイジェストをint化した重複チェック用キーを返す
+
+    大量のURL集合をset[str]で持つと1件あたり100バイト超を消費し、
+    比較もバイト単位のO(len)になる。blake2bダイジェストのint表現なら
+    メモリはset[int]分だけで済み、比較も一度の整数比較になる。
+    """
+    return int.from_bytes(
+        hashlib.blake2b(url.encode('utf-8'), digest_size=16).digest(), 'little'
+    )
+
 @dataclass
 class URLParseResult:
     """URLパース結果"""
@@ -113,7 +130,7 @@ class URLParser:
         # パターンマッチしない場合、行全体がURLかチェック
         if not urls:
             # Markdown箇条書きの場合（- や * で始まる）
-            cleaned_line = re.sub(r'^[-*+]\s*', '', line.strip())
+            cleaned_line = _BULLET_PREFIX_RE.sub('', line.strip())
             if URLParser._is_valid_url_format(cleaned_line):
                 urls.append(cleaned_line)
             # 行全体がURLの場合
@@ -198,22 +215,22 @@ class URLParser:
             return None
     
     @staticmethod
-    def check_duplicates_with_existing(urls: List[str], existing_urls: Set[str]) -> Tuple[List[str], List[str]]:
+    def check_duplicates_with_existing(urls: List[str], existing_keys: Set[int]) -> Tuple[List[str], List[str]]:
         """
         既存URLとの重複チェック
-        
+
         Args:
             urls: チェック対象のURL一覧
-            existing_urls: 既存のURL一覧
-            
+            existing_keys: 既存URLのurl_key()一覧
+
         Returns:
             Tuple[新規URL一覧, 重複URL一覧]
         """
         new_urls = []
         duplicate_urls = []
-        
+
         for url in urls:
-            if url in existing_urls:
+            if url_key(url) in existing_keys:
                 duplicate_urls.append(url)
             else:
                 new_urls.append(url)
@@ -11,6 +11,48 @@ import time
 
 logger = logging.getLogger(__name__)
 
+# User-Agent設定（全スクレイパー共通）
+_DEFAULT_HEADERS = {
+    'User-Agent': 'ITNewsManager/1.0 (Educational Purpose; +https://github.com/example/news-manager)',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ja,en-US;q=0.7,en;q=0.3',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+# プロセス内で共有するHTTPセッション
+# WebScraperのインスタンス（＝リクエスト）ごとにセッションを作り直すと
+# 毎回TCP/TLSハンドシェイクを払うため、接続プールを1つに集約して
+# keep-alive接続を使い回す
+_shared_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_shared_session() -> aiohttp.ClientSession:
+    """共有ClientSessionを取得（初回アクセス時に生成）"""
+    global _shared_session
+    if _shared_session is None or _shared_session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=100,  # プロセス全体の総接続数
+            limit_per_host=10,  # 同一ホストへの集中を防ぐ
+            keepalive_timeout=30,  # キープアライブタイムアウト
+            enable_cleanup_closed=True  # 閉じられた接続の自動クリーンアップ
+        )
+        _shared_session = aiohttp.ClientSession(
+            connector=connector,
+            headers=_DEFAULT_HEADERS
+        )
+    return _shared_session
+
+
+async def close_shared_session() -> None:
+    """共有セッションを閉じる（アプリ終了時にlifespanから呼ぶ）"""
+    global _shared_session
+    if _shared_session is not None and not _shared_session.closed:
+        await _shared_session.close()
+    _shared_session = None
+
+
 @dataclass
 class ScrapedContent:
     """スクレイピング結果"""
@@ -44,38 +86,25 @@ class WebScraper:
         self.max_content_length = max_content_length
         self.session = None
         self.domain_last_request = {}  # ドメイン毎の最後のリクエスト時刻
-        
-        # User-Agent設定
-        self.headers = {
-            'User-Agent': 'ITNewsManager/1.0 (Educational Purpose; +https://github.com/example/news-manager)',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'ja,en-US;q=0.7,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-    
+
+        # タイムアウトはセッションではなくリクエスト単位で指定する
+        # （共有セッションを使うため、インスタンスごとの設定を保てる）
+        self._request_timeout = aiohttp.ClientTimeout(total=timeout)
+        self.headers = _DEFAULT_HEADERS
+
     async def __aenter__(self):
-        """非同期コンテキストマネージャー開始"""
-        connector = aiohttp.TCPConnector(
-            limit=5,  # 総接続数を5に制限
-            limit_per_host=1,  # ホスト毎の接続数を1に制限
-            keepalive_timeout=30,  # キープアライブタイムアウト
-            enable_cleanup_closed=True  # 閉じられた接続の自動クリーンアップ
-        )
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
-        self.session = aiohttp.ClientSession(
-            connector=connector,
-            timeout=timeout,
-            headers=self.headers
-        )
+        """非同期コンテキストマネージャー開始（共有セッションを利用）"""
+        self.session = await get_shared_session()
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """非同期コンテキストマネージャー終了"""
-        if self.session:
-            await self.session.close()
-    
+        """非同期コンテキストマネージャー終了
+
+        セッションはプロセス内で共有しているため、ここでは閉じない
+        （接続はkeep-aliveのままプールへ返却される）
+        """
+        self.session = None
+
     async def scrape_url(self, url: str) -> ScrapedContent:
         """単一URLのスクレイピング"""
         try:
@@ -83,7 +112,9 @@ class WebScraper:
             await self._apply_rate_limit(url)
             
             # HTTPリクエスト実行
-            async with self.session.get(url, allow_redirects=True) as response:
+            async with self.session.get(
+                url, allow_redirects=True, timeout=self._request_timeout
+            ) as response:
                 # レスポンスチェック
                 if response.status != 200:
                     return ScrapedContent(
@@ -0,0 +1,53 @@
+"""スクレイピング実行用のarqワーカー
+
+APIプロセス内でスクレイピングを回すと、遅延の大きい取得処理が
+リクエストハンドラとイベントループの時間を奪い合い、水平スケールも
+できない。SCRAPING_TASK_QUEUE_ENABLED を有効にすると
+/api/scrape/start はジョブをRedisキューへ積むだけで即応答し、
+実行は本モジュールのワーカーが担う。進捗はジョブ行に書き込まれる
+ため、ステータスAPIは既存のDBフォールバックでそのまま応答できる。
+
+ワーカーの起動方法:
+    arq app.workers.scraping.WorkerSettings
+"""
+import logging
+
+from arq.connections import RedisSettings
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# enqueue用の接続プール（初回に生成してプロセス内で再利用）
+_pool = None
+
+
+async def run_scraping_job(ctx, job_id: str):
+    """キューから受け取ったスクレイピングジョブを実行する"""
+    from app.db.database import SessionLocal
+    from app.services.scraping_service import ScrapingService
+
+    db = SessionLocal()
+    try:
+        service = ScrapingService(db)
+        await service._execute_scraping_job_task(job_id)
+    finally:
+        db.close()
+
+
+async def enqueue_scraping_job(job_id: str) -> None:
+    """ジョブIDをワーカーキューへ投入する"""
+    global _pool
+    if _pool is None:
+        from arq import create_pool
+        _pool = await create_pool(RedisSettings.from_dsn(settings.REDIS_URL))
+    await _pool.enqueue_job("run_scraping_job", job_id)
+    logger.info(f"Enqueued scraping job {job_id}")
+
+
+class WorkerSettings:
+    """arqワーカー設定（`arq app.workers.scraping.WorkerSettings` で起動）"""
+    functions = [run_scraping_job]
+    redis_settings = RedisSettings.from_dsn(settings.REDIS_URL)
+    max_jobs = 4
+    job_timeout = 3600
@@ -73,7 +73,7 @@ async def validate_token():
     return {"valid": True, "user_id": "test-user-id"}
 
 # URLパーサーとWebスクレイパーを追加
-from app.utils.url_parser import URLParser
+from app.utils.url_parser import URLParser, url_key
 from app.utils.web_scraper import WebScraper
 
 # スクレイピング関連のエンドポイント
@@ -95,13 +95,13 @@ async def parse_urls(request: dict):
     parse_result = URLParser.parse_urls_from_text(urls_text)
     
     # 既存記事との重複チェック（ダミーデータ）
-    existing_urls = {
-        "https://example.com/existing1",
-        "https://blog.example.com/existing2"
+    existing_keys = {
+        url_key("https://example.com/existing1"),
+        url_key("https://blog.example.com/existing2")
     }
-    
+
     new_urls, duplicate_urls = URLParser.check_duplicates_with_existing(
-        parse_result.valid_urls, existing_urls
+        parse_result.valid_urls, existing_keys
     )
     
     return {
@@ -26,11 +26,17 @@ export interface UsageLog {
   created_at: string
 }
 
+export interface UsageDailySummary {
+  usage_date: string
+  action_type: string
+  count: number
+}
+
 export interface UsageHistory {
   user_id: string
   period_days: number
   total_logs: number
-  logs: UsageLog[]
+  daily_summary: UsageDailySummary[]
 }
 
 export const usageApi = {